@@ -1,11 +1,19 @@
+import time
+
 import streamlit as st
 
 # -------------------------------
 # 서비스 계층
 # -------------------------------
-from service.sheets import get_spreadsheet
-from service.market_data import get_usdkrw, get_jpykrw, get_kr_price, get_us_price
+from service.sheets import get_spreadsheet, refresh_sheets, mirror_fallback_since
+from service.market_data import get_kr_prices, get_us_prices
+from service.fx import get_usdkrw, get_jpykrw
 from service.crypto_data import get_crypto_prices
+from service.market_gateway import fetch_price_snapshot
+from service.refresher import start_price_refresher
+from service.warmup import start_warmup
+from service.circuit import open_providers
+from ui.components import price_override_editor, warmup_status
 
 # -------------------------------
 # 자산 테이블
@@ -52,6 +60,14 @@ st.set_page_config(page_title="Finance Dashboard", layout="wide")
 st.title("📊 Finance Dashboard")
 
 spreadsheet = get_spreadsheet()
+warmup = start_warmup(spreadsheet)
+start_price_refresher(spreadsheet)
+
+# 서버 시작 직후에는 예열(시트 전체·시세 선조회)이 끝날 때까지 준비 상태 표시
+if not warmup.ready:
+    warmup_status(warmup)
+elif warmup.failures:
+    st.sidebar.caption(f"⚠ 시작 시 캐시 예열 일부 실패 — 요청 시 조회 ({', '.join(warmup.failures)})")
 
 # =========================================================
 # 세션 상태 초기화
@@ -168,30 +184,46 @@ elif section == "Chart":
 # 데이터 새로고침
 # -------------------------------
 st.sidebar.markdown("---")
-if st.sidebar.button("🔄 데이터 새로고침", help="Google Sheets 캐시(5분)를 즉시 초기화합니다."):
+if st.sidebar.button("🔄 데이터 새로고침", help="Google Sheets 캐시를 즉시 초기화합니다. (시트 수정은 10초 안에 자동 반영)"):
+    refresh_sheets(spreadsheet)
     st.cache_data.clear()
     st.rerun()
 
+_mirror_at = mirror_fallback_since(spreadsheet)
+if _mirror_at:
+    st.sidebar.warning(
+        f"⚠ Google Sheets 응답 없음 — {time.strftime('%m-%d %H:%M', time.localtime(_mirror_at))} 저장본으로 표시 중"
+    )
+
+_down = open_providers()
+if _down:
+    st.sidebar.warning(f"⚠ {', '.join(_down)} 응답 없음 — 마지막 저장 시세로 표시 중")
+
 # -------------------------------
-# 금 수동 입력 옵션
+# 수동 시세 (금현물·비상장·상장폐지 종목)
 # -------------------------------
 st.sidebar.markdown("---")
-st.sidebar.markdown("### 🟡 금 보정 옵션")
-gold_override = st.sidebar.number_input(
-    "국내 금 시세 수동 입력 (원/g)\n0 입력 시 국제 금 환산값 사용",
-    min_value=0,
-    step=1000,
-    value=0,
-)
+st.sidebar.markdown("### ✏️ 수동 시세")
+with st.sidebar.expander("가격 직접 입력 (금현물은 국내 · GOLD)"):
+    price_override_editor()
+
+# =========================================================
+# 시세 스냅샷 — 종합 화면은 모든 제공자를 쓰므로 렌더 전에 병렬로 한 번 조회하고,
+# 평가·피벗·차트는 모두 이 스냅샷 하나로 계산
+# =========================================================
+price_snapshot = None
+if page in ("종합", "자산 추이", "종합 차트"):
+    with st.spinner("시세 데이터 조회 중..."):
+        price_snapshot = fetch_price_snapshot(spreadsheet)
 
 # =========================================================
 # 라우팅 — 자산 테이블
 # =========================================================
 if page == "국내 투자자산":
-    domestic_table(spreadsheet, get_kr_price, gold_override)
+    domestic_table(spreadsheet, get_kr_prices)
 
 elif page == "해외 투자자산":
-    overseas_table(spreadsheet, get_usdkrw, get_us_price, get_jpykrw)
+    overseas_table(spreadsheet, get_usdkrw, get_us_prices, get_jpykrw)
 
 elif page == "가상자산":
     crypto_table(spreadsheet, get_usdkrw, get_crypto_prices)
@@ -209,10 +241,10 @@ elif page == "부채":
     debt_table(spreadsheet, get_usdkrw)
 
 elif page == "종합":
-    total_table(spreadsheet, get_usdkrw, get_kr_price, get_us_price, get_crypto_prices, gold_override, get_jpykrw)
+    total_table(spreadsheet, price_snapshot)
 
 elif page == "자산 추이":
-    trend_table(spreadsheet, get_usdkrw, get_kr_price, get_us_price, get_crypto_prices, gold_override, get_jpykrw)
+    trend_table(spreadsheet, price_snapshot)
 
 # =========================================================
 # 라우팅 — 배당 테이블
@@ -227,10 +259,10 @@ elif page == "해외 배당":
 # 라우팅 — 자산 차트
 # =========================================================
 elif page == "국내 투자자산 차트":
-    domestic_chart(spreadsheet, get_kr_price, gold_override)
+    domestic_chart(spreadsheet, get_kr_prices)
 
 elif page == "해외 투자자산 차트":
-    overseas_chart(spreadsheet, get_usdkrw, get_us_price, get_jpykrw)
+    overseas_chart(spreadsheet, get_us_prices)
 
 elif page == "가상자산 차트":
     crypto_chart(spreadsheet, get_usdkrw, get_crypto_prices)
@@ -248,7 +280,7 @@ elif page == "부채 차트":
     debt_chart(spreadsheet, get_usdkrw)
 
 elif page == "종합 차트":
-    total_chart(spreadsheet, get_usdkrw, get_kr_price, get_us_price, get_crypto_prices, gold_override, get_jpykrw)
+    total_chart(spreadsheet, price_snapshot)
 
 elif page == "자산 추이 차트":
     trend_chart(spreadsheet)
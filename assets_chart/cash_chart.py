@@ -5,6 +5,7 @@ from ui.components import exchange_rate_header
 from ui.formatters import fmt_num, apply_krw_hover
 from config import SHEET_NAMES
 from service.sheets import load_sheet_data
+from service.fx import convert, cash_currencies
 
 
 def render(spreadsheet, get_usdkrw):
@@ -18,10 +19,8 @@ def render(spreadsheet, get_usdkrw):
 
     df = pd.DataFrame(rows[1:], columns=rows[0]).rename(columns=lambda x: x.strip())
     df["금액"] = pd.to_numeric(df["금액"].astype(str).str.replace(",", ""), errors="coerce").fillna(0)
-    df["통화"] = df["통화"].astype(str).str.strip().str.upper()
-    df["금액(KRW)"] = df.apply(
-        lambda r: r["금액"] if r["통화"] == "KRW" else (r["금액"] * usdkrw if usdkrw else 0), axis=1
-    )
+    df["통화"] = cash_currencies(df["통화"])
+    df["금액(KRW)"] = convert(df["금액"], df["통화"]).fillna(0)
 
     total_cash = df["금액(KRW)"].sum()
     st.markdown(f"""
@@ -6,6 +6,8 @@ from ui.components import exchange_rate_header
 from ui.formatters import fmt_num, fmt_pct, apply_krw_hover
 from config import SHEET_NAMES
 from service.sheets import load_sheet_data
+from service.crypto_data import coingecko_throttled
+from service.fx import convert
 
 
 def render(spreadsheet, get_usdkrw, get_crypto_prices):
@@ -23,10 +25,10 @@ def render(spreadsheet, get_usdkrw, get_crypto_prices):
     all_ids = df["coingecko_id"].dropna().unique().tolist()
     price_map = get_crypto_prices(tuple(all_ids))
     if price_map is None:
-        st.warning("⚠ CoinGecko 호출 제한 발생 — 이전 가격 사용")
-        price_map = st.session_state.get("last_crypto_prices", {})
-    else:
-        st.session_state["last_crypto_prices"] = price_map
+        st.warning("⚠ CoinGecko 호출 제한 발생 — 저장된 시세 없음")
+        price_map = {}
+    elif coingecko_throttled():
+        st.info("CoinGecko 호출 한도 도달 — 마지막 정상 시세로 표시 중")
 
     def get_price(row):
         info = price_map.get(row["coingecko_id"], {})
@@ -34,13 +36,9 @@ def render(spreadsheet, get_usdkrw, get_crypto_prices):
 
     df["현재가"] = df.apply(get_price, axis=1)
     df["매입총액"] = df["수량(qty)"] * df["평균매수가(avg_price)"]
-    df["매입총액(KRW)"] = df.apply(
-        lambda r: r["매입총액"] if r["통화"] == "KRW" else (r["매입총액"] * usdkrw if usdkrw else float("nan")), axis=1
-    )
+    df["매입총액(KRW)"] = convert(df["매입총액"], df["통화"])
     df["평가총액"] = df["수량(qty)"] * df["현재가"]
-    df["평가총액(KRW)"] = df.apply(
-        lambda r: r["평가총액"] if r["통화"] == "KRW" else (r["평가총액"] * usdkrw if usdkrw else float("nan")), axis=1
-    )
+    df["평가총액(KRW)"] = convert(df["평가총액"], df["통화"])
     df["수익률(%)"] = (df["평가총액(KRW)"] / df["매입총액(KRW)"] - 1) * 100
 
     df_valid = df.dropna(subset=["평가총액(KRW)"])
@@ -8,7 +8,7 @@ from config import SHEET_NAMES
 from service.sheets import load_sheet_data
 
 
-def render(spreadsheet, get_kr_price, gold_override):
+def render(spreadsheet, get_kr_prices):
     col_t, col_b = st.columns([5, 1])
     with col_t:
         st.subheader("📊 국내 투자자산 차트")
@@ -33,10 +33,11 @@ def render(spreadsheet, get_kr_price, gold_override):
     df["종목코드"] = df["종목코드"].astype(str).str.zfill(6)
     df["보유수량"] = pd.to_numeric(df["보유수량"].astype(str).str.replace(",", ""), errors="coerce")
     df["매수단가"] = pd.to_numeric(df["매수단가"].astype(str).str.replace(",", ""), errors="coerce")
-    df = df.dropna(subset=["보유수량", "매수단가"]).reset_index(drop=True)
 
     with st.spinner("Yahoo Finance에서 현재가 조회 중..."):
-        df["현재가"] = [get_kr_price(t, n, gold_override) for t, n in zip(df["종목코드"], df["종목명"])]
+        df["현재가"] = get_kr_prices(df["종목코드"], df["종목명"])
+
+    df = df.dropna(subset=["보유수량", "매수단가"]).reset_index(drop=True)
 
     df["매입총액"] = df["보유수량"] * df["매수단가"]
     df["평가총액"] = df["보유수량"] * df["현재가"]
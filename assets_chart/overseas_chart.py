@@ -6,19 +6,16 @@ from ui.formatters import fmt_num, fmt_pct, apply_krw_hover
 from ui.navigation import to_table_button
 from config import SHEET_NAMES
 from service.sheets import load_sheet_data
+from service.fx import rate_series
 
 
-def render(spreadsheet, get_usdkrw, get_us_price, get_jpykrw):
+def render(spreadsheet, get_us_prices):
     col_t, col_b = st.columns([5, 1])
     with col_t:
         st.subheader("📊 해외 투자자산 차트")
     with col_b:
         to_table_button("해외 투자자산")
 
-    usdkrw = get_usdkrw()
-    jpykrw = get_jpykrw()
-    rate_map = {"USD": usdkrw, "JPY": jpykrw}
-
     # ── 데이터 로드 ───────────────────────────────────────
     rows = load_sheet_data(spreadsheet, SHEET_NAMES["overseas"])
     if not rows or len(rows) < 2:
@@ -37,13 +34,14 @@ def render(spreadsheet, get_usdkrw, get_us_price, get_jpykrw):
     df["보유수량"] = pd.to_numeric(df["보유수량"].astype(str).str.replace(",", ""), errors="coerce")
     df["매수단가"] = pd.to_numeric(df["매수단가"].astype(str).str.replace(",", ""), errors="coerce")
     df["매입환율"] = pd.to_numeric(df["매입환율"].astype(str).str.replace(",", ""), errors="coerce")
-    df = df.dropna(subset=["보유수량", "매수단가"]).reset_index(drop=True)
-
-    df["현재환율"] = df["화폐"].str.upper().str.strip().map(rate_map)
-    df["매입총액(KRW)"] = df["보유수량"] * df["매수단가"] * df["매입환율"]
 
     with st.spinner("Yahoo Finance에서 현재가 조회 중..."):
-        df["현재가"] = df["종목티커"].apply(get_us_price)
+        prices, currencies = get_us_prices(df["종목티커"])
+    df["현재가"] = prices
+    df["현재환율"] = rate_series(pd.Series(currencies, index=df.index).fillna(df["화폐"]))
+
+    df = df.dropna(subset=["보유수량", "매수단가"]).reset_index(drop=True)
+    df["매입총액(KRW)"] = df["보유수량"] * df["매수단가"] * df["매입환율"]
 
     df["평가총액(KRW)"] = df["보유수량"] * df["현재가"] * df["현재환율"]
     df["수익률(%)"] = (df["평가총액(KRW)"] / df["매입총액(KRW)"] - 1) * 100
@@ -4,15 +4,10 @@ import plotly.express as px
 import plotly.graph_objects as go
 from ui.formatters import fmt_num, fmt_pct, korean_yaxis, apply_krw_hover
 from ui.navigation import to_table_button
-from assets_table.total import (
-    _sum_domestic, _sum_overseas, _sum_crypto,
-    _sum_cash, _sum_property, _sum_etc, _sum_debt,
-    _byowner_domestic, _byowner_overseas, _byowner_crypto,
-    _byowner_cash, _byowner_property, _byowner_etc, _byowner_debt,
-)
+from assets_table.total import valuation
 
 
-def render(spreadsheet, get_usdkrw, get_kr_price, get_us_price, get_crypto_prices, gold_override, get_jpykrw):
+def render(spreadsheet, snapshot):
     col_t, col_b = st.columns([5, 1])
     with col_t:
         st.subheader("📊 종합 자산 차트")
@@ -20,13 +15,16 @@ def render(spreadsheet, get_usdkrw, get_kr_price, get_us_price, get_crypto_price
         to_table_button("종합")
 
     with st.spinner("전체 자산 데이터 로딩 중..."):
-        dom_buy,  dom_eval  = _sum_domestic(spreadsheet, get_kr_price, gold_override)
-        ovs_buy,  ovs_eval  = _sum_overseas(spreadsheet, get_usdkrw, get_us_price, get_jpykrw)
-        cry_buy,  cry_eval  = _sum_crypto(spreadsheet, get_usdkrw, get_crypto_prices)
-        cash_buy, cash_eval = _sum_cash(spreadsheet, get_usdkrw)
-        prop_buy, prop_eval = _sum_property(spreadsheet)
-        etc_buy,  etc_eval  = _sum_etc(spreadsheet)
-        debt_total          = _sum_debt(spreadsheet)
+        val = valuation(spreadsheet, snapshot)
+
+    sums = val["sum"]
+    dom_buy,  dom_eval  = sums["domestic"]
+    ovs_buy,  ovs_eval  = sums["overseas"]
+    cry_buy,  cry_eval  = sums["crypto"]
+    cash_buy, cash_eval = sums["cash"]
+    prop_buy, prop_eval = sums["property"]
+    etc_buy,  etc_eval  = sums["etc"]
+    debt_total          = sums["debt"]
 
     categories  = ["국내 투자자산", "해외 투자자산", "가상자산", "현금성자산", "부동산자산", "기타자산"]
     buy_values  = [dom_buy,  ovs_buy,  cry_buy,  cash_buy,  prop_buy,  etc_buy]
@@ -112,14 +110,14 @@ def render(spreadsheet, get_usdkrw, get_kr_price, get_us_price, get_crypto_price
     st.plotly_chart(fig4, width="stretch")
 
     # ── 차트 5 & 6: 소유자별 ────────────────────────────────
-    with st.spinner("소유자별 데이터 로딩 중..."):
-        dom_eval_by,  _ = _byowner_domestic(spreadsheet, get_kr_price, gold_override)
-        ovs_eval_by,  _ = _byowner_overseas(spreadsheet, get_usdkrw, get_us_price, get_jpykrw)
-        cry_eval_by,  _ = _byowner_crypto(spreadsheet, get_usdkrw, get_crypto_prices)
-        cash_eval_by, _ = _byowner_cash(spreadsheet, get_usdkrw)
-        prop_eval_by, _ = _byowner_property(spreadsheet)
-        etc_eval_by,  _ = _byowner_etc(spreadsheet)
-        debt_by         = _byowner_debt(spreadsheet)
+    by = val["byowner"]
+    dom_eval_by,  _ = by["domestic"]
+    ovs_eval_by,  _ = by["overseas"]
+    cry_eval_by,  _ = by["crypto"]
+    cash_eval_by, _ = by["cash"]
+    prop_eval_by, _ = by["property"]
+    etc_eval_by,  _ = by["etc"]
+    debt_by         = by["debt"]
 
     asset_labels = ["국내 투자자산", "해외 투자자산", "가상자산", "현금성자산", "부동산자산", "기타자산"]
     eval_dicts   = [dom_eval_by, ovs_eval_by, cry_eval_by, cash_eval_by, prop_eval_by, etc_eval_by]
@@ -1,21 +1,19 @@
 import streamlit as st
 import pandas as pd
 import plotly.express as px
-import gspread
 from ui.formatters import apply_krw_hover
 from config import SHEET_NAMES
+from service.sheets import has_worksheet, load_sheet_data
 
 
 def render(spreadsheet):
     st.subheader("📊 종합 자산 추이 차트")
 
-    try:
-        sheet = spreadsheet.worksheet(SHEET_NAMES["trend"])
-    except gspread.exceptions.WorksheetNotFound:
+    if not has_worksheet(spreadsheet, SHEET_NAMES["trend"]):
         st.info("'자산추이' 시트가 아직 없습니다. 테이블 메뉴의 '추이' 화면에서 시트 구성 가이드를 확인하세요.")
         return
 
-    rows = sheet.get_all_values()
+    rows = load_sheet_data(spreadsheet, SHEET_NAMES["trend"])
     if not rows or len(rows) < 2:
         st.warning("자산추이 시트에 데이터가 없습니다.")
         return
@@ -1,24 +1,23 @@
 import streamlit as st
 import pandas as pd
-import gspread
 from ui.formatters import fmt_num
 from ui.components import exchange_rate_header
 from ui.filters import render_table_filters
 from config import SHEET_NAMES
+from service.fx import convert, cash_currencies
+from service.sheets import has_worksheet, worksheet_titles, load_sheet_data
 
 
 def render(spreadsheet, get_usdkrw):
     usdkrw = get_usdkrw()
     exchange_rate_header("📋 현금성자산 테이블", usdkrw, nav_label="📊 차트 보러가기", nav_section="Chart", nav_page="현금성자산 차트")
 
-    try:
-        sheet = spreadsheet.worksheet(SHEET_NAMES["cash"])
-    except gspread.exceptions.WorksheetNotFound:
+    if not has_worksheet(spreadsheet, SHEET_NAMES["cash"]):
         st.error("❌ '현금성자산' 시트를 찾을 수 없습니다.")
-        st.write("사용 가능한 시트:", [ws.title for ws in spreadsheet.worksheets()])
+        st.write("사용 가능한 시트:", worksheet_titles(spreadsheet))
         st.stop()
 
-    rows = sheet.get_all_values()
+    rows = load_sheet_data(spreadsheet, SHEET_NAMES["cash"])
     if not rows or len(rows) < 2:
         st.warning("현금성자산 시트에 데이터가 없습니다.")
         st.stop()
@@ -37,15 +36,16 @@ def render(spreadsheet, get_usdkrw):
     # ── 필터 ──────────────────────────────────────────────
     df = render_table_filters(df, ["증권사", "소유", "계좌구분", "통화", "성격"], "cash")
 
-    def convert_to_krw(row):
-        currency = str(row["통화"]).strip().upper()
-        if currency == "KRW":
-            return row["금액"]
-        elif usdkrw is not None:
-            return row["금액"] * usdkrw
-        return None
+    df["통화"] = cash_currencies(df["통화"])
+    df["금액(KRW)"] = convert(df["금액"], df["통화"])
 
-    df["금액(KRW)"] = df.apply(convert_to_krw, axis=1)
+    # 환율을 받지 못한 통화는 0으로 합산하지 않고 알림
+    unconverted = df["금액"].notna() & df["금액(KRW)"].isna()
+    if unconverted.any():
+        st.warning(
+            f"⚠ 환산할 수 없는 통화 {sorted(df.loc[unconverted, '통화'].unique())} — "
+            f"{int(unconverted.sum())}개 행은 총액에서 제외됨"
+        )
 
     total_cash_krw = df["금액(KRW)"].fillna(0).sum()
 
@@ -1,16 +1,85 @@
+import time
+
 import streamlit as st
 import pandas as pd
 from ui.formatters import fmt_num, fmt_pct
 from ui.components import exchange_rate_header
 from ui.filters import render_table_filters
-from config import SHEET_NAMES
+from config import SHEET_NAMES, CRYPTO_STREAM
 from service.sheets import load_sheet_data
+from service.crypto_data import coingecko_throttled, price_24h_ago
+from service.fx import convert
+from service import crypto_stream
+
+
+def _revalue(df, mask):
+    """mask 행만 현재가 기준으로 평가총액·수익률·24h 손익 재계산 (매입총액·24h전가는 그대로)"""
+    rows = df.loc[mask]
+    df.loc[mask, "평가총액"] = rows["수량(qty)"] * rows["현재가"]
+    df.loc[mask, "평가총액(KRW)"] = convert(df.loc[mask, "평가총액"], rows["통화"])
+    df.loc[mask, "수익률"] = (df.loc[mask, "평가총액(KRW)"] / rows["매입총액(KRW)"] - 1) * 100
+    df.loc[mask, "24h손익(KRW)"] = convert(rows["수량(qty)"] * (rows["현재가"] - rows["24h전가"]), rows["통화"])
+
+
+def _render_values(df):
+    total_buy = df["매입총액(KRW)"].sum()
+    total_eval = df["평가총액(KRW)"].sum()
+    total_yield = (total_eval / total_buy - 1) * 100 if total_buy else 0
+    total_day = df["24h손익(KRW)"].sum()
+    day_color = "#ef553b" if total_day < 0 else "#00cc96"
+
+    st.markdown(f"""
+    <div style='display:flex;gap:40px;font-weight:bold;'>
+        <div>가상 자산 매입총액: {fmt_num(total_buy)} 원</div>
+        <div>가상 자산 평가총액: {fmt_num(total_eval)} 원</div>
+        <div>가상 자산 전체 수익률: {fmt_pct(total_yield)}</div>
+        <div style='color:{day_color};'>24시간 손익: {fmt_num(total_day)} 원</div>
+    </div>
+    """, unsafe_allow_html=True)
+
+    display_df = df.copy()
+    display_df["수량(qty)"] = display_df["수량(qty)"].apply(lambda x: f"{x:,.9f}" if pd.notna(x) else "-")
+    for col in ["평균매수가(avg_price)", "현재가", "24h전가", "매입총액", "매입총액(KRW)", "평가총액", "평가총액(KRW)",
+                "24h손익(KRW)"]:
+        display_df[col] = display_df[col].apply(lambda x: f"{x:,.0f}" if pd.notna(x) else "-")
+    display_df["수익률"] = display_df["수익률"].apply(fmt_pct)
+
+    st.dataframe(display_df, width="stretch")
+
+
+@st.fragment(run_every=CRYPTO_STREAM["refresh"])
+def _render_live(stream):
+    """
+    실시간 모드 — 이 부분만 주기적으로 다시 실행.
+    마지막으로 본 버전 이후 체결가가 바뀐 심볼의 행만 재평가하고 합계를 다시 냄.
+    스트림은 USDT 기준이므로 USD 행만 갱신 — KRW 행(원화 거래소)은 현지 시세(김치 프리미엄 포함)를 그대로 유지.
+    """
+    state = st.session_state["crypto_live"]
+    changes, state["version"] = stream.table.changes_since(state["version"])
+    df = state["df"]
+    if changes:
+        symbols = df["심볼"].astype(str).str.strip().str.upper()
+        mask = symbols.isin(changes) & (df["통화"] == "USD")
+        df.loc[mask, "현재가"] = symbols[mask].map(changes)
+        _revalue(df, mask)
+
+    last = stream.table.last_update
+    if last:
+        st.caption(f"⚡ 실시간 체결가 반영 중 · 마지막 체결 {time.strftime('%H:%M:%S', time.localtime(last))}")
+    else:
+        st.caption("⚡ 체결 스트림 연결 중 — 첫 체결 전까지 CoinGecko 시세로 표시")
+    _render_values(df)
 
 
 def render(spreadsheet, get_usdkrw, get_crypto_prices):
 
     usdkrw = get_usdkrw()
     exchange_rate_header("📋 가상자산 평가 테이블", usdkrw, nav_label="📊 차트 보러가기", nav_section="Chart", nav_page="가상자산 차트")
+    live = st.toggle(
+        "⚡ 실시간 시세", value=CRYPTO_STREAM["enabled"], key="crypto_live_toggle",
+        disabled=not crypto_stream.available(),
+        help="거래소 체결 스트림(USDT 기준)으로 바뀐 USD 코인 행만 다시 평가 — KRW 행은 CoinGecko 원화 시세 유지 (websockets 패키지 필요)",
+    )
 
     rows = load_sheet_data(spreadsheet, SHEET_NAMES["crypto"])
     raw_df = pd.DataFrame(rows[1:], columns=rows[0]).rename(columns=lambda x: x.strip())
@@ -30,18 +99,19 @@ def render(spreadsheet, get_usdkrw, get_crypto_prices):
         "원": "KRW", "KR": "KRW", "달러": "USD", "US": "USD"
     })
 
-    # ── 필터 ──────────────────────────────────────────────
-    df = render_table_filters(df, ["증권사", "소유", "코인", "통화"], "crypto")
-
+    # 필터 전 전체 코인 기준으로 조회 (필터 조합과 무관하게 같은 시세 집합 사용)
     all_ids = df["coingecko_id"].dropna().unique().tolist()
 
     price_map = get_crypto_prices(tuple(all_ids))
 
+    # ── 필터 ──────────────────────────────────────────────
+    df = render_table_filters(df, ["증권사", "소유", "코인", "통화"], "crypto")
+
     if price_map is None:
-        st.warning("⚠ CoinGecko 호출 제한 발생 — 이전 가격 사용")
-        price_map = st.session_state.get("last_crypto_prices", {})
-    else:
-        st.session_state["last_crypto_prices"] = price_map
+        st.warning("⚠ CoinGecko 호출 제한 발생 — 저장된 시세 없음")
+        price_map = {}
+    elif coingecko_throttled():
+        st.info("CoinGecko 호출 한도 도달 — 마지막 정상 시세로 표시 중")
 
     def get_price(row):
         info = price_map.get(row["coingecko_id"], {})
@@ -52,37 +122,23 @@ def render(spreadsheet, get_usdkrw, get_crypto_prices):
         return None
 
     df["현재가"] = df.apply(get_price, axis=1)
-
-    df["매입총액"] = df["수량(qty)"] * df["평균매수가(avg_price)"]
-    df["매입총액(KRW)"] = df.apply(
-        lambda r: r["매입총액"] if r["통화"] == "KRW"
-        else (r["매입총액"] * usdkrw if usdkrw else float("nan")),
-        axis=1
-    )
-    df["평가총액"] = df["수량(qty)"] * df["현재가"]
-    df["평가총액(KRW)"] = df.apply(
-        lambda r: r["평가총액"] if r["통화"] == "KRW"
-        else (r["평가총액"] * usdkrw if usdkrw else float("nan")),
-        axis=1
+    # 같은 /simple/price 응답의 24시간 변동률로 역산 (가상자산은 전일 종가 대신 24시간 기준)
+    df["24h전가"] = pd.Series(
+        [price_24h_ago(price_map.get(i), c) for i, c in zip(df["coingecko_id"], df["통화"])],
+        index=df.index, dtype=float,
     )
-    df["수익률"] = (df["평가총액(KRW)"] / df["매입총액(KRW)"] - 1) * 100
 
-    total_buy = df["매입총액(KRW)"].sum()
-    total_eval = df["평가총액(KRW)"].sum()
-    total_yield = (total_eval / total_buy - 1) * 100 if total_buy else 0
+    df["매입총액"] = df["수량(qty)"] * df["평균매수가(avg_price)"]
+    df["매입총액(KRW)"] = convert(df["매입총액"], df["통화"])
+    _revalue(df, df.index)
 
-    st.markdown(f"""
-    <div style='display:flex;gap:40px;font-weight:bold;'>
-        <div>가상 자산 매입총액: {fmt_num(total_buy)} 원</div>
-        <div>가상 자산 평가총액: {fmt_num(total_eval)} 원</div>
-        <div>가상 자산 전체 수익률: {fmt_pct(total_yield)}</div>
-    </div>
-    """, unsafe_allow_html=True)
+    stream = crypto_stream.get_stream() if live else None
+    if stream is None:
+        _render_values(df)
+        return
 
-    display_df = df.copy()
-    display_df["수량(qty)"] = display_df["수량(qty)"].apply(lambda x: f"{x:,.9f}" if pd.notna(x) else "-")
-    for col in ["평균매수가(avg_price)", "현재가", "매입총액", "매입총액(KRW)", "평가총액", "평가총액(KRW)"]:
-        display_df[col] = display_df[col].apply(lambda x: f"{x:,.0f}" if pd.notna(x) else "-")
-    display_df["수익률"] = display_df["수익률"].apply(fmt_pct)
+    # 실시간 모드: 여기까지(시트·필터·REST 시세)는 전체 rerun 때만, 이후는 조각(fragment)만 갱신
+    stream.subscribe(df.loc[df["통화"] == "USD", "심볼"])
+    st.session_state["crypto_live"] = {"df": df, "version": 0}
+    _render_live(stream)
 
-    st.dataframe(display_df, width="stretch")
@@ -5,9 +5,10 @@ from ui.filters import render_table_filters
 from ui.navigation import to_chart_button
 from config import SHEET_NAMES
 from service.sheets import load_sheet_data
+from service.market_data import get_kr_prev_closes
 
 
-def render(spreadsheet, get_kr_price, gold_override):
+def render(spreadsheet, get_kr_prices):
 
     col_t, col_b = st.columns([5, 1])
     with col_t:
@@ -35,6 +36,13 @@ def render(spreadsheet, get_kr_price, gold_override):
     df["보유수량"] = pd.to_numeric(df["보유수량"].astype(str).str.replace(",", ""), errors="coerce")
     df["매수단가"] = pd.to_numeric(df["매수단가"].astype(str).str.replace(",", ""), errors="coerce")
 
+    # ── 현재가 조회 (Yahoo Finance 일괄) ──────────────────
+    # 필터 적용 전 전체 종목으로 조회해야 다른 화면과 같은 캐시 키를 사용함
+    with st.spinner("Yahoo Finance에서 현재가 조회 중..."):
+        df["현재가"] = get_kr_prices(df["종목코드"], df["종목명"])
+        # 같은 일괄 조회 결과의 전일 종가 (추가 호출 없음)
+        df["전일종가"] = pd.Series(get_kr_prev_closes(df["종목코드"], df["종목명"]), index=df.index, dtype=float)
+
     # 빈 행 제거 (보유수량·매수단가 없는 행)
     df = df.dropna(subset=["보유수량", "매수단가"]).reset_index(drop=True)
 
@@ -44,17 +52,12 @@ def render(spreadsheet, get_kr_price, gold_override):
     # ── 매입총액 계산 ──────────────────────────────────────
     df["매입총액 (KRW)"] = df["보유수량"] * df["매수단가"]
 
-    # ── 현재가 조회 (Yahoo Finance) ───────────────────────
-    with st.spinner("Yahoo Finance에서 현재가 조회 중..."):
-        df["현재가"] = [
-            get_kr_price(t, n, gold_override)
-            for t, n in zip(df["종목코드"], df["종목명"])
-        ]
-
     # ── 평가 계산 ──────────────────────────────────────────
     df["평가총액 (KRW)"] = df["보유수량"] * df["현재가"]
     df["평가손익 (KRW)"] = df["평가총액 (KRW)"] - df["매입총액 (KRW)"]
     df["수익률 (%)"] = (df["평가총액 (KRW)"] / df["매입총액 (KRW)"] - 1) * 100
+    df["일간손익 (KRW)"] = df["보유수량"] * (df["현재가"] - df["전일종가"])
+    df["전일대비 (%)"] = (df["현재가"] / df["전일종가"] - 1) * 100
 
     # ── 현재가 미조회 종목 안내 ────────────────────────────
     no_price = df[df["현재가"].isna()]["종목명"].tolist()
@@ -66,22 +69,27 @@ def render(spreadsheet, get_kr_price, gold_override):
     total_eval  = df["평가총액 (KRW)"].sum()
     total_pl    = df["평가손익 (KRW)"].sum()
     total_yield = (total_eval / total_buy - 1) * 100 if total_buy else 0
+    total_day   = df["일간손익 (KRW)"].sum()
 
     pl_color = "#ef553b" if total_pl < 0 else "#00cc96"
+    day_color = "#ef553b" if total_day < 0 else "#00cc96"
     st.markdown(f"""
     <div style='display:flex;gap:40px;font-size:1.05em;font-weight:bold;padding:8px 0;'>
         <div>매입총액: {fmt_num(total_buy)} 원</div>
         <div>평가총액: {fmt_num(total_eval)} 원</div>
         <div style='color:{pl_color};'>평가손익: {fmt_num(total_pl)} 원</div>
         <div style='color:{pl_color};'>전체 수익률: {fmt_pct(total_yield)}</div>
+        <div style='color:{day_color};'>일간손익: {fmt_num(total_day)} 원</div>
     </div>
     """, unsafe_allow_html=True)
 
     # ── 표시용 DataFrame ───────────────────────────────────
     display_df = df.copy()
-    for col in ["보유수량", "매수단가", "매입총액 (KRW)", "현재가", "평가총액 (KRW)", "평가손익 (KRW)"]:
+    for col in ["보유수량", "매수단가", "매입총액 (KRW)", "현재가", "평가총액 (KRW)", "평가손익 (KRW)",
+                "전일종가", "일간손익 (KRW)"]:
         display_df[col] = display_df[col].apply(fmt_num)
     display_df["수익률 (%)"] = display_df["수익률 (%)"].apply(fmt_pct)
+    display_df["전일대비 (%)"] = display_df["전일대비 (%)"].apply(fmt_pct)
 
     st.dataframe(display_df, width="stretch")
 
@@ -5,9 +5,11 @@ from ui.filters import render_table_filters
 from ui.navigation import to_chart_button
 from config import SHEET_NAMES
 from service.sheets import load_sheet_data
+from service.fx import rate_series
+from service.market_data import get_us_prev_closes
 
 
-def render(spreadsheet, get_usdkrw, get_us_price, get_jpykrw):
+def render(spreadsheet, get_usdkrw, get_us_prices, get_jpykrw):
 
     usdkrw = get_usdkrw()
     jpykrw = get_jpykrw()
@@ -60,23 +62,25 @@ def render(spreadsheet, get_usdkrw, get_us_price, get_jpykrw):
     df["매수단가"] = pd.to_numeric(df["매수단가"].astype(str).str.replace(",", ""), errors="coerce")
     df["매입환율"] = pd.to_numeric(df["매입환율"].astype(str).str.replace(",", ""), errors="coerce")
 
+    # ── 현재가·거래통화 일괄 조회 (필터 전 전체 티커 기준) ─
+    with st.spinner("Yahoo Finance에서 현재가 조회 중..."):
+        prices, currencies = get_us_prices(df["종목티커"])
+    df["현재가"] = prices
+    # 같은 일괄 조회 결과의 전일 종가 (추가 호출 없음)
+    df["전일종가"] = pd.Series(get_us_prev_closes(df["종목티커"]), index=df.index, dtype=float)
+
+    # ── 화폐별 현재 환율 매핑 (거래통화 우선, 없으면 시트 화폐) ─
+    df["현재환율"] = rate_series(pd.Series(currencies, index=df.index).fillna(df["화폐"]))
+
     df = df.dropna(subset=["보유수량", "매수단가"]).reset_index(drop=True)
 
     # ── 필터 ──────────────────────────────────────────────
     df = render_table_filters(df, ["증권사", "소유", "화폐", "종목티커", "계좌구분", "성격"], "overseas")
 
-    # ── 화폐별 현재 환율 매핑 ──────────────────────────────
-    rate_map = {"USD": usdkrw, "JPY": jpykrw}
-    df["현재환율"] = df["화폐"].str.upper().str.strip().map(rate_map)
-
     # ── 매입총액 ───────────────────────────────────────────
     df["매입총액(LC)"] = df["보유수량"] * df["매수단가"]
     df["매입총액(KRW)"] = df["보유수량"] * df["매수단가"] * df["매입환율"]
 
-    # ── 현재가 조회 ────────────────────────────────────────
-    with st.spinner("Yahoo Finance에서 현재가 조회 중..."):
-        df["현재가"] = df["종목티커"].apply(get_us_price)
-
     # ── 평가 계산 ──────────────────────────────────────────
     df["평가총액(LC)"] = df["보유수량"] * df["현재가"]
     df["평가총액(KRW)"] = df["보유수량"] * df["현재가"] * df["현재환율"]
@@ -84,6 +88,9 @@ def render(spreadsheet, get_usdkrw, get_us_price, get_jpykrw):
     df["평가손익(KRW)"] = df["평가총액(KRW)"] - df["매입총액(KRW)"]
     df["수익률(LC)"] = (df["평가총액(LC)"] / df["매입총액(LC)"] - 1) * 100
     df["수익률(KRW)"] = (df["평가총액(KRW)"] / df["매입총액(KRW)"] - 1) * 100
+    df["일간손익(LC)"] = df["보유수량"] * (df["현재가"] - df["전일종가"])
+    df["일간손익(KRW)"] = df["일간손익(LC)"] * df["현재환율"]
+    df["전일대비(%)"] = (df["현재가"] / df["전일종가"] - 1) * 100
 
     # ── 합계 표시 ──────────────────────────────────────────
     if view_option == "LC로 보기":
@@ -95,13 +102,16 @@ def render(spreadsheet, get_usdkrw, get_us_price, get_jpykrw):
             b = sub["매입총액(LC)"].sum()
             e = sub["평가총액(LC)"].sum()
             p = sub["평가손익(LC)"].sum()
+            d = sub["일간손익(LC)"].sum()
             y = (e / b - 1) * 100 if b else 0
             c = "#ef553b" if p < 0 else "#00cc96"
+            dc = "#ef553b" if d < 0 else "#00cc96"
             parts.append(
                 f"<div style='border:1px solid #444;border-radius:6px;padding:6px 14px;'>"
                 f"<span style='font-size:0.85em;color:gray;'>{cur}</span><br>"
                 f"매입: {fmt_num2(b)} | 평가: {fmt_num2(e)} | "
-                f"<span style='color:{c};'>손익: {fmt_num2(p)} | {fmt_pct(y)}</span>"
+                f"<span style='color:{c};'>손익: {fmt_num2(p)} | {fmt_pct(y)}</span> | "
+                f"<span style='color:{dc};'>일간: {fmt_num2(d)}</span>"
                 f"</div>"
             )
         st.markdown(
@@ -113,13 +123,16 @@ def render(spreadsheet, get_usdkrw, get_us_price, get_jpykrw):
         total_eval = df["평가총액(KRW)"].sum()
         total_pl   = df["평가손익(KRW)"].sum()
         total_yield = (total_eval / total_buy - 1) * 100 if total_buy else 0
+        total_day  = df["일간손익(KRW)"].sum()
         pl_color = "#ef553b" if total_pl < 0 else "#00cc96"
+        day_color = "#ef553b" if total_day < 0 else "#00cc96"
         st.markdown(f"""
     <div style='display:flex;gap:40px;font-size:1.05em;font-weight:bold;padding:8px 0;'>
         <div>매입총액: {fmt_num(total_buy)} 원</div>
         <div>평가총액: {fmt_num(total_eval)} 원</div>
         <div style='color:{pl_color};'>평가손익: {fmt_num(total_pl)} 원</div>
         <div style='color:{pl_color};'>전체 수익률: {fmt_pct(total_yield)}</div>
+        <div style='color:{day_color};'>일간손익: {fmt_num(total_day)} 원</div>
     </div>
     """, unsafe_allow_html=True)
 
@@ -127,6 +140,7 @@ def render(spreadsheet, get_usdkrw, get_us_price, get_jpykrw):
     display_df = df.copy()
     display_df["매수단가"]     = display_df["매수단가"].apply(fmt_num2)
     display_df["현재가"]       = display_df["현재가"].apply(fmt_num2)
+    display_df["전일종가"]     = display_df["전일종가"].apply(fmt_num2)
     display_df["매입환율"]     = display_df["매입환율"].apply(fmt_num2)
     display_df["현재환율"]     = display_df["현재환율"].apply(fmt_num2)
     display_df["매입총액(LC)"] = display_df["매입총액(LC)"].apply(fmt_num2)
@@ -137,17 +151,20 @@ def render(spreadsheet, get_usdkrw, get_us_price, get_jpykrw):
     display_df["평가손익(KRW)"] = display_df["평가손익(KRW)"].apply(fmt_num)
     display_df["수익률(LC)"]   = display_df["수익률(LC)"].apply(fmt_pct)
     display_df["수익률(KRW)"]  = display_df["수익률(KRW)"].apply(fmt_pct)
+    display_df["일간손익(LC)"] = display_df["일간손익(LC)"].apply(fmt_num2)
+    display_df["일간손익(KRW)"] = display_df["일간손익(KRW)"].apply(fmt_num)
+    display_df["전일대비(%)"]  = display_df["전일대비(%)"].apply(fmt_pct)
 
-    base_cols = ["증권사", "소유", "화폐", "종목티커", "계좌구분", "성격", "보유수량", "매수단가", "현재가"]
+    base_cols = ["증권사", "소유", "화폐", "종목티커", "계좌구분", "성격", "보유수량", "매수단가", "현재가", "전일종가", "전일대비(%)"]
 
     if view_option == "LC로 보기":
-        cols = base_cols + ["매입총액(LC)", "평가총액(LC)", "평가손익(LC)", "수익률(LC)"]
+        cols = base_cols + ["매입총액(LC)", "평가총액(LC)", "평가손익(LC)", "수익률(LC)", "일간손익(LC)"]
     elif view_option == "KRW로 보기":
-        cols = base_cols + ["매입환율", "현재환율", "매입총액(KRW)", "평가총액(KRW)", "평가손익(KRW)", "수익률(KRW)"]
+        cols = base_cols + ["매입환율", "현재환율", "매입총액(KRW)", "평가총액(KRW)", "평가손익(KRW)", "수익률(KRW)", "일간손익(KRW)"]
     else:
         cols = base_cols + [
-            "매입총액(LC)", "평가총액(LC)", "평가손익(LC)", "수익률(LC)",
-            "매입환율", "현재환율", "매입총액(KRW)", "평가총액(KRW)", "평가손익(KRW)", "수익률(KRW)",
+            "매입총액(LC)", "평가총액(LC)", "평가손익(LC)", "수익률(LC)", "일간손익(LC)",
+            "매입환율", "현재환율", "매입총액(KRW)", "평가총액(KRW)", "평가손익(KRW)", "수익률(KRW)", "일간손익(KRW)",
         ]
 
     st.dataframe(display_df[cols], width="stretch")
@@ -3,53 +3,55 @@ import pandas as pd
 from ui.formatters import fmt_num, fmt_pct
 from ui.navigation import to_chart_button
 from config import SHEET_NAMES
-from service.sheets import load_sheet_data
+from service.sheets import load_sheet_data, sheet_revision
+from service.crypto_data import price_24h_ago
+from service.fx import cash_currencies
 
 NATURES    = ["금", "배당", "성장", "안정", "채권", "현금", "예금", "펀드", "가상자산"]
 ACCOUNTS   = ["금현물", "연금저축", "저축", "주식", "퇴직연금", "IRP", "ISA", "코인"]
 ASSET_COLS = ["국내 투자자산", "해외 투자자산", "가상자산", "현금성 자산", "기타자산"]
 
+# 평가에 쓰는 시트 (리비전 계산 대상)
+VALUATION_SHEETS = ["domestic", "overseas", "crypto", "cash", "property", "etc", "debt"]
+
 
 # ── 카테고리별 KRW 합산 헬퍼 (전체 합계용) ───────────────────────────────────
 
-def _sum_domestic(spreadsheet, get_kr_price, gold_override):
+def _sum_domestic(spreadsheet, snapshot):
     try:
         rows = load_sheet_data(spreadsheet, SHEET_NAMES["domestic"])
         df = pd.DataFrame(rows[1:], columns=rows[0]).rename(columns=lambda x: x.strip())
         df["종목코드"] = df["종목코드"].astype(str).str.zfill(6)
+        df["현재가"] = snapshot.kr_prices(df["종목코드"], df["종목명"])
         df["보유수량"] = pd.to_numeric(df["보유수량"].str.replace(",", ""), errors="coerce")
         df["매수단가"] = pd.to_numeric(df["매수단가"].str.replace(",", ""), errors="coerce")
         df["매입총액"] = df["보유수량"] * df["매수단가"]
-        df["현재가"] = [get_kr_price(t, n, gold_override) for t, n in zip(df["종목코드"], df["종목명"])]
         df["평가총액"] = df["보유수량"] * df["현재가"]
         return df["매입총액"].sum(), df["평가총액"].sum()
     except Exception:
         return 0, 0
 
 
-def _sum_overseas(spreadsheet, get_usdkrw, get_us_price, get_jpykrw):
+def _sum_overseas(spreadsheet, snapshot):
     try:
-        usdkrw = get_usdkrw()
-        jpykrw = get_jpykrw()
-        rate_map = {"USD": usdkrw, "JPY": jpykrw}
         rows = load_sheet_data(spreadsheet, SHEET_NAMES["overseas"])
         df = pd.DataFrame(rows[1:], columns=rows[0]).rename(columns=lambda x: x.strip())
         df["보유수량"] = pd.to_numeric(df["보유수량"].astype(str).str.replace(",", ""), errors="coerce")
         df["매수단가"] = pd.to_numeric(df["매수단가"].astype(str).str.replace(",", ""), errors="coerce")
         df["매입환율"] = pd.to_numeric(df["매입환율"].astype(str).str.replace(",", ""), errors="coerce")
-        df["현재환율"] = df["화폐"].str.upper().str.strip().map(rate_map)
+        prices, currencies = snapshot.us_prices(df["종목티커"])
+        df["현재가"] = prices
+        df["현재환율"] = snapshot.rate_series(pd.Series(currencies, index=df.index).fillna(df["화폐"]))
         df = df.dropna(subset=["보유수량", "매수단가"])
         df["매입총액(KRW)"] = df["보유수량"] * df["매수단가"] * df["매입환율"]
-        df["현재가"] = df["종목티커"].apply(get_us_price)
         df["평가총액(KRW)"] = df["보유수량"] * df["현재가"] * df["현재환율"]
         return df["매입총액(KRW)"].sum(), df["평가총액(KRW)"].sum()
     except Exception:
         return 0, 0
 
 
-def _sum_crypto(spreadsheet, get_usdkrw, get_crypto_prices):
+def _sum_crypto(spreadsheet, snapshot):
     try:
-        usdkrw = get_usdkrw()
         rows = load_sheet_data(spreadsheet, SHEET_NAMES["crypto"])
         df = pd.DataFrame(rows[1:], columns=rows[0]).rename(columns=lambda x: x.strip())
         df["수량(qty)"] = pd.to_numeric(df["수량(qty)"].astype(str).str.replace(",", ""), errors="coerce")
@@ -57,16 +59,10 @@ def _sum_crypto(spreadsheet, get_usdkrw, get_crypto_prices):
         df["coingecko_id"] = df["coingecko_id"].astype(str).str.strip().str.lower()
         df["통화"] = df["통화"].astype(str).str.strip().str.upper().replace({"원": "KRW", "KR": "KRW", "달러": "USD", "US": "USD"})
         all_ids = df["coingecko_id"].dropna().unique().tolist()
-        price_map = get_crypto_prices(tuple(all_ids)) or st.session_state.get("last_crypto_prices", {})
-
-        def to_krw(r, col):
-            val = r[col]
-            if r["통화"] == "KRW":
-                return val
-            return val * usdkrw if usdkrw else float("nan")
+        price_map = snapshot.crypto_prices(tuple(all_ids)) or {}
 
         df["매입총액"] = df["수량(qty)"] * df["평균매수가(avg_price)"]
-        df["매입총액(KRW)"] = df.apply(lambda r: to_krw(r, "매입총액"), axis=1)
+        df["매입총액(KRW)"] = snapshot.convert(df["매입총액"], df["통화"])
 
         def get_price(row):
             info = price_map.get(row["coingecko_id"], {})
@@ -74,22 +70,19 @@ def _sum_crypto(spreadsheet, get_usdkrw, get_crypto_prices):
 
         df["현재가"] = df.apply(get_price, axis=1)
         df["평가총액"] = df["수량(qty)"] * df["현재가"]
-        df["평가총액(KRW)"] = df.apply(lambda r: to_krw(r, "평가총액"), axis=1)
+        df["평가총액(KRW)"] = snapshot.convert(df["평가총액"], df["통화"])
         return df["매입총액(KRW)"].sum(), df["평가총액(KRW)"].sum()
     except Exception:
         return 0, 0
 
 
-def _sum_cash(spreadsheet, get_usdkrw):
+def _sum_cash(spreadsheet, snapshot):
     try:
-        usdkrw = get_usdkrw()
         rows = load_sheet_data(spreadsheet, SHEET_NAMES["cash"])
         df = pd.DataFrame(rows[1:], columns=rows[0]).rename(columns=lambda x: x.strip())
         df["금액"] = pd.to_numeric(df["금액"].astype(str).str.replace(",", ""), errors="coerce").fillna(0)
-        df["통화"] = df["통화"].astype(str).str.strip().str.upper()
-        df["금액(KRW)"] = df.apply(
-            lambda r: r["금액"] if r["통화"] == "KRW" else (r["금액"] * usdkrw if usdkrw else 0), axis=1
-        )
+        df["통화"] = cash_currencies(df["통화"])
+        df["금액(KRW)"] = snapshot.convert(df["금액"], df["통화"]).fillna(0)
         total = df["금액(KRW)"].fillna(0).sum()
         return total, total
     except Exception:
@@ -130,16 +123,16 @@ def _sum_debt(spreadsheet):
 
 # ── 소유별 분류 헬퍼 ────────────────────────────────────────────────────────
 
-def _byowner_domestic(spreadsheet, get_kr_price, gold_override):
+def _byowner_domestic(spreadsheet, snapshot):
     try:
         rows = load_sheet_data(spreadsheet, SHEET_NAMES["domestic"])
         df = pd.DataFrame(rows[1:], columns=rows[0]).rename(columns=lambda x: x.strip())
         df["종목코드"] = df["종목코드"].astype(str).str.zfill(6)
+        df["현재가"] = snapshot.kr_prices(df["종목코드"], df["종목명"])
         df["보유수량"] = pd.to_numeric(df["보유수량"].str.replace(",", ""), errors="coerce")
         df["매수단가"] = pd.to_numeric(df["매수단가"].str.replace(",", ""), errors="coerce")
         df = df.dropna(subset=["보유수량", "매수단가"])
         df["매입총액"] = df["보유수량"] * df["매수단가"]
-        df["현재가"] = [get_kr_price(t, n, gold_override) for t, n in zip(df["종목코드"], df["종목명"])]
         df["평가총액"] = df["보유수량"] * df["현재가"]
         return (
             df.groupby("소유")["평가총액"].sum().to_dict(),
@@ -149,20 +142,18 @@ def _byowner_domestic(spreadsheet, get_kr_price, gold_override):
         return {}, {}
 
 
-def _byowner_overseas(spreadsheet, get_usdkrw, get_us_price, get_jpykrw):
+def _byowner_overseas(spreadsheet, snapshot):
     try:
-        usdkrw = get_usdkrw()
-        jpykrw = get_jpykrw()
-        rate_map = {"USD": usdkrw, "JPY": jpykrw}
         rows = load_sheet_data(spreadsheet, SHEET_NAMES["overseas"])
         df = pd.DataFrame(rows[1:], columns=rows[0]).rename(columns=lambda x: x.strip())
         df["보유수량"] = pd.to_numeric(df["보유수량"].astype(str).str.replace(",", ""), errors="coerce")
         df["매수단가"] = pd.to_numeric(df["매수단가"].astype(str).str.replace(",", ""), errors="coerce")
         df["매입환율"] = pd.to_numeric(df["매입환율"].astype(str).str.replace(",", ""), errors="coerce")
-        df["현재환율"] = df["화폐"].str.upper().str.strip().map(rate_map)
+        prices, currencies = snapshot.us_prices(df["종목티커"])
+        df["현재가"] = prices
+        df["현재환율"] = snapshot.rate_series(pd.Series(currencies, index=df.index).fillna(df["화폐"]))
         df = df.dropna(subset=["보유수량", "매수단가"])
         df["매입총액(KRW)"] = df["보유수량"] * df["매수단가"] * df["매입환율"]
-        df["현재가"] = df["종목티커"].apply(get_us_price)
         df["평가총액(KRW)"] = df["보유수량"] * df["현재가"] * df["현재환율"]
         return (
             df.groupby("소유")["평가총액(KRW)"].sum().to_dict(),
@@ -172,9 +163,8 @@ def _byowner_overseas(spreadsheet, get_usdkrw, get_us_price, get_jpykrw):
         return {}, {}
 
 
-def _byowner_crypto(spreadsheet, get_usdkrw, get_crypto_prices):
+def _byowner_crypto(spreadsheet, snapshot):
     try:
-        usdkrw = get_usdkrw()
         rows = load_sheet_data(spreadsheet, SHEET_NAMES["crypto"])
         df = pd.DataFrame(rows[1:], columns=rows[0]).rename(columns=lambda x: x.strip())
         df["수량(qty)"] = pd.to_numeric(df["수량(qty)"].astype(str).str.replace(",", ""), errors="coerce")
@@ -182,21 +172,17 @@ def _byowner_crypto(spreadsheet, get_usdkrw, get_crypto_prices):
         df["coingecko_id"] = df["coingecko_id"].astype(str).str.strip().str.lower()
         df["통화"] = df["통화"].astype(str).str.strip().str.upper().replace({"원": "KRW", "KR": "KRW", "달러": "USD", "US": "USD"})
         all_ids = df["coingecko_id"].dropna().unique().tolist()
-        price_map = get_crypto_prices(tuple(all_ids)) or st.session_state.get("last_crypto_prices", {})
-
-        def to_krw(r, col):
-            val = r[col]
-            return val if r["통화"] == "KRW" else (val * usdkrw if usdkrw else float("nan"))
+        price_map = snapshot.crypto_prices(tuple(all_ids)) or {}
 
         def get_price(row):
             info = price_map.get(row["coingecko_id"], {})
             return info.get("krw") if row["통화"] == "KRW" else info.get("usd")
 
         df["매입총액"] = df["수량(qty)"] * df["평균매수가(avg_price)"]
-        df["매입총액(KRW)"] = df.apply(lambda r: to_krw(r, "매입총액"), axis=1)
+        df["매입총액(KRW)"] = snapshot.convert(df["매입총액"], df["통화"])
         df["현재가"] = df.apply(get_price, axis=1)
         df["평가총액"] = df["수량(qty)"] * df["현재가"]
-        df["평가총액(KRW)"] = df.apply(lambda r: to_krw(r, "평가총액"), axis=1)
+        df["평가총액(KRW)"] = snapshot.convert(df["평가총액"], df["통화"])
         return (
             df.groupby("소유")["평가총액(KRW)"].sum().to_dict(),
             df.groupby("소유")["매입총액(KRW)"].sum().to_dict(),
@@ -205,16 +191,13 @@ def _byowner_crypto(spreadsheet, get_usdkrw, get_crypto_prices):
         return {}, {}
 
 
-def _byowner_cash(spreadsheet, get_usdkrw):
+def _byowner_cash(spreadsheet, snapshot):
     try:
-        usdkrw = get_usdkrw()
         rows = load_sheet_data(spreadsheet, SHEET_NAMES["cash"])
         df = pd.DataFrame(rows[1:], columns=rows[0]).rename(columns=lambda x: x.strip())
         df["금액"] = pd.to_numeric(df["금액"].astype(str).str.replace(",", ""), errors="coerce").fillna(0)
-        df["통화"] = df["통화"].astype(str).str.strip().str.upper()
-        df["금액(KRW)"] = df.apply(
-            lambda r: r["금액"] if r["통화"] == "KRW" else (r["금액"] * usdkrw if usdkrw else 0), axis=1
-        )
+        df["통화"] = cash_currencies(df["통화"])
+        df["금액(KRW)"] = snapshot.convert(df["금액"], df["통화"]).fillna(0)
         by = df.groupby("소유")["금액(KRW)"].sum().to_dict()
         return by, by  # 현금은 취득=현재
     except Exception:
@@ -303,48 +286,118 @@ def _fmt_pivot(df):
     return fmt
 
 
+# ── 소유별 일간 손익 헬퍼 (전일 종가·24시간 전 가격 대비, KRW) ─────────────────
+
+def _daily_domestic(spreadsheet, snapshot):
+    try:
+        rows = load_sheet_data(spreadsheet, SHEET_NAMES["domestic"])
+        df = pd.DataFrame(rows[1:], columns=rows[0]).rename(columns=lambda x: x.strip())
+        df["종목코드"] = df["종목코드"].astype(str).str.zfill(6)
+        df["보유수량"] = pd.to_numeric(df["보유수량"].astype(str).str.replace(",", ""), errors="coerce")
+        df["현재가"] = pd.Series(snapshot.kr_prices(df["종목코드"], df["종목명"]), index=df.index, dtype=float)
+        df["전일종가"] = pd.Series(snapshot.kr_prev_closes(df["종목코드"], df["종목명"]), index=df.index, dtype=float)
+        df["일간손익"] = df["보유수량"] * (df["현재가"] - df["전일종가"])
+        return df.groupby("소유")["일간손익"].sum().to_dict()
+    except Exception:
+        return {}
+
+
+def _daily_overseas(spreadsheet, snapshot):
+    try:
+        rows = load_sheet_data(spreadsheet, SHEET_NAMES["overseas"])
+        df = pd.DataFrame(rows[1:], columns=rows[0]).rename(columns=lambda x: x.strip())
+        df["보유수량"] = pd.to_numeric(df["보유수량"].astype(str).str.replace(",", ""), errors="coerce")
+        prices, currencies = snapshot.us_prices(df["종목티커"])
+        df["현재가"] = pd.Series(prices, index=df.index, dtype=float)
+        df["전일종가"] = pd.Series(snapshot.us_prev_closes(df["종목티커"]), index=df.index, dtype=float)
+        df["현재환율"] = snapshot.rate_series(pd.Series(currencies, index=df.index).fillna(df["화폐"]))
+        df["일간손익"] = df["보유수량"] * (df["현재가"] - df["전일종가"]) * df["현재환율"]
+        return df.groupby("소유")["일간손익"].sum().to_dict()
+    except Exception:
+        return {}
+
+
+def _daily_crypto(spreadsheet, snapshot):
+    try:
+        rows = load_sheet_data(spreadsheet, SHEET_NAMES["crypto"])
+        df = pd.DataFrame(rows[1:], columns=rows[0]).rename(columns=lambda x: x.strip())
+        df["수량(qty)"] = pd.to_numeric(df["수량(qty)"].astype(str).str.replace(",", ""), errors="coerce")
+        df["coingecko_id"] = df["coingecko_id"].astype(str).str.strip().str.lower()
+        df["통화"] = df["통화"].astype(str).str.strip().str.upper().replace({"원": "KRW", "KR": "KRW", "달러": "USD", "US": "USD"})
+        price_map = snapshot.crypto_prices(tuple(df["coingecko_id"].dropna().unique().tolist())) or {}
+
+        def get_price(row):
+            info = price_map.get(row["coingecko_id"], {})
+            return info.get("krw") if row["통화"] == "KRW" else info.get("usd")
+
+        df["현재가"] = df.apply(get_price, axis=1).astype(float)
+        df["24h전가"] = pd.Series(
+            [price_24h_ago(price_map.get(i), c) for i, c in zip(df["coingecko_id"], df["통화"])],
+            index=df.index, dtype=float,
+        )
+        df["일간손익"] = snapshot.convert(df["수량(qty)"] * (df["현재가"] - df["24h전가"]), df["통화"])
+        return df.groupby("소유")["일간손익"].sum().to_dict()
+    except Exception:
+        return {}
+
+
+def _build_daily_pivot(daily_dicts, labels):
+    """소유 × 자산 종류 일간 손익 표 (Sum 행 포함)"""
+    owners = sorted({o for d in daily_dicts for o in d})
+    rows = []
+    for owner in owners:
+        row = {"소유": owner}
+        for label, d in zip(labels, daily_dicts):
+            row[label] = d.get(owner, 0)
+        row["Total"] = sum(d.get(owner, 0) for d in daily_dicts)
+        rows.append(row)
+    df = pd.DataFrame(rows, columns=["소유", *labels, "Total"])
+    sum_row = {c: df[c].sum() for c in df.columns if c != "소유"}
+    sum_row["소유"] = "Sum"
+    return pd.concat([df, pd.DataFrame([sum_row])], ignore_index=True)
+
+
 # ── 성격별 헬퍼 ──────────────────────────────────────────────────────────────
 
-def _nature_domestic(spreadsheet, get_kr_price, gold_override):
+def _nature_domestic(spreadsheet, snapshot):
     try:
         rows = load_sheet_data(spreadsheet, SHEET_NAMES["domestic"])
         df = pd.DataFrame(rows[1:], columns=rows[0]).rename(columns=lambda x: x.strip())
         df["종목코드"] = df["종목코드"].astype(str).str.zfill(6)
+        df["현재가"] = snapshot.kr_prices(df["종목코드"], df["종목명"])
         df["보유수량"] = pd.to_numeric(df["보유수량"].str.replace(",", ""), errors="coerce")
         df["매수단가"] = pd.to_numeric(df["매수단가"].str.replace(",", ""), errors="coerce")
         df = df.dropna(subset=["보유수량", "매수단가"])
-        df["현재가"] = [get_kr_price(t, n, gold_override) for t, n in zip(df["종목코드"], df["종목명"])]
         df["금액"] = df["보유수량"] * df["현재가"]
         return df[["소유", "성격", "금액"]]
     except Exception:
         return pd.DataFrame(columns=["소유", "성격", "금액"])
 
 
-def _nature_overseas(spreadsheet, get_usdkrw, get_us_price, get_jpykrw):
+def _nature_overseas(spreadsheet, snapshot):
     try:
-        rate_map = {"USD": get_usdkrw(), "JPY": get_jpykrw()}
         rows = load_sheet_data(spreadsheet, SHEET_NAMES["overseas"])
         df = pd.DataFrame(rows[1:], columns=rows[0]).rename(columns=lambda x: x.strip())
         df["보유수량"] = pd.to_numeric(df["보유수량"].astype(str).str.replace(",", ""), errors="coerce")
-        df["현재환율"] = df["화폐"].str.upper().str.strip().map(rate_map)
+        prices, currencies = snapshot.us_prices(df["종목티커"])
+        df["현재가"] = prices
+        df["현재환율"] = snapshot.rate_series(pd.Series(currencies, index=df.index).fillna(df["화폐"]))
         df = df.dropna(subset=["보유수량"])
-        df["현재가"] = df["종목티커"].apply(get_us_price)
         df["금액"] = df["보유수량"] * df["현재가"] * df["현재환율"]
         return df[["소유", "성격", "금액"]]
     except Exception:
         return pd.DataFrame(columns=["소유", "성격", "금액"])
 
 
-def _nature_crypto(spreadsheet, get_usdkrw, get_crypto_prices):
+def _nature_crypto(spreadsheet, snapshot):
     try:
-        usdkrw = get_usdkrw()
         rows = load_sheet_data(spreadsheet, SHEET_NAMES["crypto"])
         df = pd.DataFrame(rows[1:], columns=rows[0]).rename(columns=lambda x: x.strip())
         df["수량(qty)"] = pd.to_numeric(df["수량(qty)"].astype(str).str.replace(",", ""), errors="coerce")
         df["coingecko_id"] = df["coingecko_id"].astype(str).str.strip().str.lower()
         df["통화"] = df["통화"].astype(str).str.strip().str.upper().replace({"원": "KRW", "KR": "KRW", "달러": "USD", "US": "USD"})
         all_ids = df["coingecko_id"].dropna().unique().tolist()
-        price_map = get_crypto_prices(tuple(all_ids)) or st.session_state.get("last_crypto_prices", {})
+        price_map = snapshot.crypto_prices(tuple(all_ids)) or {}
 
         def get_price(row):
             info = price_map.get(row["coingecko_id"], {})
@@ -352,26 +405,20 @@ def _nature_crypto(spreadsheet, get_usdkrw, get_crypto_prices):
 
         df["현재가"] = df.apply(get_price, axis=1)
         df["평가총액"] = df["수량(qty)"] * df["현재가"]
-        df["금액"] = df.apply(
-            lambda r: r["평가총액"] if r["통화"] == "KRW" else (r["평가총액"] * usdkrw if usdkrw else float("nan")),
-            axis=1,
-        )
+        df["금액"] = snapshot.convert(df["평가총액"], df["통화"])
         df["성격"] = "가상자산"
         return df[["소유", "성격", "금액"]]
     except Exception:
         return pd.DataFrame(columns=["소유", "성격", "금액"])
 
 
-def _nature_cash(spreadsheet, get_usdkrw):
+def _nature_cash(spreadsheet, snapshot):
     try:
-        usdkrw = get_usdkrw()
         rows = load_sheet_data(spreadsheet, SHEET_NAMES["cash"])
         df = pd.DataFrame(rows[1:], columns=rows[0]).rename(columns=lambda x: x.strip())
         df["금액_raw"] = pd.to_numeric(df["금액"].astype(str).str.replace(",", ""), errors="coerce").fillna(0)
-        df["통화"] = df["통화"].astype(str).str.strip().str.upper()
-        df["금액"] = df.apply(
-            lambda r: r["금액_raw"] if r["통화"] == "KRW" else (r["금액_raw"] * usdkrw if usdkrw else 0), axis=1
-        )
+        df["통화"] = cash_currencies(df["통화"])
+        df["금액"] = snapshot.convert(df["금액_raw"], df["통화"]).fillna(0)
         return df[["소유", "성격", "금액"]]
     except Exception:
         return pd.DataFrame(columns=["소유", "성격", "금액"])
@@ -453,46 +500,45 @@ def _style_sum(df, label_col):
 
 # ── 계좌별 헬퍼 ──────────────────────────────────────────────────────────────
 
-def _account_domestic(spreadsheet, get_kr_price, gold_override):
+def _account_domestic(spreadsheet, snapshot):
     try:
         rows = load_sheet_data(spreadsheet, SHEET_NAMES["domestic"])
         df = pd.DataFrame(rows[1:], columns=rows[0]).rename(columns=lambda x: x.strip())
         df["종목코드"] = df["종목코드"].astype(str).str.zfill(6)
+        df["현재가"] = snapshot.kr_prices(df["종목코드"], df["종목명"])
         df["보유수량"] = pd.to_numeric(df["보유수량"].str.replace(",", ""), errors="coerce")
         df["매수단가"] = pd.to_numeric(df["매수단가"].str.replace(",", ""), errors="coerce")
         df = df.dropna(subset=["보유수량", "매수단가"])
-        df["현재가"] = [get_kr_price(t, n, gold_override) for t, n in zip(df["종목코드"], df["종목명"])]
         df["금액"] = df["보유수량"] * df["현재가"]
         return df[["소유", "계좌구분", "금액"]]
     except Exception:
         return pd.DataFrame(columns=["소유", "계좌구분", "금액"])
 
 
-def _account_overseas(spreadsheet, get_usdkrw, get_us_price, get_jpykrw):
+def _account_overseas(spreadsheet, snapshot):
     try:
-        rate_map = {"USD": get_usdkrw(), "JPY": get_jpykrw()}
         rows = load_sheet_data(spreadsheet, SHEET_NAMES["overseas"])
         df = pd.DataFrame(rows[1:], columns=rows[0]).rename(columns=lambda x: x.strip())
         df["보유수량"] = pd.to_numeric(df["보유수량"].astype(str).str.replace(",", ""), errors="coerce")
-        df["현재환율"] = df["화폐"].str.upper().str.strip().map(rate_map)
+        prices, currencies = snapshot.us_prices(df["종목티커"])
+        df["현재가"] = prices
+        df["현재환율"] = snapshot.rate_series(pd.Series(currencies, index=df.index).fillna(df["화폐"]))
         df = df.dropna(subset=["보유수량"])
-        df["현재가"] = df["종목티커"].apply(get_us_price)
         df["금액"] = df["보유수량"] * df["현재가"] * df["현재환율"]
         return df[["소유", "계좌구분", "금액"]]
     except Exception:
         return pd.DataFrame(columns=["소유", "계좌구분", "금액"])
 
 
-def _account_crypto(spreadsheet, get_usdkrw, get_crypto_prices):
+def _account_crypto(spreadsheet, snapshot):
     try:
-        usdkrw = get_usdkrw()
         rows = load_sheet_data(spreadsheet, SHEET_NAMES["crypto"])
         df = pd.DataFrame(rows[1:], columns=rows[0]).rename(columns=lambda x: x.strip())
         df["수량(qty)"] = pd.to_numeric(df["수량(qty)"].astype(str).str.replace(",", ""), errors="coerce")
         df["coingecko_id"] = df["coingecko_id"].astype(str).str.strip().str.lower()
         df["통화"] = df["통화"].astype(str).str.strip().str.upper().replace({"원": "KRW", "KR": "KRW", "달러": "USD", "US": "USD"})
         all_ids = df["coingecko_id"].dropna().unique().tolist()
-        price_map = get_crypto_prices(tuple(all_ids)) or st.session_state.get("last_crypto_prices", {})
+        price_map = snapshot.crypto_prices(tuple(all_ids)) or {}
 
         def get_price(row):
             info = price_map.get(row["coingecko_id"], {})
@@ -500,26 +546,20 @@ def _account_crypto(spreadsheet, get_usdkrw, get_crypto_prices):
 
         df["현재가"] = df.apply(get_price, axis=1)
         df["평가총액"] = df["수량(qty)"] * df["현재가"]
-        df["금액"] = df.apply(
-            lambda r: r["평가총액"] if r["통화"] == "KRW" else (r["평가총액"] * usdkrw if usdkrw else float("nan")),
-            axis=1,
-        )
+        df["금액"] = snapshot.convert(df["평가총액"], df["통화"])
         df["계좌구분"] = "코인"
         return df[["소유", "계좌구분", "금액"]]
     except Exception:
         return pd.DataFrame(columns=["소유", "계좌구분", "금액"])
 
 
-def _account_cash(spreadsheet, get_usdkrw):
+def _account_cash(spreadsheet, snapshot):
     try:
-        usdkrw = get_usdkrw()
         rows = load_sheet_data(spreadsheet, SHEET_NAMES["cash"])
         df = pd.DataFrame(rows[1:], columns=rows[0]).rename(columns=lambda x: x.strip())
         df["금액_raw"] = pd.to_numeric(df["금액"].astype(str).str.replace(",", ""), errors="coerce").fillna(0)
-        df["통화"] = df["통화"].astype(str).str.strip().str.upper()
-        df["금액"] = df.apply(
-            lambda r: r["금액_raw"] if r["통화"] == "KRW" else (r["금액_raw"] * usdkrw if usdkrw else 0), axis=1
-        )
+        df["통화"] = cash_currencies(df["통화"])
+        df["금액"] = snapshot.convert(df["금액_raw"], df["통화"]).fillna(0)
         return df[["소유", "계좌구분", "금액"]]
     except Exception:
         return pd.DataFrame(columns=["소유", "계좌구분", "금액"])
@@ -535,9 +575,67 @@ def _account_etc(spreadsheet):
         return pd.DataFrame(columns=["소유", "계좌구분", "금액"])
 
 
+# ── 스냅샷 기준 평가 (종합·추이·종합 차트 공용) ─────────────────────────────
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _valuation(_spreadsheet, _snapshot, sheet_rev, snapshot_id):
+    """(시트 리비전, 스냅샷 id)가 같으면 세션·페이지와 무관하게 재사용"""
+    s, p = _spreadsheet, _snapshot
+    return {
+        "sum": {
+            "domestic": _sum_domestic(s, p),
+            "overseas": _sum_overseas(s, p),
+            "crypto":   _sum_crypto(s, p),
+            "cash":     _sum_cash(s, p),
+            "property": _sum_property(s),
+            "etc":      _sum_etc(s),
+            "debt":     _sum_debt(s),
+        },
+        "byowner": {
+            "domestic": _byowner_domestic(s, p),
+            "overseas": _byowner_overseas(s, p),
+            "crypto":   _byowner_crypto(s, p),
+            "cash":     _byowner_cash(s, p),
+            "property": _byowner_property(s),
+            "etc":      _byowner_etc(s),
+            "debt":     _byowner_debt(s),
+        },
+        "daily": {
+            "domestic": _daily_domestic(s, p),
+            "overseas": _daily_overseas(s, p),
+            "crypto":   _daily_crypto(s, p),
+        },
+        "nature": {
+            "국내 투자자산": _nature_domestic(s, p),
+            "해외 투자자산": _nature_overseas(s, p),
+            "가상자산":      _nature_crypto(s, p),
+            "현금성 자산":   _nature_cash(s, p),
+            "기타자산":      _nature_etc(s),
+        },
+        "account": {
+            "국내 투자자산": _account_domestic(s, p),
+            "해외 투자자산": _account_overseas(s, p),
+            "가상자산":      _account_crypto(s, p),
+            "현금성 자산":   _account_cash(s, p),
+            "기타자산":      _account_etc(s),
+        },
+    }
+
+
+def valuation(spreadsheet, snapshot):
+    """
+    PriceSnapshot 하나로 계산한 카테고리별 합계·소유별·성격별·계좌별 평가.
+    반환: {"sum": {자산: (매입, 평가)}, "byowner": {자산: (평가 dict, 매입 dict)},
+           "daily": {자산: {소유: 일간 손익}}, "nature": {자산유형: DataFrame}, "account": {자산유형: DataFrame}}
+    (부채는 sum/byowner 모두 단일 값/dict)
+    """
+    sheet_rev = sheet_revision(spreadsheet, VALUATION_SHEETS)
+    return _valuation(spreadsheet, snapshot, sheet_rev, snapshot.id)
+
+
 # ── 메인 렌더 ─────────────────────────────────────────────────────────────────
 
-def render(spreadsheet, get_usdkrw, get_kr_price, get_us_price, get_crypto_prices, gold_override, get_jpykrw):
+def render(spreadsheet, snapshot):
     col_t, col_b = st.columns([5, 1])
     with col_t:
         st.subheader("📋 종합 자산 요약")
@@ -545,13 +643,16 @@ def render(spreadsheet, get_usdkrw, get_kr_price, get_us_price, get_crypto_price
         to_chart_button("종합 차트")
 
     with st.spinner("전체 자산 데이터 로딩 중..."):
-        dom_buy,  dom_eval  = _sum_domestic(spreadsheet, get_kr_price, gold_override)
-        ovs_buy,  ovs_eval  = _sum_overseas(spreadsheet, get_usdkrw, get_us_price, get_jpykrw)
-        cry_buy,  cry_eval  = _sum_crypto(spreadsheet, get_usdkrw, get_crypto_prices)
-        cash_buy, cash_eval = _sum_cash(spreadsheet, get_usdkrw)
-        prop_buy, prop_eval = _sum_property(spreadsheet)
-        etc_buy,  etc_eval  = _sum_etc(spreadsheet)
-        debt_total          = _sum_debt(spreadsheet)
+        val = valuation(spreadsheet, snapshot)
+
+    sums = val["sum"]
+    dom_buy,  dom_eval  = sums["domestic"]
+    ovs_buy,  ovs_eval  = sums["overseas"]
+    cry_buy,  cry_eval  = sums["crypto"]
+    cash_buy, cash_eval = sums["cash"]
+    prop_buy, prop_eval = sums["property"]
+    etc_buy,  etc_eval  = sums["etc"]
+    debt_total          = sums["debt"]
 
     # ── 종합 요약 테이블 ───────────────────────────────────
     summary_rows = [
@@ -575,7 +676,11 @@ def render(spreadsheet, get_usdkrw, get_kr_price, get_us_price, get_crypto_price
     net_pl        = total_pl - debt_total
     total_yield   = (total_assets / total_buy - 1) * 100 if total_buy else 0
 
+    daily = val["daily"]
+    total_day     = sum(sum(d.values()) for d in daily.values())
+
     npl_color = "#ef553b" if net_pl < 0 else "#00cc96"
+    day_color = "#ef553b" if total_day < 0 else "#00cc96"
 
     st.markdown(f"""
     <div style='display:flex;gap:40px;font-size:1.1em;font-weight:bold;'>
@@ -585,6 +690,7 @@ def render(spreadsheet, get_usdkrw, get_kr_price, get_us_price, get_crypto_price
         <div>순자산: {fmt_num(net_assets)} 원</div>
         <div style='color:{npl_color};'>순 평가손익: {fmt_num(net_pl)} 원</div>
         <div>전체 수익률: {fmt_pct(total_yield)}</div>
+        <div style='color:{day_color};'>일간손익: {fmt_num(total_day)} 원</div>
     </div>
     """, unsafe_allow_html=True)
 
@@ -612,14 +718,14 @@ def render(spreadsheet, get_usdkrw, get_kr_price, get_us_price, get_crypto_price
     # ── 소유별 피벗 테이블 ────────────────────────────────
     st.markdown("---")
 
-    with st.spinner("소유별 분류 계산 중..."):
-        dom_eval_by,  dom_buy_by  = _byowner_domestic(spreadsheet, get_kr_price, gold_override)
-        ovs_eval_by,  ovs_buy_by  = _byowner_overseas(spreadsheet, get_usdkrw, get_us_price, get_jpykrw)
-        cry_eval_by,  cry_buy_by  = _byowner_crypto(spreadsheet, get_usdkrw, get_crypto_prices)
-        cash_eval_by, cash_buy_by = _byowner_cash(spreadsheet, get_usdkrw)
-        prop_eval_by, prop_buy_by = _byowner_property(spreadsheet)
-        etc_eval_by,  etc_buy_by  = _byowner_etc(spreadsheet)
-        debt_by                   = _byowner_debt(spreadsheet)
+    by = val["byowner"]
+    dom_eval_by,  dom_buy_by  = by["domestic"]
+    ovs_eval_by,  ovs_buy_by  = by["overseas"]
+    cry_eval_by,  cry_buy_by  = by["crypto"]
+    cash_eval_by, cash_buy_by = by["cash"]
+    prop_eval_by, prop_buy_by = by["property"]
+    etc_eval_by,  etc_buy_by  = by["etc"]
+    debt_by                   = by["debt"]
 
     asset_labels = ["국내 투자자산", "해외 투자자산", "가상자산", "현금성자산", "부동산자산", "기타자산"]
     eval_dicts = [dom_eval_by, ovs_eval_by, cry_eval_by, cash_eval_by, prop_eval_by, etc_eval_by]
@@ -633,18 +739,20 @@ def render(spreadsheet, get_usdkrw, get_kr_price, get_us_price, get_crypto_price
     st.markdown("##### 2. 소유 기준 (매입금액(KRW))")
     st.dataframe(_style_sum(_fmt_pivot(df_buy_pivot), "소유"), width="stretch")
 
+    st.markdown("##### 3. 소유 기준 (일간손익(KRW) — 가상자산은 24시간 기준)")
+    df_daily = _build_daily_pivot(
+        [daily["domestic"], daily["overseas"], daily["crypto"]], ["국내 투자자산", "해외 투자자산", "가상자산"]
+    )
+    fmt_daily = df_daily.copy()
+    for col in fmt_daily.columns[1:]:
+        fmt_daily[col] = fmt_daily[col].apply(fmt_num)
+    st.dataframe(_style_sum(fmt_daily, "소유"), width="stretch")
+
     # ── 금융 자산 성격별 비중 ─────────────────────────────
     st.markdown("---")
     st.subheader("📊 금융 자산 성격별 비중")
 
-    with st.spinner("성격별 데이터 로딩 중..."):
-        dfs_by_type = {
-            "국내 투자자산": _nature_domestic(spreadsheet, get_kr_price, gold_override),
-            "해외 투자자산": _nature_overseas(spreadsheet, get_usdkrw, get_us_price, get_jpykrw),
-            "가상자산":      _nature_crypto(spreadsheet, get_usdkrw, get_crypto_prices),
-            "현금성 자산":   _nature_cash(spreadsheet, get_usdkrw),
-            "기타자산":      _nature_etc(spreadsheet),
-        }
+    dfs_by_type = val["nature"]
 
     st.markdown("##### 전체")
     st.dataframe(_style_sum(_fmt_nature_pivot(_build_nature_pivot(dfs_by_type)), "성격"), width="stretch")
@@ -663,14 +771,7 @@ def render(spreadsheet, get_usdkrw, get_kr_price, get_us_price, get_crypto_price
     st.markdown("---")
     st.subheader("📊 금융 자산 계좌별 비중")
 
-    with st.spinner("계좌별 데이터 로딩 중..."):
-        dfs_by_account = {
-            "국내 투자자산": _account_domestic(spreadsheet, get_kr_price, gold_override),
-            "해외 투자자산": _account_overseas(spreadsheet, get_usdkrw, get_us_price, get_jpykrw),
-            "가상자산":      _account_crypto(spreadsheet, get_usdkrw, get_crypto_prices),
-            "현금성 자산":   _account_cash(spreadsheet, get_usdkrw),
-            "기타자산":      _account_etc(spreadsheet),
-        }
+    dfs_by_account = val["account"]
 
     st.markdown("##### 전체")
     st.dataframe(_style_sum(_fmt_category_pivot(_build_category_pivot(dfs_by_account, ACCOUNTS, "계좌구분")), "계좌구분"), width="stretch")
@@ -4,30 +4,27 @@ import pandas as pd
 import gspread
 from ui.formatters import fmt_num, fmt_pct
 from config import SHEET_NAMES
-from service.sheets import load_sheet_data
-from assets_table.total import (
-    _byowner_domestic, _byowner_overseas, _byowner_crypto,
-    _byowner_cash, _byowner_property, _byowner_etc, _byowner_debt,
-)
+from service.sheets import get_worksheet, load_sheet_data, refresh_sheets
+from assets_table.total import valuation
 
 # Short names matching 자산추이 sheet column headers
 _ASSET_SHORTS = ["국내자산", "해외자산", "가상자산", "현금성자산", "부동산", "기타"]
 
 
-def _compute_snapshot(spreadsheet, get_usdkrw, get_kr_price, get_us_price,
-                      get_crypto_prices, gold_override, get_jpykrw):
+def _compute_snapshot(spreadsheet, price_snapshot):
     """
-    Call all _byowner_* helpers and build a flat dict matching the
-    자산추이 sheet column layout.
+    Take the per-owner valuation for one PriceSnapshot and build a flat dict
+    matching the 자산추이 sheet column layout.
     Returns (snapshot_dict, [owners_list])
     """
-    eval_dom, buy_dom = _byowner_domestic(spreadsheet, get_kr_price, gold_override)
-    eval_ov,  buy_ov  = _byowner_overseas(spreadsheet, get_usdkrw, get_us_price, get_jpykrw)
-    eval_cry, buy_cry = _byowner_crypto(spreadsheet, get_usdkrw, get_crypto_prices)
-    eval_csh, buy_csh = _byowner_cash(spreadsheet, get_usdkrw)
-    eval_prp, buy_prp = _byowner_property(spreadsheet)
-    eval_etc, buy_etc = _byowner_etc(spreadsheet)
-    debt_by           = _byowner_debt(spreadsheet)
+    by = valuation(spreadsheet, price_snapshot)["byowner"]
+    eval_dom, buy_dom = by["domestic"]
+    eval_ov,  buy_ov  = by["overseas"]
+    eval_cry, buy_cry = by["crypto"]
+    eval_csh, buy_csh = by["cash"]
+    eval_prp, buy_prp = by["property"]
+    eval_etc, buy_etc = by["etc"]
+    debt_by           = by["debt"]
 
     eval_lists = [eval_dom, eval_ov, eval_cry, eval_csh, eval_prp, eval_etc]
     buy_lists  = [buy_dom,  buy_ov,  buy_cry,  buy_csh,  buy_prp,  buy_etc]
@@ -96,14 +93,13 @@ def _compute_snapshot(spreadsheet, get_usdkrw, get_kr_price, get_us_price,
     return row, all_owners
 
 
-def render(spreadsheet, get_usdkrw, get_kr_price, get_us_price,
-           get_crypto_prices, gold_override, get_jpykrw):
+def render(spreadsheet, price_snapshot):
 
     st.subheader("📋 종합 자산 추이")
 
     # ── 시트 로드 ──────────────────────────────────────────
     try:
-        sheet = spreadsheet.worksheet(SHEET_NAMES["trend"])  # 쓰기용
+        sheet = get_worksheet(spreadsheet, SHEET_NAMES["trend"])  # 쓰기용 (리비전별 핸들 캐시)
         rows = load_sheet_data(spreadsheet, SHEET_NAMES["trend"])  # 읽기용 (캐시)
     except gspread.exceptions.WorksheetNotFound:
         st.info("'자산추이' 시트가 아직 없습니다. Google Sheets에 해당 시트를 추가하면 이 화면에 표시됩니다.")
@@ -116,10 +112,7 @@ def render(spreadsheet, get_usdkrw, get_kr_price, get_us_price,
 
     # ── 현재 스냅샷 계산 ───────────────────────────────────
     with st.spinner("현재 자산 스냅샷 계산 중..."):
-        snapshot, owners = _compute_snapshot(
-            spreadsheet, get_usdkrw, get_kr_price, get_us_price,
-            get_crypto_prices, gold_override, get_jpykrw,
-        )
+        snapshot, owners = _compute_snapshot(spreadsheet, price_snapshot)
 
     st.markdown("#### 현재 스냅샷")
 
@@ -147,6 +140,7 @@ def render(spreadsheet, get_usdkrw, get_kr_price, get_us_price,
             headers = rows[0]
             new_row = [snapshot.get(h, "") for h in headers]
             sheet.append_row(new_row)
+        refresh_sheets(spreadsheet)  # 방금 쓴 행이 바로 보이도록 (리비전 반영 지연과 무관하게)
         st.success(f"✅ {snapshot['기준일']} 데이터가 입력되었습니다.")
         st.rerun()
 
@@ -220,6 +214,7 @@ def render(spreadsheet, get_usdkrw, get_kr_price, get_us_price,
                         break
                 if target_row_idx is not None:
                     sheet.delete_rows(target_row_idx)
+                    refresh_sheets(spreadsheet)
                     st.success(f"✅ '{target}' 행이 삭제되었습니다.")
                 st.session_state["trend_delete_step"] = 0
                 st.session_state["trend_delete_target"] = None
@@ -1,4 +1,5 @@
 # 공통 설정값
+import os
 
 SHEET_NAMES = {
     "domestic": "국내자산",
@@ -13,7 +14,83 @@ SHEET_NAMES = {
     "overseas_div": "해외배당",
 }
 
+# 시트 캐시는 스프레드시트 리비전(Drive modifiedTime)이 바뀔 때만 다시 읽음.
+# 리비전 확인(메타데이터 1회 조회)은 rerun마다 하되 이 간격(초) 안에서는 마지막 값을 재사용.
+SHEET_REVISION_PROBE = 10
+
+# 시트 저장소 — "gsheets"(Google Sheets, .streamlit/secrets.toml 인증) 또는 "local"(디렉터리의 시트별 CSV/XLSX 파일).
+# local은 SHEET_NAMES 이름 그대로의 파일({시트 이름}.csv 또는 .xlsx)을 읽고 씀 — 예시 데이터는 service/synthetic_portfolio.py
+SHEET_BACKEND = os.environ.get("FINANCE_SHEET_BACKEND", "gsheets")
+LOCAL_SHEET_DIR = os.environ.get("FINANCE_SHEET_DIR", "data/sheets")
+
+# 시트 값 로컬 미러 (Parquet) — 재시작 직후 즉시 렌더, Sheets API 장애·할당량 초과 시 대체 응답
+SHEET_MIRROR_DIR = ".cache/sheets"
+
 CACHE_TTL = {
-    "market": 600,   # 10분
+    "market": 600,   # 10분 — 시세 저장소 갱신 주기
     "crypto": 300,   # 5분
+    "memo": 60,      # 1분 — 렌더 간 메모리 캐시 (저장소 갱신분 반영 주기)
+}
+
+# 시세 제공자 병렬 조회 스레드 수 (KRX, 해외, 환율×2, 금, CoinGecko)
+MARKET_FETCH_WORKERS = 6
+
+# 시세 HTTP 클라이언트 — 호스트별 keep-alive 커넥션 풀 크기 / 요청별 타임아웃(초)
+HTTP_POOL_SIZE = 10
+HTTP_TIMEOUT = 10
+
+# 시세 제공자 — "live"(Yahoo·CoinGecko) 또는 "fake"(로컬 대역 서버, service/fake_quote_server.py)
+# FINANCE_QUOTE_RECORDING을 지정하면 받은 시세를 대역 서버 재생용 JSON으로 누적 기록
+PRICE_PROVIDER = os.environ.get("FINANCE_PRICE_PROVIDER", "live")
+FAKE_PROVIDER_URL = os.environ.get("FINANCE_FAKE_PROVIDER_URL", "http://127.0.0.1:8765")
+QUOTE_RECORDING_PATH = os.environ.get("FINANCE_QUOTE_RECORDING")
+
+# 가상자산 실시간 체결 스트림 (선택, websockets 패키지 필요) — Binance miniTicker 형식 웹소켓.
+# 가상자산 페이지의 "실시간 시세" 토글 기본값 / 접속 주소 / 시세 기준 통화 / 화면 갱신 주기(초).
+# 로컬 대역 서버는 service/fake_ticker_server.py (FINANCE_CRYPTO_STREAM_URL=ws://127.0.0.1:8766)
+CRYPTO_STREAM = {
+    "enabled": os.environ.get("FINANCE_CRYPTO_STREAM", "0") == "1",
+    "url": os.environ.get("FINANCE_CRYPTO_STREAM_URL", "wss://stream.binance.com:9443/ws"),
+    "quote": "USDT",
+    "refresh": 2,
+}
+
+# 시세 영구 저장소 (SQLite) — 재시작 후에도 마지막 시세를 즉시 제공
+QUOTE_DB_PATH = ".cache/quotes.sqlite3"
+
+# KRX 상장 목록 CSV (선택) — 종목코드·시장구분 컬럼으로 .KS/.KQ 접미사 초기 추정에 사용.
+# 파일이 없으면 .KS부터 시도하고, 실제 조회로 확인된 접미사는 시세 저장소에 기록됨.
+KRX_LISTING_PATH = "data/krx_listing.csv"
+
+# 백그라운드 시세 갱신 주기(초) — CACHE_TTL보다 짧게 두어 만료 전에 미리 갱신
+REFRESH_INTERVALS = {
+    "fx": 540,
+    "kr": 540,
+    "us": 540,
+    "crypto": 240,
+    "history": 3600,  # 일별 이력 — 종목별 재확인 간격은 HISTORY_RECHECK
+}
+
+# 일별 OHLCV 이력 저장소 (Parquet) — 최초 백필 기간(일) / 종목별 추가분 재확인 간격(초)
+HISTORY_DIR = ".cache/history"
+HISTORY_BACKFILL_DAYS = 365 * 5
+HISTORY_RECHECK = 12 * 3600
+# 서버 시작 후 첫 이력 갱신까지 대기(초) — 시작 직후 시세 조회·캐시 예열과 호출 예산을 다투지 않도록
+HISTORY_START_DELAY = 600
+
+# 시세 제공자별 서킷 브레이커 — 연속 실패 횟수 / 차단 후 재시도까지 대기(초)
+CIRCUIT_BREAKER = {
+    "failure_threshold": 3,
+    "reset_timeout": 60,
+}
+
+# 조회 실패 종목(상장폐지 코드 등) 재시도 금지 시간(초)
+NEGATIVE_CACHE_TTL = 300
+
+# CoinGecko 호출 예산 — 분당 요청 수(무료 한도보다 여유 있게) / 토큰 대기 최대 시간(초) /
+# 이력 백필이 건드리지 않고 화면 시세용으로 남겨 두는 토큰 수 (이력은 남은 토큰이 이보다 많을 때만 사용)
+COINGECKO_RATE = {
+    "per_minute": 25,
+    "max_wait": 5,
+    "history_reserve": 15,
 }
@@ -1,18 +1,15 @@
 import streamlit as st
 import pandas as pd
 import plotly.express as px
-import gspread
 from ui.formatters import apply_krw_hover
 from config import SHEET_NAMES
-from service.sheets import load_sheet_data
+from service.sheets import has_worksheet, load_sheet_data
 
 
 def render(spreadsheet):
     st.subheader("📊 국내 배당 차트")
 
-    try:
-        sheet = spreadsheet.worksheet(SHEET_NAMES["domestic_div"])
-    except gspread.exceptions.WorksheetNotFound:
+    if not has_worksheet(spreadsheet, SHEET_NAMES["domestic_div"]):
         st.info("'국내배당' 시트가 아직 없습니다. 테이블 메뉴의 '국내 배당' 화면에서 시트 구성 가이드를 확인하세요.")
         return
 
@@ -1,17 +1,14 @@
 import streamlit as st
 import pandas as pd
-import gspread
 from ui.formatters import fmt_num, fmt_pct
 from config import SHEET_NAMES
-from service.sheets import load_sheet_data
+from service.sheets import has_worksheet, load_sheet_data
 
 
 def render(spreadsheet):
     st.subheader("📋 국내 배당 테이블")
 
-    try:
-        sheet = spreadsheet.worksheet(SHEET_NAMES["domestic_div"])
-    except gspread.exceptions.WorksheetNotFound:
+    if not has_worksheet(spreadsheet, SHEET_NAMES["domestic_div"]):
         st.info("'국내배당' 시트가 아직 없습니다. Google Sheets에 해당 시트를 추가하면 이 화면에 표시됩니다.")
         st.markdown("""
         **권장 컬럼 구성 (시트명: `국내배당`)**
@@ -1,19 +1,16 @@
 import streamlit as st
 import pandas as pd
-import gspread
 from ui.formatters import fmt_num, fmt_num2, fmt_pct
 from ui.components import exchange_rate_header
 from config import SHEET_NAMES
-from service.sheets import load_sheet_data
+from service.sheets import has_worksheet, load_sheet_data
 
 
 def render(spreadsheet, get_usdkrw):
     usdkrw = get_usdkrw()
     exchange_rate_header("📋 해외 배당 테이블", usdkrw)
 
-    try:
-        sheet = spreadsheet.worksheet(SHEET_NAMES["overseas_div"])
-    except gspread.exceptions.WorksheetNotFound:
+    if not has_worksheet(spreadsheet, SHEET_NAMES["overseas_div"]):
         st.info("'해외배당' 시트가 아직 없습니다. Google Sheets에 해당 시트를 추가하면 이 화면에 표시됩니다.")
         st.markdown("""
         **권장 컬럼 구성 (시트명: `해외배당`)**
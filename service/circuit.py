@@ -0,0 +1,108 @@
+import threading
+import time
+
+from config import CIRCUIT_BREAKER, NEGATIVE_CACHE_TTL
+
+# 저장소 namespace → 시세 제공자
+PROVIDER_OF = {
+    "kr": "yahoo",
+    "us": "yahoo",
+    "fx": "yahoo",
+    "futures": "yahoo",
+    "crypto": "coingecko",
+}
+
+PROVIDER_LABELS = {
+    "yahoo": "Yahoo Finance",
+    "coingecko": "CoinGecko",
+}
+
+
+class CircuitBreaker:
+    """
+    제공자 단위 차단기.
+    연속 failure_threshold회 실패하면 열림(open) — reset_timeout초 동안 요청을 보내지 않음.
+    이후 한 번의 시험 요청(half-open)이 성공하면 닫힘, 실패하면 다시 열림.
+    """
+
+    def __init__(self, failure_threshold, reset_timeout):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at = None
+        self._trial_running = False
+
+    @property
+    def is_open(self):
+        with self._lock:
+            return self._opened_at is not None and time.monotonic() - self._opened_at < self.reset_timeout
+
+    def allow(self):
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if time.monotonic() - self._opened_at < self.reset_timeout or self._trial_running:
+                return False
+            self._trial_running = True  # half-open: 시험 요청 1건만 허용
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_running = False
+
+    def release(self):
+        """성공·실패 판정 없이 끝난 시험 요청 (호출 예산 소진 등) — 다음 요청이 다시 시험하도록"""
+        with self._lock:
+            self._trial_running = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._trial_running or self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+            self._trial_running = False
+
+
+class NegativeCache:
+    """조회에 실패한 키를 ttl초 동안 기억해 같은 요청을 반복하지 않음."""
+
+    def __init__(self, ttl):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._until = {}
+
+    def add(self, keys):
+        expires = time.monotonic() + self.ttl
+        with self._lock:
+            for key in keys:
+                self._until[key] = expires
+
+    def discard(self, keys):
+        with self._lock:
+            for key in keys:
+                self._until.pop(key, None)
+
+    def filter(self, keys):
+        """아직 실패 기록이 유효하지 않은 키만 반환"""
+        now = time.monotonic()
+        with self._lock:
+            return [k for k in keys if self._until.get(k, 0) <= now]
+
+
+breakers = {
+    provider: CircuitBreaker(CIRCUIT_BREAKER["failure_threshold"], CIRCUIT_BREAKER["reset_timeout"])
+    for provider in PROVIDER_LABELS
+}
+negative_cache = NegativeCache(NEGATIVE_CACHE_TTL)
+
+
+def breaker_for(namespace):
+    return breakers.get(PROVIDER_OF.get(namespace))
+
+
+def open_providers():
+    """현재 차단 중인 제공자 표시명 리스트"""
+    return [PROVIDER_LABELS[p] for p, b in breakers.items() if b.is_open]
@@ -0,0 +1,115 @@
+import pandas as pd
+
+from config import COINGECKO_RATE
+from service import http_client
+from service.rate_limit import Throttled, TokenBucket, retry_after_seconds
+
+SIMPLE_PRICE_URL = "https://api.coingecko.com/api/v3/simple/price"
+MARKET_CHART_URL = "https://api.coingecko.com/api/v3/coins/{id}/market_chart"
+
+# 요청 1건의 ids 파라미터 최대 길이 — URL 길이 제한을 넘지 않도록 나눠서 요청
+_MAX_IDS_CHARS = 1500
+
+# 공개 API가 제공하는 일별 이력 최대 기간(일)
+MAX_HISTORY_DAYS = 365
+
+# CoinGecko 분당 호출 예산 (프로세스 공통 — 모든 세션이 같은 예산을 나눠 씀)
+_limiter = TokenBucket(COINGECKO_RATE["per_minute"])
+
+
+def _chunks(ids):
+    chunk, size = [], 0
+    for i in ids:
+        if chunk and size + len(i) + 1 > _MAX_IDS_CHARS:
+            yield chunk
+            chunk, size = [], 0
+        chunk.append(i)
+        size += len(i) + 1
+    if chunk:
+        yield chunk
+
+
+def simple_prices(ids, url=SIMPLE_PRICE_URL, limiter=_limiter):
+    """
+    /simple/price 일괄 조회.
+    반환: {id: {"usd", "krw", "usd_24h_change", "krw_24h_change", "last_updated_at"}} (변동률은 %)
+    토큰을 확보한 조각만 요청. 토큰이 없으면 COINGECKO_RATE["max_wait"]초까지 대기하고,
+    429 응답이면 Retry-After 동안 예산을 멈춘 뒤 (대기 가능한 범위면) 한 번 더 요청.
+    예산 때문에 보내지 못한 조각이 남으면 받은 값만 담아 Throttled.
+    """
+    data = {}
+    pending = list(_chunks(ids))
+    for _ in range(2):
+        allowed = [c for c in pending if limiter.acquire(COINGECKO_RATE["max_wait"])]
+        if not allowed:
+            break
+        calls = [(url, {
+            "ids": ",".join(c), "vs_currencies": "usd,krw",
+            "include_24hr_change": "true", "include_last_updated_at": "true",
+        }) for c in allowed]
+
+        pending = []
+        for chunk, res in zip(allowed, http_client.get_many(calls)):
+            if isinstance(res, Exception):
+                continue
+            if res.status_code == 429:
+                limiter.pause(retry_after_seconds(res))
+                pending.append(chunk)
+                continue
+            if res.status_code != 200:
+                continue
+            body = res.json()
+            if isinstance(body, dict):
+                data.update(body)
+        if not pending:
+            break
+    result = {i: data[i] for i in ids if data.get(i)}
+    if pending:
+        raise Throttled(result)
+    return result
+
+
+def price_24h_ago(info, currency):
+    """simple_prices 항목의 24시간 전 가격 (currency: "usd" | "krw") — 변동률이 없으면 None"""
+    price, change = (info or {}).get(currency), (info or {}).get(f"{currency}_24h_change")
+    if price is None or change is None or change <= -100:
+        return None
+    return price / (1 + change / 100)
+
+
+def market_chart(coin_id, days):
+    """
+    일별 USD 종가·거래량 (최근 days일, 최대 MAX_HISTORY_DAYS).
+    화면 시세와 호출 예산을 공유하되 우선순위가 낮음 — 남은 토큰이 history_reserve 이하면 기다리지 않고 None.
+    실패해도 None.
+    반환: DataFrame(index=날짜, columns=["Close", "Volume"])
+    """
+    if not _limiter.acquire(reserve=COINGECKO_RATE["history_reserve"]):
+        return None
+    params = {"vs_currency": "usd", "days": min(int(days), MAX_HISTORY_DAYS), "interval": "daily"}
+    try:
+        res = http_client.get(MARKET_CHART_URL.format(id=coin_id), params)
+    except Exception:
+        return None
+    if res.status_code == 429:
+        _limiter.pause(retry_after_seconds(res))
+        return None
+    if res.status_code != 200:
+        return None
+
+    body = res.json()
+    prices, volumes = body.get("prices") or [], body.get("total_volumes") or []
+    if not prices:
+        return None
+    close = pd.Series({ts: p for ts, p in prices}, dtype=float)
+    volume = pd.Series({ts: v for ts, v in volumes}, dtype=float)
+    frame = pd.DataFrame({"Close": close, "Volume": volume})
+    frame.index = pd.to_datetime(frame.index, unit="ms").normalize()
+    frame.index.name = "Date"
+    # 당일 값은 장중 스냅샷이 섞여 들어오므로 날짜별 마지막 값만 유지
+    return frame[~frame.index.duplicated(keep="last")]
+
+
+def throttled():
+    """CoinGecko 호출 예산이 소진됐거나 Retry-After 대기 중인지"""
+    return _limiter.exhausted
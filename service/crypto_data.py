@@ -1,30 +1,74 @@
-import requests
+import threading
+
 import streamlit as st
+from config import CACHE_TTL
+from service import quote_store, providers, coingecko, overrides
+from service.fx import get_usdkrw
+
+# 마지막 정상 시세 (프로세스 공통) — 예산 소진·오류 시 세션과 무관하게 이 값으로 응답
+_last_good = {}
+_last_good_lock = threading.Lock()
+
+# 지금까지 요청된 전체 코인 id (프로세스 공통). 어떤 부분집합을 요청해도 이 전체 집합을 한 번에 조회·캐시함.
+_universe = set()
+_universe_lock = threading.Lock()
+
+# 시트의 빈 칸이 문자열로 바뀐 값 — 코인 id로 조회하지 않음
+_BLANK_IDS = {"", "nan", "none"}
 
 
 # -------------------------------
 # 가상자산 (CoinGecko)
 # -------------------------------
-@st.cache_data(ttl=300)
+def crypto_ids(values):
+    """시트의 coingecko_id 값 → 조회할 id 튜플 (빈 값·NaN 제외, 소문자, 중복 제거·순서 유지)"""
+    ids = (str(v).strip().lower() for v in values if v is not None and v == v)
+    return tuple(dict.fromkeys(i for i in ids if i not in _BLANK_IDS))
+
+
+def _register(ids):
+    with _universe_lock:
+        _universe.update(crypto_ids(ids))
+        return tuple(sorted(_universe))
+
+
+@st.cache_data(ttl=CACHE_TTL["memo"])
+def _get_universe_prices(universe):
+    return quote_store.get_many("crypto", universe, providers.crypto_prices, CACHE_TTL["crypto"])
+
+
 def get_crypto_prices(ids):
-    try:
-        if not ids:
-            return {}
+    """
+    CoinGecko 시세 (저장소 우선, 오래된 값은 즉시 반환 후 백그라운드 갱신).
+    필터로 좁혀진 부분집합·순서와 관계없이 보유 코인 전체 집합 하나로 캐시하고,
+    요청한 id만 골라 반환. 수동 시세(overrides)는 캐시 뒤에서 덮어씀.
+    한 번도 조회된 적 없는 코인까지 모두 실패하면 None.
+    """
+    if not ids:
+        return {}
+    prices = _get_universe_prices(_register(ids))
+    with _last_good_lock:
+        _last_good.update(prices)
+        result = {i: prices.get(i) or _last_good[i] for i in ids if i in prices or i in _last_good}
+    if overrides.get_overrides("crypto"):
+        manual = overrides.apply_crypto({}, get_usdkrw())
+        result.update({i: manual[i] for i in ids if i in manual})
+    return result or None
+
+
+def price_24h_ago(info, currency):
+    """get_crypto_prices 항목의 24시간 전 가격 (currency: "KRW" | "USD") — 변동률이 없으면 None"""
+    return coingecko.price_24h_ago(info, str(currency).lower())
 
-        res = requests.get(
-            "https://api.coingecko.com/api/v3/simple/price",
-            params={"ids": ",".join(ids), "vs_currencies": "usd,krw"},
-            timeout=10
-        )
 
-        if res.status_code != 200:
-            return None
+def coingecko_throttled():
+    """CoinGecko 호출 예산이 소진됐거나 Retry-After 대기 중인지"""
+    return coingecko.throttled()
 
-        data = res.json()
-        if not isinstance(data, dict) or not data:
-            return None
 
-        return data
+def refresh_crypto_prices(ids, lead=0):
+    """만료가 lead초 이내로 남은 시세를 저장소에 직접 갱신 (백그라운드 갱신 스레드용)"""
+    ids = quote_store.stale_names("crypto", _register(ids), CACHE_TTL["crypto"] - lead)
+    if ids:
+        quote_store.refresh("crypto", ids, providers.crypto_prices)
 
-    except Exception:
-        return None
@@ -0,0 +1,168 @@
+import asyncio
+import atexit
+import itertools
+import json
+import logging
+import threading
+import time
+
+import streamlit as st
+
+from config import CRYPTO_STREAM
+
+try:
+    import websockets
+except ImportError:  # 선택 의존성 — 없으면 실시간 모드만 꺼지고 REST 시세로 동작
+    websockets = None
+
+logger = logging.getLogger(__name__)
+
+# 가상자산 실시간 체결 스트림.
+# 프로세스당 스레드 하나가 거래소 웹소켓(Binance miniTicker 형식)을 구독해
+# 심볼별 최신 체결가를 공유 메모리 표(PriceTable)에 씀. 가상자산 페이지는 REST 시세로 한 번 평가한 뒤
+# 이 표에서 바뀐 심볼만 골라 해당 행과 합계만 다시 계산함 (전체 rerun·CoinGecko 호출 없음).
+# 가격은 CRYPTO_STREAM["quote"](USDT) 기준 — USD 시세로 취급.
+
+
+def available():
+    return websockets is not None
+
+
+class PriceTable:
+    """
+    심볼별 최신 체결가 (스트림 스레드가 쓰고 렌더가 읽음).
+    갱신마다 버전이 올라가므로 읽는 쪽은 마지막으로 본 버전 이후 바뀐 심볼만 받아갈 수 있음.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._prices = {}  # 심볼 → (가격, 체결 시각, 버전)
+        self._version = 0
+
+    def update(self, symbol, price, ts=None):
+        with self._lock:
+            current = self._prices.get(symbol)
+            if current and current[0] == price:
+                return
+            self._version += 1
+            self._prices[symbol] = (price, ts or time.time(), self._version)
+
+    def get(self, symbol):
+        with self._lock:
+            entry = self._prices.get(symbol)
+        return entry[0] if entry else None
+
+    def changes_since(self, version):
+        """version 이후 바뀐 {심볼: 가격}과 현재 버전"""
+        with self._lock:
+            changed = {s: p for s, (p, _, v) in self._prices.items() if v > version}
+            return changed, self._version
+
+    @property
+    def last_update(self):
+        with self._lock:
+            return max((ts for _, ts, _ in self._prices.values()), default=None)
+
+
+class CryptoStream:
+    """
+    웹소켓 체결 스트림 구독 스레드.
+    subscribe로 넘긴 심볼은 연결 중이면 바로 SUBSCRIBE 메시지로 추가되고,
+    연결이 끊기면 지수 백오프로 재접속하면서 전체 심볼을 다시 구독함.
+    """
+
+    def __init__(self, url=CRYPTO_STREAM["url"], quote=CRYPTO_STREAM["quote"]):
+        self.url = url
+        self.quote = quote.upper()
+        self.table = PriceTable()
+        self.connected = False
+        self._wanted = set()
+        self._subscribed = set()
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True, name="crypto-stream")
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self, timeout=5):
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join(timeout)
+
+    def subscribe(self, symbols):
+        """코인 심볼(BTC, ETH …) 구독 추가 — 기준 통화 자체(USDT)는 제외"""
+        symbols = {str(s).strip().upper() for s in symbols if s and str(s).strip()}
+        symbols.discard(self.quote)
+        with self._lock:
+            self._wanted |= symbols
+
+    def _pending(self):
+        with self._lock:
+            pending = self._wanted - self._subscribed
+            self._subscribed |= pending
+        return sorted(pending)
+
+    def _stream_name(self, symbol):
+        return f"{symbol}{self.quote}".lower() + "@miniTicker"
+
+    def _handle(self, raw):
+        msg = json.loads(raw)
+        data = msg.get("data", msg)  # /stream?streams=… 결합 스트림 형식도 허용
+        if not isinstance(data, dict) or data.get("e") != "24hrMiniTicker":
+            return
+        pair = str(data.get("s", "")).upper()
+        if not pair.endswith(self.quote):
+            return
+        try:
+            price = float(data["c"])
+        except (KeyError, TypeError, ValueError):
+            return
+        ts = data.get("E")
+        self.table.update(pair[:-len(self.quote)], price, ts / 1000 if ts else None)
+
+    async def _consume(self):
+        async with websockets.connect(self.url, ping_interval=20) as ws:
+            self.connected = True
+            with self._lock:
+                self._subscribed = set()
+            try:
+                while not self._stop.is_set():
+                    pending = self._pending()
+                    if pending:
+                        await ws.send(json.dumps({
+                            "method": "SUBSCRIBE",
+                            "params": [self._stream_name(s) for s in pending],
+                            "id": next(self._ids),
+                        }))
+                    try:
+                        raw = await asyncio.wait_for(ws.recv(), timeout=1)
+                    except asyncio.TimeoutError:
+                        continue
+                    self._handle(raw)
+            finally:
+                self.connected = False
+
+    def _run(self):
+        backoff = 1
+        while not self._stop.is_set():
+            started = time.monotonic()
+            try:
+                asyncio.run(self._consume())
+            except Exception:
+                logger.warning("가상자산 스트림 연결 끊김 (%s)", self.url, exc_info=True)
+            # 한동안 잘 붙어 있었으면 백오프 초기화
+            backoff = 1 if time.monotonic() - started > 60 else min(backoff * 2, 30)
+            self._stop.wait(backoff)
+
+
+@st.cache_resource(show_spinner=False)
+def get_stream():
+    """서버 프로세스당 한 번만 스트림 스레드를 시작 (websockets 미설치면 None)"""
+    if not available():
+        return None
+    stream = CryptoStream().start()
+    atexit.register(stream.stop)
+    return stream
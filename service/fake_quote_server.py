@@ -0,0 +1,169 @@
+"""
+시세 제공자 로컬 대역 서버 — 기록된 시세를 지연·오류를 섞어 재생.
+
+    python -m service.fake_quote_server --recording .cache/quote_recording.json \
+        --latency 0.4 --jitter 0.2 --error-rate 0.05 --throttle-rate 0.02
+
+대시보드는 FINANCE_PRICE_PROVIDER=fake (FINANCE_FAKE_PROVIDER_URL로 주소 변경)로 실행.
+기록 파일은 FINANCE_QUOTE_RECORDING=경로 로 실제 API에 붙여 한 번 실행하면 만들어짐:
+    {"quotes": {"005930.KS": {"price": 71000.0, "prev_close": 70500.0}, ...},
+     "crypto": {"bitcoin": {"usd": .., "krw": ..}, ...}}
+예전 형식의 "closes": {심볼: 가격}도 읽으며, 이때는 기록된 가격을 전일 종가로 씀.
+기록에 없는 심볼은 --missing 비율에 따라 임의 가격 또는 null로 응답.
+"""
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+
+class QuoteReplay:
+    """기록된 시세 + 지연·오류 설정. 요청마다 가격을 drift 범위 안에서 흔들어 갱신처럼 보이게 함."""
+
+    def __init__(self, recording, latency=0.3, jitter=0.1, error_rate=0.0, throttle_rate=0.0,
+                 missing=0.0, drift=0.002, seed=None):
+        self.closes = dict(recording.get("closes") or {})
+        self.prev_closes = dict(self.closes)
+        for symbol, q in (recording.get("quotes") or {}).items():
+            self.closes[symbol] = q["price"]
+            if q.get("prev_close") is not None:
+                self.prev_closes[symbol] = q["prev_close"]
+        self.crypto = dict(recording.get("crypto") or {})
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.missing = missing
+        self.drift = drift
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def _random(self):
+        with self._lock:
+            return self._rng.random()
+
+    def delay(self):
+        with self._lock:
+            wait = self.latency + self._rng.uniform(-self.jitter, self.jitter)
+        time.sleep(max(0.0, wait))
+
+    def outcome(self):
+        """"throttle" | "error" | "ok" """
+        r = self._random()
+        if r < self.throttle_rate:
+            return "throttle"
+        if r < self.throttle_rate + self.error_rate:
+            return "error"
+        return "ok"
+
+    def _jiggle(self, value):
+        return value * (1 + (self._random() * 2 - 1) * self.drift)
+
+    def close(self, symbol):
+        if symbol in self.closes:
+            return self._jiggle(self.closes[symbol])
+        if self._random() < self.missing:
+            return None
+        return round(10 + self._random() * 990, 2)
+
+    def quote(self, symbol):
+        """기록된 가격을 흔든 값을 현재가로, 기록된 전일 종가를 그대로"""
+        price = self.close(symbol)
+        if price is None:
+            return None
+        return {"price": price, "prev_close": self.prev_closes.get(symbol, price), "time": time.time()}
+
+    def crypto_price(self, coin_id):
+        info = self.crypto.get(coin_id)
+        if not info:
+            return None
+        result = {c: self._jiggle(info[c]) for c in ("usd", "krw") if isinstance(info.get(c), (int, float))}
+        for c in list(result):
+            result[f"{c}_24h_change"] = (result[c] / info[c] - 1) * 100
+        result["last_updated_at"] = int(time.time())
+        return result
+
+
+def make_handler(replay):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _send(self, status, body=None, headers=None):
+            payload = json.dumps(body if body is not None else {}).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            for k, v in (headers or {}).items():
+                self.send_header(k, v)
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def do_GET(self):
+            url = urlsplit(self.path)
+            query = {k: v[0] for k, v in parse_qs(url.query).items()}
+            replay.delay()
+
+            outcome = replay.outcome()
+            if outcome == "throttle":
+                return self._send(429, {"error": "rate limited"}, {"Retry-After": "5"})
+            if outcome == "error":
+                return self._send(503, {"error": "unavailable"})
+
+            names = [n for n in query.get("symbols", query.get("ids", "")).split(",") if n]
+            if url.path == "/quotes":
+                return self._send(200, {s: replay.quote(s) for s in names})
+            if url.path == "/simple/price":
+                prices = {i: replay.crypto_price(i) for i in names}
+                return self._send(200, {i: p for i, p in prices.items() if p})
+            return self._send(404, {"error": "not found"})
+
+        def log_message(self, fmt, *args):  # 요청마다 stderr 로그 찍지 않음
+            pass
+
+    return Handler
+
+
+def serve(replay, host="127.0.0.1", port=8765):
+    server = ThreadingHTTPServer((host, port), make_handler(replay))
+    server.daemon_threads = True
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="시세 제공자 로컬 대역 서버")
+    parser.add_argument("--recording", help="기록된 시세 JSON 경로")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.3, help="평균 응답 지연(초)")
+    parser.add_argument("--jitter", type=float, default=0.1, help="지연 ± 범위(초)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="503 응답 비율")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="429 응답 비율")
+    parser.add_argument("--missing", type=float, default=0.0, help="기록에 없는 심볼을 null로 응답할 비율")
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+
+    recording = {}
+    if args.recording:
+        with open(args.recording, encoding="utf-8") as f:
+            recording = json.load(f)
+
+    replay = QuoteReplay(
+        recording, latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate, missing=args.missing, seed=args.seed,
+    )
+    server = serve(replay, args.host, args.port)
+    print(f"fake quote server on http://{args.host}:{args.port} "
+          f"({len(replay.closes)} quotes, {len(replay.crypto)} coins)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+가상자산 체결 스트림 로컬 대역 서버 — Binance miniTicker 형식으로 임의 보행 가격을 흘려보냄.
+
+    python -m service.fake_ticker_server --prices BTC=65000,ETH=3200 --interval 0.5 --drop-after 120
+
+대시보드는 FINANCE_CRYPTO_STREAM_URL=ws://127.0.0.1:8766 으로 실행 (websockets 패키지 필요).
+클라이언트가 SUBSCRIBE로 요청한 심볼만 interval마다 전송하고, --prices에 없는 심볼은 임의 가격에서 시작.
+--drop-after초가 지나면 연결을 끊어 재접속·재구독 경로를 확인할 수 있음.
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+
+import websockets
+
+
+class TickerReplay:
+    """심볼별 가격을 틱마다 drift 범위 안에서 임의 보행"""
+
+    def __init__(self, prices=None, quote="USDT", drift=0.001, seed=None):
+        self.prices = {k.upper(): float(v) for k, v in (prices or {}).items()}
+        self.quote = quote.upper()
+        self.drift = drift
+        self._rng = random.Random(seed)
+
+    def tick(self, pair):
+        symbol = pair[:-len(self.quote)] if pair.endswith(self.quote) else pair
+        price = self.prices.get(symbol)
+        if price is None:
+            price = round(1 + self._rng.random() * 999, 4)
+        price *= 1 + (self._rng.random() * 2 - 1) * self.drift
+        self.prices[symbol] = price
+        return {
+            "e": "24hrMiniTicker",
+            "E": int(time.time() * 1000),
+            "s": pair,
+            "c": f"{price:.8f}",
+        }
+
+
+def make_handler(replay, interval=1.0, drop_after=None):
+    async def handler(ws):
+        subscribed = set()
+
+        async def read_requests():
+            async for raw in ws:
+                msg = json.loads(raw)
+                pairs = {p.split("@")[0].upper() for p in msg.get("params") or []}
+                if msg.get("method") == "SUBSCRIBE":
+                    subscribed.update(pairs)
+                elif msg.get("method") == "UNSUBSCRIBE":
+                    subscribed.difference_update(pairs)
+                await ws.send(json.dumps({"result": None, "id": msg.get("id")}))
+
+        reader = asyncio.create_task(read_requests())
+        started = time.monotonic()
+        try:
+            while not reader.done():
+                for pair in sorted(subscribed):
+                    await ws.send(json.dumps(replay.tick(pair)))
+                if drop_after and time.monotonic() - started > drop_after:
+                    await ws.close()
+                    break
+                await asyncio.sleep(interval)
+        except websockets.ConnectionClosed:
+            pass
+        finally:
+            reader.cancel()
+
+    return handler
+
+
+async def serve(replay, host="127.0.0.1", port=8766, interval=1.0, drop_after=None):
+    async with websockets.serve(make_handler(replay, interval, drop_after), host, port):
+        print(f"fake ticker server on ws://{host}:{port} ({len(replay.prices)} symbols)")
+        await asyncio.Future()
+
+
+def _parse_prices(text):
+    prices = {}
+    for item in (text or "").split(","):
+        symbol, _, price = item.partition("=")
+        if symbol.strip() and price.strip():
+            prices[symbol.strip()] = float(price)
+    return prices
+
+
+def main():
+    parser = argparse.ArgumentParser(description="가상자산 체결 스트림 로컬 대역 서버")
+    parser.add_argument("--prices", help="시작 가격 (예: BTC=65000,ETH=3200)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--interval", type=float, default=1.0, help="틱 전송 간격(초)")
+    parser.add_argument("--drift", type=float, default=0.001, help="틱당 최대 변동률")
+    parser.add_argument("--drop-after", type=float, help="연결 후 강제 종료까지 시간(초)")
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+
+    replay = TickerReplay(_parse_prices(args.prices), drift=args.drift, seed=args.seed)
+    try:
+        asyncio.run(serve(replay, args.host, args.port, args.interval, args.drop_after))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+import pandas as pd
+import streamlit as st
+from config import CACHE_TTL
+from service import quote_store, market_calendar
+from service.providers import last_closes
+
+# 모든 환율은 USD 기준 쌍(USD{통화}=X)만 조회하고, 나머지 교차 환율은 USD를 거쳐 계산.
+# 통화가 늘어나도 조회는 yf.download 한 번이고, 환산 경로는 convert 하나.
+
+# 화면 헤더·기본 환산에 항상 쓰는 통화 (캐시 키를 안정적으로 유지하기 위해 항상 포함)
+BASE_CURRENCIES = ("USD", "JPY")
+
+# 시트 입력값 별칭 → ISO 통화 코드
+_ALIASES = {"원": "KRW", "KR": "KRW", "달러": "USD", "US": "USD", "엔": "JPY"}
+
+
+def _pair(currency):
+    return f"USD{currency}=X"
+
+
+def _policy(lead=0):
+    return market_calendar.policy("fx", CACHE_TTL["market"] - lead)
+
+
+def normalize_currencies(currencies):
+    """
+    통화 목록을 대문자 ISO 코드 Series로 정규화 (Series면 인덱스 유지).
+    빈 값·NaN은 NaN으로 남김 — 문자열 "NAN"이 통화 코드로 조회되지 않도록.
+    """
+    s = currencies if isinstance(currencies, pd.Series) else pd.Series(list(currencies), dtype=object)
+    codes = s.map(lambda v: str(v).strip().upper() if pd.notna(v) else "")
+    codes = codes.replace(_ALIASES)
+    return codes.where(codes != "")
+
+
+def cash_currencies(currencies):
+    """현금성자산 통화 컬럼 정규화 — 통화를 비워 둔 행은 예전 계산처럼 USD로 간주"""
+    return normalize_currencies(currencies).fillna("USD")
+
+
+def _currency_set(currencies):
+    codes = set(normalize_currencies(currencies).dropna()) | set(BASE_CURRENCIES) | {"KRW"}
+    return tuple(sorted(c for c in codes if len(c) == 3 and c.isalpha()))
+
+
+@st.cache_data(ttl=CACHE_TTL["memo"])
+def _get_rate_matrix(currencies):
+    """
+    통화 튜플의 1단위당 KRW 환율. 반환: {통화: KRW 환율} (조회 실패 통화는 빠짐)
+    저장소에 없는 쌍만 한 번의 다운로드로 조회하고, 오래된 쌍은 백그라운드에서 일괄 갱신.
+    """
+    symbols = tuple(_pair(c) for c in currencies if c != "USD")
+    quotes = quote_store.get_many("fx", symbols, last_closes, _policy())
+
+    rates = {"KRW": 1.0}
+    usdkrw = quotes.get(_pair("KRW"))
+    if usdkrw is None:
+        return rates
+    rates["USD"] = usdkrw
+    for c in currencies:
+        per_usd = quotes.get(_pair(c))
+        if c not in rates and per_usd:
+            rates[c] = usdkrw / per_usd
+    return rates
+
+
+def get_fx_rates(currencies=()):
+    """통화별 1단위당 KRW 환율. 기본 통화(BASE_CURRENCIES)는 항상 포함."""
+    return _get_rate_matrix(_currency_set(currencies))
+
+
+def rate_series(currencies, to="KRW", rates=None):
+    """
+    통화 목록의 `to` 통화 환산 환율 Series (알 수 없는 통화·조회 실패는 NaN).
+    rates({통화: KRW 환율})를 주면 그 값으로만 계산 (PriceSnapshot 등 고정된 환율).
+    """
+    codes = normalize_currencies(currencies)
+    target = normalize_currencies([to]).iloc[0]
+    if rates is None:
+        rates = get_fx_rates(list(codes.unique()) + [target])
+    if target not in rates:
+        return pd.Series(float("nan"), index=codes.index)
+    return codes.map(rates).astype(float) / rates[target]
+
+
+def convert(amounts, currencies, to="KRW", rates=None):
+    """
+    금액 목록을 행별 통화에서 `to` 통화로 일괄 환산 (벡터 연산).
+    amounts/currencies가 같은 DataFrame의 컬럼이면 인덱스 기준으로 맞춰 계산.
+    """
+    rates = rate_series(currencies, to, rates)
+    if not isinstance(amounts, pd.Series):
+        amounts = pd.Series(list(amounts), index=rates.index)
+    return pd.to_numeric(amounts, errors="coerce") * rates
+
+
+def get_usdkrw():
+    return get_fx_rates().get("USD")
+
+
+def get_jpykrw():
+    return get_fx_rates().get("JPY")
+
+
+def pairs(currencies=()):
+    """통화 목록 환산에 필요한 Yahoo 환율 심볼 (USD{통화}=X)"""
+    return [_pair(c) for c in _currency_set(currencies) if c != "USD"]
+
+
+def refresh_fx(currencies=(), lead=0):
+    """만료가 lead초 이내로 남은 환율 쌍을 저장소에 직접 갱신 (백그라운드 갱신 스레드용)"""
+    stale = quote_store.stale_names("fx", pairs(currencies), _policy(lead))
+    if stale:
+        quote_store.refresh("fx", stale, last_closes)
@@ -0,0 +1,168 @@
+import datetime
+import logging
+import os
+import re
+import threading
+import time
+
+import pandas as pd
+import streamlit as st
+
+from config import CACHE_TTL, HISTORY_DIR, HISTORY_BACKFILL_DAYS, HISTORY_RECHECK
+from service import fx, krx_index
+from service.yahoo import OHLCV, download_history
+from service.coingecko import market_chart
+
+logger = logging.getLogger(__name__)
+
+# 보유 종목·환율의 일별 OHLCV 이력을 종목별 Parquet 파일로 보관.
+# 처음 한 번 HISTORY_BACKFILL_DAYS만큼 채운 뒤에는 마지막 저장일 이후만 일괄 다운로드해 덧붙임.
+# 파일 경로: HISTORY_DIR/{namespace}/{이름}.parquet (namespace는 quote_store와 동일: kr, us, fx, crypto)
+
+# 같은 파일을 동시에 덮어쓰지 않도록 (백그라운드 갱신과 수동 갱신이 겹칠 때)
+_write_lock = threading.Lock()
+
+
+def _path(namespace, name):
+    safe = re.sub(r"[^\w.=-]", "_", str(name))
+    return os.path.join(HISTORY_DIR, namespace, f"{safe}.parquet")
+
+
+# -------------------------------
+# 읽기
+# -------------------------------
+def read(namespace, name):
+    """저장된 일별 이력. 반환: DataFrame(index=날짜, columns=OHLCV) — 없으면 빈 DataFrame"""
+    path = _path(namespace, name)
+    if not os.path.exists(path):
+        return pd.DataFrame(columns=OHLCV, index=pd.DatetimeIndex([], name="Date"))
+    try:
+        return pd.read_parquet(path)
+    except Exception:
+        logger.exception("이력 파일 읽기 실패: %s", path)
+        return pd.DataFrame(columns=OHLCV, index=pd.DatetimeIndex([], name="Date"))
+
+
+@st.cache_data(ttl=CACHE_TTL["memo"], show_spinner=False)
+def load_closes(namespace, names):
+    """여러 종목의 일별 종가를 한 표로. 반환: DataFrame(index=날짜, columns=이름)"""
+    closes = {n: read(namespace, n)["Close"] for n in names}
+    closes = {n: s for n, s in closes.items() if not s.empty}
+    return pd.DataFrame(closes).sort_index() if closes else pd.DataFrame()
+
+
+def _last_date(namespace, name):
+    frame = read(namespace, name)
+    return frame.index.max().date() if not frame.empty else None
+
+
+# -------------------------------
+# 쓰기
+# -------------------------------
+def _append(namespace, name, frame):
+    """기존 이력에 새 행을 합쳐 원자적으로 저장 (같은 날짜는 새 값 우선)"""
+    path = _path(namespace, name)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with _write_lock:
+        merged = pd.concat([read(namespace, name), frame.reindex(columns=OHLCV)])
+        merged = merged[~merged.index.duplicated(keep="last")].sort_index()
+        tmp = f"{path}.tmp"
+        merged.to_parquet(tmp)
+        os.replace(tmp, path)
+
+
+def _touch(namespace, name):
+    path = _path(namespace, name)
+    if os.path.exists(path):
+        os.utime(path)
+
+
+def _due(namespace, names):
+    """파일이 없거나 마지막 확인 후 HISTORY_RECHECK초가 지난 이름"""
+    now = time.time()
+    due = []
+    for n in names:
+        path = _path(namespace, n)
+        if not os.path.exists(path) or now - os.path.getmtime(path) > HISTORY_RECHECK:
+            due.append(n)
+    return due
+
+
+# -------------------------------
+# 갱신
+# -------------------------------
+def _yahoo_symbols(namespace, names):
+    """저장 이름 → Yahoo 심볼 (국내는 krx_index가 확인한 접미사 사용)"""
+    if namespace == "kr":
+        return {code + suffix: code for code, (suffix, _) in krx_index.lookup(names).items()}
+    return {n: n for n in names}
+
+
+def _update_yahoo(namespace, names):
+    """
+    처음 받는 종목은 백필 시작일부터, 나머지는 가장 오래된 마지막 저장일부터
+    각각 yf.download 한 번으로 받아서 종목별 파일에 덧붙임.
+    마지막 저장일은 장중 값이었을 수 있으므로 다시 받아 덮어씀.
+    """
+    names = _due(namespace, names)
+    if not names:
+        return
+    symbols = _yahoo_symbols(namespace, names)
+    last = {sym: _last_date(namespace, name) for sym, name in symbols.items()}
+
+    backfill_start = datetime.date.today() - datetime.timedelta(days=HISTORY_BACKFILL_DAYS)
+    known = [d for d in last.values() if d]
+    groups = [
+        (backfill_start, [s for s, d in last.items() if d is None]),
+        (min(known) if known else None, [s for s, d in last.items() if d]),
+    ]
+    for start, group in groups:
+        if not group:
+            continue
+        frames = download_history(group, start=start.isoformat())
+        for sym in group:
+            frame = frames.get(sym)
+            if frame is not None and last[sym]:
+                frame = frame[frame.index.date >= last[sym]]
+            if frame is not None and not frame.empty:
+                _append(namespace, symbols[sym], frame)
+            else:
+                _touch(namespace, symbols[sym])
+
+
+def _update_crypto(ids):
+    """
+    CoinGecko는 일괄 이력 API가 없어 코인별로 조회.
+    화면 시세용 예산을 남겨 두므로 토큰이 모자라 건너뛴 코인은 다음 주기에 다시 시도.
+    """
+    today = datetime.date.today()
+    for coin_id in _due("crypto", ids):
+        last = _last_date("crypto", coin_id)
+        days = (today - last).days + 1 if last else HISTORY_BACKFILL_DAYS
+        frame = market_chart(coin_id, days)
+        if frame is None:
+            continue
+        if last:
+            frame = frame[frame.index.date >= last]
+        if frame.empty:
+            _touch("crypto", coin_id)
+        else:
+            _append("crypto", coin_id, frame)
+
+
+def update(inst):
+    """
+    collect_instruments 결과의 보유 종목·환율 이력을 최신으로 맞춤 (백그라운드 갱신 스레드용).
+    제공자 하나가 실패해도 나머지는 계속 갱신.
+    """
+    jobs = [
+        ("kr", lambda: _update_yahoo("kr", inst["kr"])),
+        ("us", lambda: _update_yahoo("us", inst["us"])),
+        ("fx", lambda: _update_yahoo("fx", fx.pairs(inst["currencies"]))),
+        ("crypto", lambda: _update_crypto(inst["crypto"])),
+    ]
+    for namespace, job in jobs:
+        try:
+            job()
+        except Exception:
+            logger.exception("%s 이력 갱신 실패", namespace)
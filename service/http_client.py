@@ -0,0 +1,61 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from config import HTTP_POOL_SIZE, HTTP_TIMEOUT
+
+# 호스트별 Session — 프로세스 전체에서 재사용해 TLS 연결(keep-alive)을 유지
+_sessions = {}
+_sessions_lock = threading.Lock()
+_executor = ThreadPoolExecutor(max_workers=HTTP_POOL_SIZE, thread_name_prefix="quote-http")
+
+
+def _session_for(url):
+    host = urlsplit(url).netloc
+    with _sessions_lock:
+        session = _sessions.get(host)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=HTTP_POOL_SIZE)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers.update({"accept": "application/json", "user-agent": "finance-dashboard"})
+            _sessions[host] = session
+    return session
+
+
+# -------------------------------
+# 비동기 API
+# -------------------------------
+async def fetch(url, params=None, timeout=HTTP_TIMEOUT):
+    """풀링된 Session으로 GET 요청. timeout 초과 시 asyncio.TimeoutError."""
+    loop = asyncio.get_running_loop()
+    session = _session_for(url)
+    call = loop.run_in_executor(_executor, lambda: session.get(url, params=params, timeout=timeout))
+    return await asyncio.wait_for(call, timeout)
+
+
+async def fetch_many(calls, timeout=HTTP_TIMEOUT):
+    """
+    여러 요청을 동시에 실행. calls: [(url, params), ...]
+    반환: 같은 순서의 Response 또는 예외 객체 리스트 (한 요청 실패가 나머지를 막지 않음)
+    """
+    return await asyncio.gather(
+        *(fetch(url, params, timeout) for url, params in calls),
+        return_exceptions=True,
+    )
+
+
+# -------------------------------
+# 동기 파사드 (Streamlit 렌더 함수용)
+# -------------------------------
+def get(url, params=None, timeout=HTTP_TIMEOUT):
+    return asyncio.run(fetch(url, params, timeout))
+
+
+def get_many(calls, timeout=HTTP_TIMEOUT):
+    return asyncio.run(fetch_many(calls, timeout))
@@ -0,0 +1,79 @@
+import csv
+import logging
+import os
+import threading
+
+from config import KRX_LISTING_PATH
+from service import quote_store
+
+logger = logging.getLogger(__name__)
+
+# 6자리 종목코드 → Yahoo 접미사(.KS 코스피 / .KQ 코스닥) 해석 인덱스.
+# 실제 조회로 확인된 접미사는 시세 저장소("krx" namespace)에 영구 저장하고,
+# 확인 전에는 KRX 상장 목록 파일(있으면)의 시장구분 → 기본값 .KS 순으로 추정.
+
+DEFAULT_SUFFIX = ".KS"
+SUFFIXES = (".KS", ".KQ")
+
+_MARKET_SUFFIX = {
+    "KOSPI": ".KS", "유가증권": ".KS", "유가증권시장": ".KS", "STK": ".KS",
+    "KOSDAQ": ".KQ", "코스닥": ".KQ", "KSQ": ".KQ",
+}
+
+_listing = None
+_listing_lock = threading.Lock()
+
+
+def _load_listing():
+    """KRX 상장 목록 CSV(종목코드·시장구분 컬럼)를 {코드: 접미사}로 한 번만 읽음. 파일이 없으면 빈 dict."""
+    global _listing
+    if _listing is None:
+        with _listing_lock:
+            if _listing is None:
+                _listing = _read_listing(KRX_LISTING_PATH)
+    return _listing
+
+
+def _read_listing(path):
+    if not path or not os.path.exists(path):
+        return {}
+    for encoding in ("utf-8-sig", "cp949"):  # KRX 정보데이터시스템 내려받기 파일은 cp949
+        try:
+            with open(path, newline="", encoding=encoding) as f:
+                rows = list(csv.DictReader(f))
+            break
+        except UnicodeDecodeError:
+            continue
+    else:
+        logger.warning("KRX 상장 목록 인코딩을 읽을 수 없음: %s", path)
+        return {}
+
+    listing = {}
+    for row in rows:
+        code = str(row.get("종목코드") or row.get("단축코드") or "").strip().zfill(6)
+        suffix = _MARKET_SUFFIX.get(str(row.get("시장구분") or "").strip().upper())
+        if code.strip("0") and suffix:
+            listing[code] = suffix
+    return listing
+
+
+def lookup(codes):
+    """
+    코드별 (접미사, 확인 여부). 반환: {코드: (".KS" | ".KQ", bool)}
+    확인된 값은 저장소, 아니면 상장 목록, 둘 다 없으면 DEFAULT_SUFFIX.
+    """
+    verified = {c: v for c, (v, _) in quote_store.read("krx", list(codes)).items() if v in SUFFIXES}
+    listing = _load_listing()
+    return {
+        c: (verified[c], True) if c in verified else (listing.get(c, DEFAULT_SUFFIX), False)
+        for c in codes
+    }
+
+
+def alternate(suffix):
+    return SUFFIXES[1] if suffix == SUFFIXES[0] else SUFFIXES[0]
+
+
+def learn(resolved):
+    """실제 시세가 조회된 {코드: 접미사}를 확인된 값으로 저장"""
+    quote_store.write("krx", resolved)
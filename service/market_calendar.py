@@ -0,0 +1,125 @@
+import datetime as dt
+from zoneinfo import ZoneInfo
+
+# -------------------------------
+# 거래소 세션 / 휴장일 (네트워크 조회 없이 번들 테이블 사용)
+# -------------------------------
+# 휴장일은 매년 거래소 공지 기준으로 추가. 테이블에 없는 연도는 주말만 휴장으로 처리.
+# 단축 거래일(조기 폐장)은 반영하지 않음 — 정규 마감 후 갱신되므로 값은 동일.
+_HOLIDAYS = {
+    "KRX": {
+        "2025-01-01", "2025-01-27", "2025-01-28", "2025-01-29", "2025-01-30",
+        "2025-03-03", "2025-05-01", "2025-05-05", "2025-05-06", "2025-06-03",
+        "2025-06-06", "2025-08-15", "2025-10-03", "2025-10-06", "2025-10-07",
+        "2025-10-08", "2025-10-09", "2025-12-25", "2025-12-31",
+        "2026-01-01", "2026-02-16", "2026-02-17", "2026-02-18", "2026-03-02",
+        "2026-05-01", "2026-05-05", "2026-05-25", "2026-06-03", "2026-08-17",
+        "2026-09-24", "2026-09-25", "2026-10-05", "2026-10-09", "2026-12-25",
+        "2026-12-31",
+    },
+    "NYSE": {
+        "2025-01-01", "2025-01-09", "2025-01-20", "2025-02-17", "2025-04-18",
+        "2025-05-26", "2025-06-19", "2025-07-04", "2025-09-01", "2025-11-27",
+        "2025-12-25",
+        "2026-01-01", "2026-01-19", "2026-02-16", "2026-04-03", "2026-05-25",
+        "2026-06-19", "2026-07-03", "2026-09-07", "2026-11-26", "2026-12-25",
+    },
+    "JPX": {
+        "2025-01-01", "2025-01-02", "2025-01-03", "2025-01-13", "2025-02-11",
+        "2025-02-24", "2025-03-20", "2025-04-29", "2025-05-05", "2025-05-06",
+        "2025-07-21", "2025-08-11", "2025-09-15", "2025-09-23", "2025-10-13",
+        "2025-11-03", "2025-11-24", "2025-12-31",
+        "2026-01-01", "2026-01-02", "2026-01-12", "2026-02-11", "2026-02-23",
+        "2026-03-20", "2026-04-29", "2026-05-04", "2026-05-05", "2026-05-06",
+        "2026-07-20", "2026-08-11", "2026-09-21", "2026-09-22", "2026-09-23",
+        "2026-10-12", "2026-11-03", "2026-11-23", "2026-12-31",
+    },
+}
+
+# 시장 → (시간대, 개장, 마감)
+_SESSIONS = {
+    "KRX":  (ZoneInfo("Asia/Seoul"),       dt.time(9, 0),  dt.time(15, 30)),
+    "NYSE": (ZoneInfo("America/New_York"), dt.time(9, 30), dt.time(16, 0)),
+    "JPX":  (ZoneInfo("Asia/Tokyo"),       dt.time(9, 0),  dt.time(15, 30)),
+}
+
+# 외환·금 선물: 뉴욕 기준 일요일 17:00 ~ 금요일 17:00 연속 거래
+_FX_TZ = ZoneInfo("America/New_York")
+_FX_ROLL = dt.time(17, 0)
+
+# 마감 직후 Yahoo 종가가 확정(지연 반영)될 때까지는 장중으로 간주
+_SETTLE = dt.timedelta(minutes=30)
+
+
+def _is_trading_day(market, day):
+    return day.weekday() < 5 and day.isoformat() not in _HOLIDAYS[market]
+
+
+def _last_settled_close(market, now):
+    """가장 최근 정규장 마감 + 확정 지연 시각 (now 이전). 장중이면 None."""
+    if market == "FX":
+        local = now.astimezone(_FX_TZ)
+        days_since_fri = (local.weekday() - 4) % 7
+        fri_close = dt.datetime.combine(local.date() - dt.timedelta(days=days_since_fri), _FX_ROLL, _FX_TZ)
+        reopen = fri_close + dt.timedelta(days=2)
+        if fri_close + _SETTLE <= now < reopen:
+            return fri_close + _SETTLE
+        return None
+
+    tz, open_t, close_t = _SESSIONS[market]
+    local = now.astimezone(tz)
+    if _is_trading_day(market, local.date()):
+        opened = dt.datetime.combine(local.date(), open_t, tz)
+        settled = dt.datetime.combine(local.date(), close_t, tz) + _SETTLE
+        if opened <= now < settled:
+            return None
+        if now >= settled:
+            return settled
+    day = local.date()
+    for _ in range(15):
+        day -= dt.timedelta(days=1)
+        if _is_trading_day(market, day):
+            return dt.datetime.combine(day, close_t, tz) + _SETTLE
+    return None
+
+
+def is_open(market, now=None):
+    now = now or dt.datetime.now(dt.timezone.utc)
+    return market is None or _last_settled_close(market, now) is None
+
+
+def max_age(market, base, now=None):
+    """
+    시세 허용 경과 시간(초).
+    장중(또는 24시간 시장)이면 base, 휴장 중이면 '마지막 마감 이후에 받은 값'까지 신선한 것으로 봄
+    — 즉 마감 후 한 번 갱신된 값은 다음 개장까지 다시 조회하지 않음.
+    """
+    if market is None:
+        return base
+    now = now or dt.datetime.now(dt.timezone.utc)
+    settled = _last_settled_close(market, now)
+    if settled is None:
+        return base
+    return (now - settled).total_seconds()
+
+
+# -------------------------------
+# 저장소 namespace / 심볼 → 시장
+# -------------------------------
+def market_of(namespace, symbol):
+    if namespace == "kr":
+        return "KRX"
+    if namespace in ("fx", "futures"):
+        return "FX"
+    if namespace == "us":
+        if "." not in symbol:
+            return "NYSE"
+        if symbol.endswith(".T"):
+            return "JPX"
+    return None  # 가상자산·미지원 거래소: 고정 TTL
+
+
+def policy(namespace, base):
+    """quote_store.get_many에 넘길 심볼별 max_age 함수"""
+    now = dt.datetime.now(dt.timezone.utc)
+    return lambda symbol: max_age(market_of(namespace, symbol), base, now)
@@ -1,64 +1,244 @@
-import yfinance as yf
 import streamlit as st
+from config import CACHE_TTL
+from service import quote_store, market_calendar, krx_index, overrides
+from service.fx import get_usdkrw
+from service.providers import last_close, quotes as fetch_quotes
 
-# -------------------------------
-# 환율
-# -------------------------------
-@st.cache_data(ttl=600)
-def get_usdkrw():
-    try:
-        data = yf.Ticker("USDKRW=X").history(period="5d")["Close"].dropna()
-        return float(data.iloc[-1]) if not data.empty else None
-    except Exception:
-        return None
+# 신선도는 quote_store가 관리 — 장중에는 CACHE_TTL["market"], 휴장 중에는 마감 후 받은 값을 다음 개장까지 유지
+# (market_calendar.policy). 오래된 값은 즉시 반환 후 백그라운드에서 갱신.
+# st.cache_data는 한 렌더 안의 반복 조회만 흡수하도록 짧게 유지.
 
 
-@st.cache_data(ttl=600)
-def get_jpykrw():
-    try:
-        data = yf.Ticker("JPYKRW=X").history(period="5d")["Close"].dropna()
-        return float(data.iloc[-1]) if not data.empty else None
-    except Exception:
-        return None
+def _policy(namespace, lead=0):
+    return market_calendar.policy(namespace, CACHE_TTL["market"] - lead)
 
 
 # -------------------------------
 # 금 시세
 # -------------------------------
-@st.cache_data(ttl=600)
+@st.cache_data(ttl=CACHE_TTL["memo"])
 def get_gold_price_krw_per_g():
-    try:
-        gold_data = yf.Ticker("GC=F").history(period="5d")["Close"].dropna()
-        usdkrw = get_usdkrw()
-        if gold_data.empty or usdkrw is None:
-            return None
-        return (float(gold_data.iloc[-1]) * usdkrw) / 31.1035
-    except Exception:
+    gold_usd = quote_store.get_one("futures", "GC=F", lambda: last_close("GC=F"), _policy("futures"))
+    usdkrw = get_usdkrw()
+    if gold_usd is None or usdkrw is None:
         return None
+    return (gold_usd * usdkrw) / 31.1035
 
 
 # -------------------------------
 # 국내 주식 / 금
 # -------------------------------
-@st.cache_data(ttl=600)
-def get_kr_price(ticker, name, gold_override):
-    try:
-        if name == "금현물" or str(ticker).upper() == "GOLD":
-            return float(gold_override) if gold_override > 0 else get_gold_price_krw_per_g()
-
-        data = yf.Ticker(f"{str(ticker).zfill(6)}.KS").history(period="1d")["Close"]
-        return float(data.iloc[-1]) if not data.empty else None
-    except Exception:
-        return None
+def get_kr_price(ticker, name):
+    return get_kr_prices([ticker], [name])[0]
+
+
+# -------------------------------
+# 국내 주식 일괄 조회
+# -------------------------------
+def kr_code(ticker):
+    return str(ticker).strip().zfill(6)
+
+
+def is_gold(ticker, name):
+    return name == "금현물" or str(ticker).upper() == "GOLD"
+
+
+def kr_codes(tickers, names):
+    """조회 대상 국내 종목코드 튜플 (금현물·빈 코드 제외, 정렬). get_kr_quotes 캐시 키로 사용."""
+    return tuple(sorted({
+        kr_code(t) for t, n in zip(tickers, names)
+        if not is_gold(t, n) and str(t).strip("0 ")
+    }))
+
+
+def has_gold(tickers, names):
+    return any(is_gold(t, n) for t, n in zip(tickers, names))
+
+
+def _as_quote(value):
+    """저장소 값을 시세 dict로 (이전 형식의 숫자 하나짜리 값은 현재가만 있는 시세로)"""
+    if isinstance(value, dict):
+        return value
+    return {"price": value, "prev_close": None, "time": None} if value is not None else None
+
+
+def _fetch_kr_quotes(codes):
+    """
+    종목코드별 시세 조회. 반환: {코드: {"price", "prev_close", "time"}}
+    krx_index가 아는 접미사로 한 번에 받고, 아직 확인되지 않은 코드 중 실패한 것만
+    다른 접미사(.KS↔.KQ)로 한 번 더 받음. 시세가 나온 접미사는 인덱스에 확인값으로 저장.
+    """
+    resolved = krx_index.lookup(codes)
+    prices, learned = {}, {}
+
+    symbols = {c + suffix: c for c, (suffix, _) in resolved.items()}
+    for sym, quote in fetch_quotes(tuple(symbols)).items():
+        if quote is not None:
+            prices[symbols[sym]] = quote
+
+    retry = {
+        c + krx_index.alternate(suffix): c
+        for c, (suffix, verified) in resolved.items()
+        if c not in prices and not verified
+    }
+    if retry:
+        for sym, quote in fetch_quotes(tuple(retry)).items():
+            if quote is not None:
+                prices[retry[sym]] = quote
+                learned[retry[sym]] = krx_index.alternate(resolved[retry[sym]][0])
+
+    learned.update({c: resolved[c][0] for c in prices if c not in learned and not resolved[c][1]})
+    krx_index.learn(learned)
+    return prices
+
+
+@st.cache_data(ttl=CACHE_TTL["memo"])
+def get_kr_quotes(codes):
+    """
+    6자리 종목코드 튜플의 시세. 반환: {코드: {"price": 현재가, "prev_close": 전일 종가, "time": 기준 시각}}
+    저장소에 없는 코드만 한 번의 다운로드로 조회하고, 오래된 코드는 백그라운드에서 일괄 갱신.
+    """
+    if not codes:
+        return {}
+    stored = quote_store.get_many("kr", codes, _fetch_kr_quotes, _policy("kr"))
+    return {c: _as_quote(v) for c, v in stored.items()}
+
+
+def _kr_row_quotes(tickers, names):
+    tickers, names = list(tickers), list(names)
+    quotes = overrides.apply_kr(get_kr_quotes(kr_codes(tickers, names)))
+
+    gold = None
+    if has_gold(tickers, names):
+        gold = {"price": overrides.get_override("kr", overrides.GOLD) or get_gold_price_krw_per_g()}
+
+    return [gold if is_gold(t, n) else quotes.get(kr_code(t)) or {} for t, n in zip(tickers, names)]
+
+
+def get_kr_prices(tickers, names):
+    """
+    행 단위 종목코드/종목명 목록의 현재가 리스트 반환.
+    금현물은 금 시세, 나머지는 get_kr_quotes 일괄 조회 결과를 사용하고 수동 시세(overrides)를 덮어씀.
+    코드 튜플을 정렬해 넘기므로 같은 시트를 쓰는 화면끼리 캐시를 공유함.
+    """
+    return [q.get("price") for q in _kr_row_quotes(tickers, names)]
+
+
+def get_kr_prev_closes(tickers, names):
+    """get_kr_prices와 같은 행 순서의 전일 종가 (같은 일괄 조회 결과 — 추가 호출 없음, 금·수동 시세는 None)"""
+    return [q.get("prev_close") for q in _kr_row_quotes(tickers, names)]
 
 
 # -------------------------------
 # 해외 주식
 # -------------------------------
-@st.cache_data(ttl=600)
 def get_us_price(ticker):
-    try:
-        data = yf.Ticker(ticker).history(period="1d")["Close"]
-        return float(data.iloc[-1]) if not data.empty else None
-    except Exception:
-        return None
+    return get_us_prices([ticker])[0][0]
+
+
+# -------------------------------
+# 해외 주식 일괄 조회
+# -------------------------------
+# Yahoo 심볼 접미사 → 거래 통화 (접미사 없음 = 미국 상장 USD)
+_SUFFIX_CURRENCY = {
+    ".T": "JPY",
+    ".HK": "HKD",
+    ".SS": "CNY",
+    ".SZ": "CNY",
+    ".TW": "TWD",
+    ".AX": "AUD",
+    ".TO": "CAD",
+    ".DE": "EUR",
+    ".PA": "EUR",
+    ".AS": "EUR",
+    ".KS": "KRW",
+    ".KQ": "KRW",
+}
+
+
+def trading_currency(symbol):
+    if "." not in symbol:
+        return "USD"
+    return _SUFFIX_CURRENCY.get(symbol[symbol.rfind("."):])
+
+
+def trading_currencies(symbols):
+    """심볼 목록의 거래 통화 집합 (환율 일괄 조회 대상)"""
+    return {c for c in map(trading_currency, symbols) if c}
+
+
+def us_symbol(ticker):
+    return str(ticker).strip().upper()
+
+
+def us_symbols(tickers):
+    """조회 대상 해외 심볼 튜플 (중복 제거, 정렬). get_us_quotes 캐시 키로 사용."""
+    return tuple(sorted({us_symbol(t) for t in tickers} - {""}))
+
+
+def _fetch_us_quotes(symbols):
+    quotes = fetch_quotes(symbols)
+    return {
+        sym: {**quotes[sym], "currency": trading_currency(sym)}
+        for sym in symbols if quotes.get(sym) is not None
+    }
+
+
+@st.cache_data(ttl=CACHE_TTL["memo"])
+def get_us_quotes(symbols):
+    """
+    해외 심볼 튜플의 시세·거래 통화 (저장소 우선, 미보유 심볼만 한 번의 다운로드로 조회).
+    반환: {심볼: {"price": 현재가, "prev_close": 전일 종가, "time": 기준 시각, "currency": 거래 통화}}
+    """
+    if not symbols:
+        return {}
+    stored = quote_store.get_many("us", symbols, _fetch_us_quotes, _policy("us"))
+    return {
+        sym: stored.get(sym) or {"price": None, "currency": trading_currency(sym)}
+        for sym in symbols
+    }
+
+
+def get_us_prices(tickers):
+    """
+    행 단위 종목티커 목록의 (현재가 리스트, 거래 통화 리스트) 반환.
+    소유자·증권사별 중복 티커는 한 번만 조회하며, 전체 시트 기준으로 호출하면
+    같은 시트를 쓰는 화면끼리 캐시를 공유함. 수동 시세(overrides)는 캐시 뒤에서 덮어씀.
+    """
+    row_symbols = [us_symbol(t) for t in tickers]
+    quotes = overrides.apply_us(get_us_quotes(us_symbols(tickers)), trading_currency)
+    prices = [quotes.get(s, {}).get("price") for s in row_symbols]
+    currencies = [quotes.get(s, {}).get("currency") for s in row_symbols]
+    return prices, currencies
+
+
+def get_us_prev_closes(tickers):
+    """get_us_prices와 같은 행 순서의 전일 종가 (거래 통화 기준, 수동 시세는 None)"""
+    quotes = overrides.apply_us(get_us_quotes(us_symbols(tickers)), trading_currency)
+    return [quotes.get(us_symbol(t), {}).get("prev_close") for t in tickers]
+
+
+# -------------------------------
+# 저장소 직접 갱신 (백그라운드 갱신 스레드용)
+# -------------------------------
+def _fetch_single_closes(symbols):
+    return {sym: last_close(sym) for sym in symbols}
+
+
+# lead: 장중에는 만료가 lead초 이내로 남은 값까지 미리 갱신. 휴장 중 이미 마감가를 받은 종목은 건너뜀.
+def _refresh_stale(namespace, symbols, fetch, lead):
+    stale = quote_store.stale_names(namespace, symbols, _policy(namespace, lead))
+    if stale:
+        quote_store.refresh(namespace, stale, fetch)
+
+
+def refresh_gold(lead=0):
+    _refresh_stale("futures", ["GC=F"], _fetch_single_closes, lead)
+
+
+def refresh_kr_quotes(codes, lead=0):
+    _refresh_stale("kr", codes, _fetch_kr_quotes, lead)
+
+
+def refresh_us_quotes(symbols, lead=0):
+    _refresh_stale("us", symbols, _fetch_us_quotes, lead)
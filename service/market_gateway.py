@@ -0,0 +1,122 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+
+from config import SHEET_NAMES, MARKET_FETCH_WORKERS
+from service.sheets import load_sheet_data
+from service.market_data import (
+    get_gold_price_krw_per_g, get_kr_quotes, get_us_quotes,
+    kr_codes, us_symbols, has_gold, trading_currency, trading_currencies,
+)
+from service.fx import get_fx_rates
+from service.snapshot import PriceSnapshot
+from service import overrides
+from service.crypto_data import get_crypto_prices, crypto_ids
+
+
+def _sheet_df(spreadsheet, key):
+    try:
+        rows = load_sheet_data(spreadsheet, SHEET_NAMES[key])
+    except Exception:
+        return pd.DataFrame()
+    if not rows or len(rows) < 2:
+        return pd.DataFrame()
+    return pd.DataFrame(rows[1:], columns=rows[0]).rename(columns=lambda x: x.strip())
+
+
+# -------------------------------
+# 조회 대상 수집
+# -------------------------------
+def collect_instruments(spreadsheet):
+    """
+    국내·해외·가상자산·현금성자산 시트 전체에서 조회 대상(환산 통화 포함)을 수집.
+    각 페이지 헬퍼가 만드는 캐시 키와 동일한 형태로 만들어야 선조회 결과가 재사용됨.
+    """
+    dom = _sheet_df(spreadsheet, "domestic")
+    ovs = _sheet_df(spreadsheet, "overseas")
+    cry = _sheet_df(spreadsheet, "crypto")
+    csh = _sheet_df(spreadsheet, "cash")
+
+    kr, gold = (), False
+    if {"종목코드", "종목명"} <= set(dom.columns):
+        codes = dom["종목코드"].astype(str).str.zfill(6)
+        kr = kr_codes(codes, dom["종목명"])
+        gold = has_gold(codes, dom["종목명"])
+
+    us = us_symbols(ovs["종목티커"]) if "종목티커" in ovs.columns else ()
+
+    crypto = crypto_ids(cry["coingecko_id"]) if "coingecko_id" in cry.columns else ()
+
+    currencies = set(trading_currencies(us))
+    for df, col in ((ovs, "화폐"), (cry, "통화"), (csh, "통화")):
+        if col in df.columns:
+            currencies.update(df[col].dropna())
+    currencies = tuple(sorted(str(c) for c in currencies if c))
+
+    return {"kr": kr, "us": us, "crypto": crypto, "gold": gold, "currencies": currencies}
+
+
+# -------------------------------
+# 병렬 조회
+# -------------------------------
+def _price_jobs(inst, manual_gold=None):
+    jobs = {
+        "fx":     (get_fx_rates, (inst["currencies"],)),
+        "kr":     (get_kr_quotes, (inst["kr"],)),
+        "us":     (get_us_quotes, (inst["us"],)),
+        "crypto": (get_crypto_prices, (inst["crypto"],)),
+    }
+    if inst["gold"] and not manual_gold:
+        jobs["gold"] = (get_gold_price_krw_per_g, ())
+    return jobs
+
+
+def _run_jobs(jobs):
+    """조회 작업을 제한된 스레드 풀에서 동시에 실행. 반환: {이름: 결과 | None(실패)}"""
+    # 캐시 함수가 스레드 안에서도 현재 세션 컨텍스트를 쓰도록 연결 (세션 밖이면 None)
+    ctx = get_script_run_ctx()
+
+    def _attach_ctx():
+        add_script_run_ctx(threading.current_thread(), ctx)
+
+    results = {}
+    with ThreadPoolExecutor(max_workers=MARKET_FETCH_WORKERS, initializer=_attach_ctx) as pool:
+        futures = {name: pool.submit(fn, *args) for name, (fn, args) in jobs.items()}
+        for name, future in futures.items():
+            try:
+                results[name] = future.result()
+            except Exception:
+                results[name] = None
+    return results
+
+
+def prefetch_prices(inst):
+    """
+    collect_instruments 결과의 시세·환율을 미리 조회 (서버 시작 예열용).
+    fetch_price_snapshot과 같은 캐시 키로 부르므로 결과가 시세 저장소와 메모 캐시에 그대로 남음.
+    반환: {제공자: 성공 여부}
+    """
+    results = _run_jobs(_price_jobs(inst, overrides.get_override("kr", overrides.GOLD)))
+    return {name: result is not None for name, result in results.items()}
+
+
+def fetch_price_snapshot(spreadsheet):
+    """
+    페이지에 필요한 모든 시세(KRX, 해외, 환율, 금, CoinGecko)를 제한된 스레드 풀에서 동시에 조회.
+    소요 시간은 제공자별 합이 아니라 가장 느린 제공자 하나로 줄어듦.
+    반환: PriceSnapshot (조회 실패 항목은 빈 값 — 페이지는 이 스냅샷 하나로 평가)
+    """
+    inst = collect_instruments(spreadsheet)
+    manual_gold = overrides.get_override("kr", overrides.GOLD)
+    results = _run_jobs(_price_jobs(inst, manual_gold))
+
+    # 수동 시세는 조회가 끝난 뒤 덮어씀 (스냅샷 id에 반영되어 파생 캐시도 자동으로 분리됨)
+    return PriceSnapshot.create(
+        kr=overrides.apply_kr(results.get("kr") or {}),
+        us=overrides.apply_us(results.get("us") or {}, trading_currency),
+        crypto=results.get("crypto"),
+        fx=results.get("fx"),
+        gold=manual_gold or results.get("gold"),
+    )
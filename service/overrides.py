@@ -0,0 +1,113 @@
+import threading
+
+from service import quote_store
+
+# 수동 시세 (금현물, 비상장 펀드, 상장폐지 종목 등).
+# 시세 캐시·저장소 키와 분리된 별도 계층으로, 조회가 끝난 시세 위에 덮어써서 적용하므로
+# 값을 바꿔도 상류 제공자 재조회가 일어나지 않음. 시세 저장소 DB의 "override" namespace에 영구 저장.
+#
+# 키: (namespace, 이름) — namespace는 quote_store와 동일 (kr: 종목코드, us: 티커, crypto: coingecko id)
+# 값: 원 단위 가격 (us는 종목 거래 통화 기준). 국내 금현물은 ("kr", GOLD).
+
+GOLD = "GOLD"
+
+NAMESPACE_LABELS = {
+    "kr": "국내",
+    "us": "해외",
+    "crypto": "가상자산",
+}
+
+_overrides = None
+_lock = threading.Lock()
+
+
+def _load():
+    global _overrides
+    if _overrides is None:
+        with _lock:
+            if _overrides is None:
+                stored = quote_store.read_namespace("override")
+                loaded = {}
+                for key, price in stored.items():
+                    namespace, _, name = key.partition(":")
+                    loaded.setdefault(namespace, {})[name] = float(price)
+                _overrides = loaded
+    return _overrides
+
+
+def get_overrides(namespace=None):
+    """현재 수동 시세. namespace를 주면 {이름: 가격}, 아니면 {namespace: {이름: 가격}}"""
+    overrides = _load()
+    if namespace is not None:
+        return dict(overrides.get(namespace, {}))
+    return {ns: dict(v) for ns, v in overrides.items()}
+
+
+def get_override(namespace, name):
+    return _load().get(namespace, {}).get(name)
+
+
+def set_overrides(overrides):
+    """수동 시세 전체 교체 ({namespace: {이름: 가격}}, 가격이 비어 있거나 0 이하인 항목은 삭제)"""
+    clean = {}
+    for namespace, values in overrides.items():
+        for name, price in values.items():
+            if name and price is not None and float(price) > 0:
+                clean.setdefault(namespace, {})[normalize_name(namespace, name)] = float(price)
+
+    global _overrides
+    previous = _load()
+    with _lock:
+        removed = [
+            f"{ns}:{name}" for ns, values in previous.items() for name in values
+            if name not in clean.get(ns, {})
+        ]
+        quote_store.delete("override", removed)
+        quote_store.write("override", {
+            f"{ns}:{name}": price for ns, values in clean.items() for name, price in values.items()
+        })
+        _overrides = clean
+
+
+def normalize_name(namespace, name):
+    """편집기 입력을 시세 키 형태로 (국내: 6자리 코드 또는 GOLD, 해외: 대문자 티커, 가상자산: 소문자 id)"""
+    name = str(name).strip()
+    if namespace == "kr":
+        return name.zfill(6) if name.isdigit() else name.upper()
+    if namespace == "us":
+        return name.upper()
+    return name.lower()
+
+
+# -------------------------------
+# 적용 (조회된 시세 위에 덮어쓰기)
+# -------------------------------
+def apply_kr(quotes):
+    """{종목코드: 시세 dict}에 국내 수동 시세 적용 (GOLD 항목은 get_override로 따로 조회, 전일 종가 없음)"""
+    overrides = _load().get("kr", {})
+    if not overrides:
+        return quotes
+    return {**quotes, **{c: {"price": p, "prev_close": None} for c, p in overrides.items() if c != GOLD}}
+
+
+def apply_us(quotes, currency_of):
+    """{심볼: {"price", "currency"}}에 해외 수동 시세 적용 (거래 통화는 유지)"""
+    overrides = _load().get("us", {})
+    if not overrides:
+        return quotes
+    result = dict(quotes)
+    for sym, price in overrides.items():
+        currency = (quotes.get(sym) or {}).get("currency") or currency_of(sym)
+        result[sym] = {"price": price, "prev_close": None, "currency": currency}
+    return result
+
+
+def apply_crypto(quotes, usdkrw):
+    """{id: {"usd", "krw"}}에 가상자산 수동 시세(원) 적용 — usd는 환율로 환산"""
+    overrides = _load().get("crypto", {})
+    if not overrides:
+        return quotes
+    result = dict(quotes)
+    for coin_id, krw in overrides.items():
+        result[coin_id] = {"krw": krw, "usd": krw / usdkrw if usdkrw else None}
+    return result
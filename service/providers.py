@@ -0,0 +1,203 @@
+import json
+import logging
+import os
+import threading
+from abc import ABC, abstractmethod
+
+from config import PRICE_PROVIDER, FAKE_PROVIDER_URL, QUOTE_RECORDING_PATH
+from service import http_client, yahoo, coingecko
+from service.rate_limit import Throttled, TokenBucket, retry_after_seconds
+
+logger = logging.getLogger(__name__)
+
+# 시세 제공자 인터페이스.
+# market_data·fx·crypto_data는 yfinance/CoinGecko를 직접 부르지 않고 이 모듈의
+# quotes / last_closes / crypto_prices를 거치므로, PRICE_PROVIDER 설정만으로 실제 API 대신
+# 로컬 대역 서버(service/fake_quote_server.py)를 붙여 부하·지연 테스트를 할 수 있음.
+
+
+class MarketProvider(ABC):
+    """
+    주식·환율 시세 제공자.
+    quotes: Yahoo 심볼 목록의 시세 {심볼: {"price", "prev_close", "time"} | None} — 한 번의 요청
+    last_closes: quotes 중 마지막 종가만 {심볼: 종가 | None}
+    """
+
+    name = ""
+
+    @abstractmethod
+    def quotes(self, symbols):
+        ...
+
+    def last_closes(self, symbols):
+        return {s: q["price"] if q else None for s, q in self.quotes(symbols).items()}
+
+
+class CryptoProvider(ABC):
+    """
+    가상자산 시세 제공자.
+    crypto_prices: CoinGecko id 목록의 시세 {id: {"usd", "krw", "*_24h_change", "last_updated_at"}} (조회된 id만)
+    """
+
+    name = ""
+
+    @abstractmethod
+    def crypto_prices(self, ids):
+        ...
+
+
+class PriceProvider(MarketProvider, CryptoProvider):
+    """get_provider()로 교체할 수 있는 전체 제공자 — 주식·환율과 가상자산을 모두 구현해야 함"""
+
+
+class YahooProvider(MarketProvider):
+    name = "yahoo"
+
+    def quotes(self, symbols):
+        return yahoo.quotes(list(symbols))
+
+
+class CoinGeckoProvider(CryptoProvider):
+    name = "coingecko"
+
+    def crypto_prices(self, ids):
+        return coingecko.simple_prices(list(ids))
+
+
+class LiveProvider(PriceProvider):
+    """실제 API — 주식·환율은 Yahoo, 가상자산은 CoinGecko (market / crypto로 한쪽만 바꿔 끼울 수 있음)"""
+
+    name = "live"
+
+    def __init__(self, market=None, crypto=None):
+        self._market = market or YahooProvider()
+        self._crypto = crypto or CoinGeckoProvider()
+
+    def quotes(self, symbols):
+        return self._market.quotes(symbols)
+
+    def crypto_prices(self, ids):
+        return self._crypto.crypto_prices(ids)
+
+
+class FakeHTTPProvider(PriceProvider):
+    """
+    로컬 대역 서버(fake_quote_server)에 HTTP로 조회.
+    실제 제공자와 같은 http_client 커넥션 풀·타임아웃·429 처리 경로를 그대로 탐.
+    """
+
+    name = "fake"
+
+    def __init__(self, base_url=FAKE_PROVIDER_URL):
+        self.base_url = base_url.rstrip("/")
+        # 실제 CoinGecko 예산과 분리 — 대역 서버의 429/Retry-After만 반영
+        self._limiter = TokenBucket(per_minute=6000)
+
+    def quotes(self, symbols):
+        symbols = list(symbols)
+        if not self._limiter.acquire():
+            raise Throttled()
+        res = http_client.get(f"{self.base_url}/quotes", {"symbols": ",".join(symbols)})
+        if res.status_code == 429:
+            # 제공자 장애가 아니므로 브레이커 실패로 세지 않고 Retry-After 동안 요청을 멈춤
+            self._limiter.pause(retry_after_seconds(res))
+            raise Throttled()
+        res.raise_for_status()
+        body = res.json()
+        return {s: body.get(s) for s in symbols}
+
+    def crypto_prices(self, ids):
+        return coingecko.simple_prices(list(ids), url=f"{self.base_url}/simple/price", limiter=self._limiter)
+
+
+class RecordingProvider(PriceProvider):
+    """
+    다른 제공자의 응답을 그대로 넘기면서 QUOTE_RECORDING_PATH JSON에 누적 저장.
+    저장된 파일은 fake_quote_server가 그대로 재생함.
+    """
+
+    def __init__(self, inner, path):
+        self.inner = inner
+        self.name = inner.name
+        self.path = path
+        self._lock = threading.Lock()
+
+    def _save(self, section, values):
+        values = {k: v for k, v in values.items() if v is not None}
+        if not values:
+            return
+        with self._lock:
+            try:
+                with open(self.path, encoding="utf-8") as f:
+                    recording = json.load(f)
+            except (OSError, ValueError):
+                recording = {}
+            recording.setdefault(section, {}).update(values)
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with open(self.path, "w", encoding="utf-8") as f:
+                json.dump(recording, f, ensure_ascii=False, indent=1)
+
+    def quotes(self, symbols):
+        result = self.inner.quotes(symbols)
+        self._save("quotes", {s: {"price": q["price"], "prev_close": q.get("prev_close")}
+                              for s, q in result.items() if q})
+        return result
+
+    def crypto_prices(self, ids):
+        result = self.inner.crypto_prices(ids)
+        self._save("crypto", result)
+        return result
+
+
+_PROVIDERS = {
+    "live": LiveProvider,
+    "fake": FakeHTTPProvider,
+}
+
+_provider = None
+_provider_lock = threading.Lock()
+
+
+def get_provider():
+    """PRICE_PROVIDER 설정에 맞는 프로세스 공통 제공자 (QUOTE_RECORDING_PATH가 있으면 응답 기록)"""
+    global _provider
+    if _provider is None:
+        with _provider_lock:
+            if _provider is None:
+                provider = _PROVIDERS.get(PRICE_PROVIDER, LiveProvider)()
+                if QUOTE_RECORDING_PATH:
+                    provider = RecordingProvider(provider, QUOTE_RECORDING_PATH)
+                logger.info("시세 제공자: %s", provider.name)
+                _provider = provider
+    return _provider
+
+
+def set_provider(provider):
+    """
+    제공자 교체 (벤치마크 스크립트 등에서 직접 주입).
+    주식·환율 또는 가상자산만 구현한 제공자는 LiveProvider(market=…, crypto=…)로 감싸서 넘김.
+    """
+    global _provider
+    if not isinstance(provider, PriceProvider):
+        raise TypeError(f"PriceProvider가 아님: {type(provider).__name__}")
+    with _provider_lock:
+        _provider = provider
+
+
+# -------------------------------
+# 호출 지점용 함수
+# -------------------------------
+def quotes(symbols):
+    return get_provider().quotes(symbols)
+
+
+def last_closes(symbols):
+    return get_provider().last_closes(symbols)
+
+
+def last_close(symbol):
+    return last_closes([symbol]).get(symbol)
+
+
+def crypto_prices(ids):
+    return get_provider().crypto_prices(ids)
@@ -0,0 +1,223 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import closing
+
+from config import QUOTE_DB_PATH
+from service.singleflight import SingleFlight
+from service.circuit import breaker_for, negative_cache
+from service.rate_limit import Throttled
+
+_init_lock = threading.Lock()
+_initialized = False
+
+# 동시 세션의 같은 종목 조회를 한 번의 상류 호출로 합침
+_flight = SingleFlight()
+
+# 백그라운드 갱신 중인 (namespace, 이름) — 같은 항목을 중복 갱신하지 않도록
+_refreshing = set()
+_refreshing_lock = threading.Lock()
+
+
+def _connect():
+    global _initialized
+    if not _initialized:
+        with _init_lock:
+            if not _initialized:
+                os.makedirs(os.path.dirname(QUOTE_DB_PATH) or ".", exist_ok=True)
+                with closing(sqlite3.connect(QUOTE_DB_PATH, timeout=5)) as conn:
+                    conn.execute("PRAGMA journal_mode=WAL")
+                    conn.execute(
+                        "CREATE TABLE IF NOT EXISTS quotes ("
+                        " key TEXT PRIMARY KEY, value TEXT NOT NULL, fetched_at REAL NOT NULL)"
+                    )
+                    conn.commit()
+                _initialized = True
+    return sqlite3.connect(QUOTE_DB_PATH, timeout=5)
+
+
+# -------------------------------
+# 읽기 / 쓰기
+# -------------------------------
+def read(namespace, names):
+    """저장된 시세 조회. 반환: {이름: (값, 경과 초)} — 저장되지 않은 이름은 제외"""
+    if not names:
+        return {}
+    keys = {f"{namespace}:{n}": n for n in names}
+    now = time.time()
+    try:
+        with closing(_connect()) as conn:
+            placeholders = ",".join("?" * len(keys))
+            rows = conn.execute(
+                f"SELECT key, value, fetched_at FROM quotes WHERE key IN ({placeholders})",
+                list(keys),
+            ).fetchall()
+    except sqlite3.Error:
+        return {}
+    return {keys[k]: (json.loads(v), now - t) for k, v, t in rows}
+
+
+def read_namespace(namespace):
+    """namespace 전체 조회. 반환: {이름: 값}"""
+    prefix = f"{namespace}:"
+    try:
+        with closing(_connect()) as conn:
+            rows = conn.execute(
+                "SELECT key, value FROM quotes WHERE substr(key, 1, ?) = ?", (len(prefix), prefix)
+            ).fetchall()
+    except sqlite3.Error:
+        return {}
+    return {k[len(prefix):]: json.loads(v) for k, v in rows}
+
+
+def delete(namespace, names):
+    keys = [(f"{namespace}:{n}",) for n in names]
+    if not keys:
+        return
+    try:
+        with closing(_connect()) as conn, conn:
+            conn.executemany("DELETE FROM quotes WHERE key = ?", keys)
+    except sqlite3.Error:
+        pass
+
+
+def write(namespace, values):
+    """시세 저장 (None 값은 저장하지 않음 — 실패한 조회가 마지막 정상 값을 덮지 않도록)"""
+    now = time.time()
+    items = [(f"{namespace}:{n}", json.dumps(v), now) for n, v in values.items() if v is not None]
+    if not items:
+        return
+    try:
+        with closing(_connect()) as conn, conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO quotes (key, value, fetched_at) VALUES (?, ?, ?)", items
+            )
+    except sqlite3.Error:
+        pass
+
+
+# -------------------------------
+# 조회 + 저장 (서킷 브레이커 · 실패 캐시 · 단일 비행)
+# -------------------------------
+def _fetch_guarded(namespace, names, fetch):
+    """
+    최근 실패한 이름은 건너뛰고, 제공자 차단기가 열려 있으면 호출하지 않음.
+    응답에 빠진 이름은 실패 캐시에 넣음 (상장폐지 종목 하나만 조회한 경우 포함).
+    제공자 실패로 기록하는 것은 예외(전송 오류 등)가 나거나 여러 이름을 요청했는데 하나도 받지 못한 경우뿐.
+    호출 예산 소진(Throttled)은 제공자 장애가 아니므로 실패로 기록하지도, 실패 캐시에 넣지도 않음.
+    """
+    names = [n for _, n in negative_cache.filter([(namespace, n) for n in names])]
+    breaker = breaker_for(namespace)
+    if not names or (breaker is not None and not breaker.allow()):
+        return {}
+
+    def _values(result):
+        return {n: v for n, v in (result or {}).items() if v is not None}
+
+    try:
+        fetched = _values(fetch(names))
+    except Throttled as e:
+        fetched = _values(e.partial)
+        if breaker is not None:
+            breaker.release()
+        return fetched
+    except Exception:
+        if breaker is not None:
+            breaker.record_failure()
+        return {}
+
+    if not fetched and len(names) > 1:
+        if breaker is not None:
+            breaker.record_failure()
+        return {}
+
+    negative_cache.add([(namespace, n) for n in names if n not in fetched])
+    if breaker is not None:
+        breaker.record_success()
+    return fetched
+
+
+def _fetch_shared(namespace, names, fetch):
+    """(namespace, 이름) 단위로 진행 중인 조회를 합쳐서 fetch 호출. 반환: {이름: 값}"""
+    def _fetch_keys(keys):
+        fetched = _fetch_guarded(namespace, [n for _, n in keys], fetch)
+        return {(namespace, n): v for n, v in fetched.items()}
+
+    results = _flight.do_many([(namespace, n) for n in names], _fetch_keys)
+    return {n: v for (_, n), v in results.items()}
+
+
+def refresh(namespace, names, fetch):
+    """fetch로 즉시 조회해 저장. 다른 스레드가 같은 항목을 조회 중이면 그 결과를 사용."""
+    fresh = _fetch_shared(namespace, names, fetch)
+    write(namespace, fresh)
+    return fresh
+
+
+# -------------------------------
+# stale-while-revalidate
+# -------------------------------
+def _refresh(namespace, names, fetch):
+    try:
+        refresh(namespace, names, fetch)
+    except Exception:
+        pass
+    finally:
+        with _refreshing_lock:
+            _refreshing.difference_update((namespace, n) for n in names)
+
+
+def _refresh_in_background(namespace, names, fetch):
+    with _refreshing_lock:
+        todo = [n for n in names if (namespace, n) not in _refreshing]
+        _refreshing.update((namespace, n) for n in todo)
+    if todo:
+        threading.Thread(
+            target=_refresh, args=(namespace, todo, fetch), daemon=True, name=f"quote-refresh-{namespace}"
+        ).start()
+
+
+def _limit(max_age, name):
+    return max_age(name) if callable(max_age) else max_age
+
+
+def stale_names(namespace, names, max_age):
+    """저장되지 않았거나 max_age초보다 오래된 이름 리스트"""
+    names = list(dict.fromkeys(names))
+    stored = read(namespace, names)
+    return [n for n in names if n not in stored or stored[n][1] > _limit(max_age, n)]
+
+
+def get_many(namespace, names, fetch, max_age):
+    """
+    저장소 우선 조회.
+    - 저장된 값이 없으면: fetch(이름 리스트)로 즉시 조회 후 저장 (최초 1회만 대기)
+    - 저장된 값이 max_age초보다 오래됐으면: 저장된 값을 바로 반환하고 백그라운드에서 갱신
+    max_age는 초 단위 숫자 또는 이름별 허용 경과 시간을 돌려주는 함수 (장 운영 시간 반영용).
+    fetch는 {이름: 값} dict를 반환해야 함. 반환: {이름: 값}
+    """
+    names = list(dict.fromkeys(names))
+    stored = read(namespace, names)
+
+    missing = [n for n in names if n not in stored]
+    fresh = {}
+    if missing:
+        try:
+            fresh = refresh(namespace, missing, fetch)
+        except Exception:
+            fresh = {}
+
+    stale = [n for n, (_, age) in stored.items() if age > _limit(max_age, n)]
+    if stale:
+        _refresh_in_background(namespace, stale, fetch)
+
+    result = {n: v for n, (v, _) in stored.items()}
+    result.update({n: v for n, v in fresh.items() if v is not None})
+    return result
+
+
+def get_one(namespace, name, fetch, max_age):
+    """단일 항목용 get_many. fetch는 인자 없이 값 하나를 반환."""
+    return get_many(namespace, [name], lambda _names: {name: fetch()}, max_age).get(name)
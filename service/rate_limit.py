@@ -0,0 +1,85 @@
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+
+class Throttled(Exception):
+    """
+    호출 예산이 없어 요청 일부·전부를 보내지 못함 (제공자 장애가 아님).
+    partial: 보낸 요청으로 받은 값
+    """
+
+    def __init__(self, partial=None):
+        super().__init__("호출 예산 소진")
+        self.partial = partial or {}
+
+
+class TokenBucket:
+    """
+    프로세스 공통 토큰 버킷.
+    분당 per_minute개 토큰이 일정하게 채워지며, 요청마다 하나씩 사용.
+    토큰이 없으면 최대 max_wait초까지 대기(큐잉)하고, 그래도 없으면 False.
+    reserve를 주면 그만큼의 토큰은 남겨 두고 사용 (우선순위가 낮은 백그라운드 작업용).
+    429 응답의 Retry-After 동안은 토큰이 있어도 요청을 보내지 않음.
+    """
+
+    def __init__(self, per_minute, capacity=None):
+        self.rate = per_minute / 60.0
+        self.capacity = capacity or per_minute
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def _wait_time(self, now, need=1):
+        if now < self._paused_until:
+            return self._paused_until - now
+        if self._tokens >= need:
+            return 0.0
+        return (need - self._tokens) / self.rate
+
+    def acquire(self, max_wait=0, reserve=0):
+        deadline = time.monotonic() + max_wait
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                wait = self._wait_time(now, 1 + reserve)
+                if wait == 0:
+                    self._tokens -= 1
+                    return True
+            if now + wait > deadline:
+                return False
+            time.sleep(wait)
+
+    def pause(self, seconds):
+        """Retry-After 반영 — 남은 토큰도 비움"""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self._tokens = 0.0
+
+    @property
+    def exhausted(self):
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            return self._wait_time(now) > 0
+
+
+def retry_after_seconds(response, default=60):
+    """Retry-After 헤더(초 또는 HTTP 날짜)를 초 단위로 변환"""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return default
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return default
@@ -0,0 +1,86 @@
+import atexit
+import logging
+import threading
+import time
+
+import streamlit as st
+
+from config import REFRESH_INTERVALS, HISTORY_START_DELAY
+from service.market_gateway import collect_instruments
+from service.market_data import refresh_gold, refresh_kr_quotes, refresh_us_quotes
+from service.fx import refresh_fx
+from service.crypto_data import refresh_crypto_prices
+from service import history_store
+
+logger = logging.getLogger(__name__)
+
+
+class PriceRefresher:
+    """
+    보유 종목 시세를 만료 전에 미리 갱신하는 프로세스 단위 스레드.
+    자산 종류별 주기(REFRESH_INTERVALS)마다 국내·해외·가상자산 시트에서 보유 종목을 다시 읽어
+    시세 저장소를 갱신하므로, 사용자 렌더는 항상 갱신된 저장소 값을 읽게 됨.
+    일별 이력(history_store)도 같은 스레드에서 빠진 날짜만 덧붙임.
+    """
+
+    def __init__(self, spreadsheet, intervals=None):
+        self._spreadsheet = spreadsheet
+        self._intervals = dict(intervals or REFRESH_INTERVALS)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True, name="price-refresher")
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self, timeout=5):
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join(timeout)
+
+    def _refresh(self, asset_class, inst):
+        # 다음 주기 전에 만료될 값까지 미리 갱신 (휴장 중 마감가를 이미 받은 종목은 조회하지 않음)
+        lead = self._intervals[asset_class]
+        if asset_class == "fx":
+            refresh_fx(inst["currencies"], lead)
+            refresh_gold(lead)
+        elif asset_class == "kr":
+            refresh_kr_quotes(inst["kr"], lead)
+        elif asset_class == "us":
+            refresh_us_quotes(inst["us"], lead)
+        elif asset_class == "crypto":
+            refresh_crypto_prices(inst["crypto"], lead)
+        elif asset_class == "history":
+            history_store.update(inst)
+
+    def _run(self):
+        # 이력 백필은 시작 직후의 시세 조회와 호출 예산을 다투지 않도록 늦게 시작
+        start = time.monotonic()
+        next_due = {c: start + (HISTORY_START_DELAY if c == "history" else 0.0) for c in self._intervals}
+        while not self._stop.is_set():
+            now = time.monotonic()
+            due = [c for c, t in next_due.items() if t <= now]
+            if due:
+                try:
+                    inst = collect_instruments(self._spreadsheet)
+                except Exception:
+                    logger.exception("보유 종목 수집 실패")
+                    inst = None
+                for asset_class in due:
+                    if self._stop.is_set():
+                        return
+                    if inst is not None:
+                        try:
+                            self._refresh(asset_class, inst)
+                        except Exception:
+                            logger.exception("%s 시세 갱신 실패", asset_class)
+                    next_due[asset_class] = time.monotonic() + self._intervals[asset_class]
+            self._stop.wait(max(0.0, min(next_due.values()) - time.monotonic()))
+
+
+@st.cache_resource(show_spinner=False)
+def start_price_refresher(_spreadsheet):
+    """서버 프로세스당 한 번만 갱신 스레드를 시작 (종료 시 정리)"""
+    refresher = PriceRefresher(_spreadsheet).start()
+    atexit.register(refresher.stop)
+    return refresher
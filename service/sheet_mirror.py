@@ -0,0 +1,168 @@
+import hashlib
+import json
+import logging
+import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+
+import pandas as pd
+
+from config import SHEET_MIRROR_DIR
+
+logger = logging.getLogger(__name__)
+
+# 마지막으로 받은 시트 값의 로컬 미러 (시트별 Parquet + 리비전 메타데이터).
+# 서버 재시작 직후에는 이 미러로 바로 렌더하고 (sheets.current_revision이 백그라운드에서 원본과 맞춤),
+# Sheets API가 실패하거나 할당량을 넘으면 마지막 미러 값으로 대신 응답함.
+#
+# 페이지는 시트의 표시 형식 문자열("1,234", "12%")을 직접 파싱하므로 값은 문자열 컬럼 그대로 저장하고,
+# 헤더도 데이터 행으로 보관함 (빈 헤더·중복 헤더가 있어도 원래 행 리스트를 그대로 복원).
+# 미러는 스프레드시트(백엔드 id)별 디렉터리에 따로 두므로, 다른 스프레드시트·백엔드로 재시작해도 섞이지 않음.
+# 저장할 때마다 시트 파일을 새 하위 디렉터리(rev-*)에 쓰고 _meta.json의 "dir"이 그 디렉터리를 가리킴.
+
+_write_lock = threading.Lock()
+
+
+def _dir(spreadsheet_id):
+    digest = hashlib.sha1(str(spreadsheet_id).encode()).hexdigest()[:16]
+    return os.path.join(SHEET_MIRROR_DIR, digest)
+
+
+def _meta_path(spreadsheet_id):
+    return os.path.join(_dir(spreadsheet_id), "_meta.json")
+
+
+def _path(directory, sheet_name):
+    safe = re.sub(r"[^\w.-]", "_", sheet_name)
+    return os.path.join(directory, f"{safe}.parquet")
+
+
+def _sheet_dir(spreadsheet_id, meta):
+    # "dir"이 없는 예전 미러는 스프레드시트 디렉터리에 시트 파일을 바로 둠
+    return os.path.join(_dir(spreadsheet_id), meta.get("dir", ""))
+
+
+def _replace(path, write):
+    tmp = f"{path}.tmp"
+    write(tmp)
+    os.replace(tmp, path)
+
+
+def _write_meta(spreadsheet_id, meta):
+    def _dump(path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(meta, f, ensure_ascii=False)
+
+    _replace(_meta_path(spreadsheet_id), _dump)
+
+
+def _meta(spreadsheet_id):
+    try:
+        with open(_meta_path(spreadsheet_id), encoding="utf-8") as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    # 디렉터리 이름은 해시이므로 원래 id로 한 번 더 확인
+    return meta if meta.get("spreadsheet") == str(spreadsheet_id) else {}
+
+
+# -------------------------------
+# 읽기
+# -------------------------------
+def revision(spreadsheet_id):
+    """미러에 저장된 스프레드시트 리비전 (미러가 없으면 None)"""
+    return _meta(spreadsheet_id).get("revision")
+
+
+def saved_at(spreadsheet_id):
+    return _meta(spreadsheet_id).get("saved_at")
+
+
+def sheet_names(spreadsheet_id):
+    """미러에 저장된 시트 이름 목록 (원본에 있던 시트만 저장되므로 시트 존재 확인 대체용)"""
+    return list(_meta(spreadsheet_id).get("sheets", []))
+
+
+def read(spreadsheet_id, sheet_name):
+    """미러의 시트 값 (load_sheet_data와 같은 행 리스트). 없으면 None"""
+    meta = _meta(spreadsheet_id)
+    if sheet_name not in meta.get("sheets", []):
+        return None
+    try:
+        frame = pd.read_parquet(_path(_sheet_dir(spreadsheet_id, meta), sheet_name))
+    except Exception:
+        logger.exception("시트 미러 읽기 실패: %s", sheet_name)
+        return None
+    return frame.fillna("").astype(str).values.tolist()
+
+
+def read_all(spreadsheet_id):
+    """미러의 전체 시트 {시트 이름: 행 리스트} (읽지 못한 시트는 제외)"""
+    sheets = {name: read(spreadsheet_id, name) for name in sheet_names(spreadsheet_id)}
+    return {name: rows for name, rows in sheets.items() if rows is not None}
+
+
+# -------------------------------
+# 쓰기
+# -------------------------------
+def _prune(spreadsheet_id, keep):
+    """현재 메타데이터가 가리키지 않는 이전 시트 파일·디렉터리 삭제"""
+    root = _dir(spreadsheet_id)
+    for entry in os.listdir(root):
+        path = os.path.join(root, entry)
+        try:
+            if entry.startswith("rev-") and entry != keep:
+                shutil.rmtree(path)
+            elif entry.endswith(".parquet"):
+                os.remove(path)
+        except OSError:
+            logger.warning("이전 시트 미러 삭제 실패: %s", path, exc_info=True)
+
+
+def write(spreadsheet_id, sheets, revision):
+    """
+    시트 값 전체를 리비전과 함께 저장.
+    시트 파일은 새 디렉터리에 모두 쓴 뒤 메타데이터 교체(os.replace) 한 번으로 전환하므로,
+    중간에 실패해도 이전 리비전의 미러가 그대로 유효하고 읽는 쪽이 두 리비전을 섞어 보지 않음.
+    전환 후 이전 디렉터리를 지우므로 원본에서 사라진 시트도 미러에 남지 않음.
+    """
+    root = _dir(spreadsheet_id)
+    os.makedirs(root, exist_ok=True)
+    with _write_lock:
+        try:
+            directory = tempfile.mkdtemp(prefix="rev-", dir=root)
+            try:
+                for name, rows in sheets.items():
+                    width = max((len(r) for r in rows), default=0)
+                    frame = pd.DataFrame(rows, columns=[f"c{i}" for i in range(width)], dtype="string")
+                    frame.to_parquet(_path(directory, name))
+
+                _write_meta(spreadsheet_id, {
+                    "spreadsheet": str(spreadsheet_id), "revision": revision, "dir": os.path.basename(directory),
+                    "saved_at": time.time(), "sheets": sorted(sheets),
+                })
+            except Exception:
+                shutil.rmtree(directory, ignore_errors=True)
+                raise
+        except Exception:
+            logger.exception("시트 미러 저장 실패")
+            return
+        _prune(spreadsheet_id, os.path.basename(directory))
+
+
+def forget_revision(spreadsheet_id):
+    """
+    저장된 리비전만 지움 (수동 새로고침) — 같은 리비전이라도 다음 조회는 원본에서 다시 읽음.
+    시트 값은 재시작·장애 때 대체 응답용으로 그대로 남김.
+    """
+    with _write_lock:
+        meta = _meta(spreadsheet_id)
+        if meta.get("revision") is None:
+            return
+        try:
+            _write_meta(spreadsheet_id, {**meta, "revision": None})
+        except Exception:
+            logger.exception("시트 미러 메타데이터 저장 실패")
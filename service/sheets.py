@@ -1,16 +1,310 @@
+import hashlib
+import json
+import logging
+import threading
+import time
+
 import gspread
 import streamlit as st
 from google.oauth2.service_account import Credentials
+from config import SHEET_NAMES, SHEET_REVISION_PROBE, SHEET_BACKEND, LOCAL_SHEET_DIR
+from service import sheet_mirror
+from service.storage import GSheetsBackend, LocalSheetsBackend
+
+logger = logging.getLogger(__name__)
+
+# 리비전 확인을 못 할 때(권한·네트워크) 시트 캐시를 유지하는 시간 — 예전 고정 TTL과 같은 동작
+_FALLBACK_TTL = 300
+
+# 스프레드시트별 마지막 리비전 확인 결과 (프로세스 공통): {id: (리비전, 확인 시각, 마지막 성공 시각)}
+_revisions = {}
+_revision_lock = threading.Lock()
+# 진행 중인 리비전 확인 {id: 완료 이벤트} — 확인은 스레드 하나만, 나머지는 마지막 값 사용 (처음이면 대기)
+_probing = {}
+
+# 원본 조회에 실패해 미러 값으로 응답 중인지 (화면 안내용) / 실패 후 원본 재시도를 미루는 시각
+_serving_mirror = threading.Event()
+_retry_after = 0.0
+
+
+# -------------------------------
+# 리비전 확인
+# -------------------------------
+def _key(spreadsheet):
+    """리비전·미러 구분용 스프레드시트 식별자 (백엔드 id — 파일 id 또는 로컬 디렉터리 경로)"""
+    return str(getattr(spreadsheet, "id", None) or id(spreadsheet))
+
+
+def _probe(spreadsheet, key):
+    """
+    Drive 리비전 확인 1회 (락 밖에서 호출) — 결과를 _revisions에 기록하고 반환.
+    실패하면 마지막 성공이 _FALLBACK_TTL초 이내일 때만 그 값을 유지하고, 그보다 오래되면 시간 구간 리비전.
+    """
+    now = time.time()
+    with _revision_lock:
+        last, _, good_at = _revisions.get(key, (None, 0.0, 0.0))
+    try:
+        revision, good_at = spreadsheet.revision(), now
+    except Exception:
+        if last is not None and now - good_at < _FALLBACK_TTL:
+            logger.warning("스프레드시트 리비전 확인 실패 — 마지막 값 사용", exc_info=True)
+            revision = last
+        else:
+            logger.warning("스프레드시트 리비전 확인 실패 — %d초 단위 갱신", _FALLBACK_TTL, exc_info=True)
+            revision = f"ttl-{int(now // _FALLBACK_TTL)}"
+    with _revision_lock:
+        _revisions[key] = (revision, now, good_at)
+    return revision
+
+
+def _probe_once(spreadsheet, key, done):
+    """_probe 후 진행 중 표시를 지우고 기다리는 스레드를 깨움"""
+    try:
+        return _probe(spreadsheet, key)
+    finally:
+        with _revision_lock:
+            _probing.pop(key, None)
+        done.set()
+
+
+def current_revision(spreadsheet):
+    """
+    스프레드시트 리비전 문자열. 시트 캐시 키로 쓰이므로 값이 바뀌어야만 시트를 다시 읽음.
+    SHEET_REVISION_PROBE초 안의 재호출은 마지막 값을 그대로 쓰고 (세션 공통),
+    그보다 오래되면 마지막 값으로 바로 진행하면서 한 스레드만 백그라운드에서 확인함.
+    처음 호출이거나 invalidate_revision 직후에만 확인 결과를 기다림 (다른 스레드가 확인 중이면 그 결과를).
+    """
+    key = _key(spreadsheet)
+    now = time.time()
+    with _revision_lock:
+        revision, checked_at, _ = _revisions.get(key, (None, 0.0, 0.0))
+        if revision is not None and now - checked_at < SHEET_REVISION_PROBE:
+            return revision
+        mirrored = sheet_mirror.revision(key) if revision is None else None
+        if mirrored is not None:
+            # 재시작 직후: 미러 리비전으로 바로 렌더하고 원본 확인은 백그라운드에서
+            _revisions[key] = (mirrored, now, now)
+            threading.Thread(
+                target=_reconcile, args=(spreadsheet, key, mirrored), daemon=True, name="sheet-reconcile"
+            ).start()
+            return mirrored
+        done = _probing.get(key)
+        if done is not None and revision is not None:
+            return revision
+        owner = done is None
+        if owner:
+            done = _probing[key] = threading.Event()
+            if revision is not None and checked_at:
+                threading.Thread(
+                    target=_probe_once, args=(spreadsheet, key, done), daemon=True, name="sheet-revision-probe"
+                ).start()
+                return revision
+
+    if owner:
+        return _probe_once(spreadsheet, key, done)
+    done.wait(SHEET_REVISION_PROBE)
+    with _revision_lock:
+        revision = _revisions.get(key, (None,))[0]
+    return revision or f"ttl-{int(now // _FALLBACK_TTL)}"
+
+
+def _reconcile(spreadsheet, key, mirrored):
+    """미러로 렌더하는 동안 원본 리비전을 확인하고, 바뀌었으면 새 리비전의 시트를 미리 받아 둠"""
+    try:
+        revision = spreadsheet.revision()
+        if revision != mirrored:
+            _load_all_sheets(spreadsheet, revision)
+    except Exception:
+        logger.warning("시트 미러 대조 실패 — 다음 리비전 확인 때 재시도", exc_info=True)
+        return
+    now = time.time()
+    with _revision_lock:
+        _revisions[key] = (revision, now, now)
+
+
+def invalidate_revision(spreadsheet):
+    """다음 호출에서 바로 리비전을 다시 확인 (시트에 쓴 직후 등)"""
+    key = _key(spreadsheet)
+    with _revision_lock:
+        revision, _, good_at = _revisions.get(key, (None, 0.0, 0.0))
+        if revision is not None:
+            _revisions[key] = (revision, 0.0, good_at)
+
+
+def refresh_sheets(spreadsheet):
+    """리비전과 무관하게 시트 캐시를 비우고 다음 조회에서 원본을 다시 읽음 (수동 새로고침·시트에 쓴 직후)"""
+    invalidate_revision(spreadsheet)
+    sheet_mirror.forget_revision(_key(spreadsheet))
+    _worksheet_index.clear()
+    _load_all_sheets.clear()
+    _load_sheet.clear()
+
+
+# -------------------------------
+# 시트 메타데이터 (핸들·존재 여부)
+# -------------------------------
+@st.cache_resource(max_entries=2, show_spinner=False)
+def _worksheet_index(_spreadsheet, revision):
+    """worksheets() 메타데이터 조회 한 번으로 {시트 이름: 핸들} (리비전별, 프로세스 공통)"""
+    return {ws.title: ws for ws in _spreadsheet.worksheets()}
+
+
+def worksheet_titles(spreadsheet):
+    """
+    스프레드시트의 시트 이름 목록 — 리비전마다 메타데이터를 한 번만 조회.
+    리비전이 로컬 미러와 같거나 조회에 실패하면 미러에 저장된 시트 이름으로 응답
+    (미러에는 SHEET_NAMES 중 실제 있던 시트만 들어 있음, 미러도 없으면 원래 예외).
+    """
+    key = _key(spreadsheet)
+    revision = current_revision(spreadsheet)
+    if revision == sheet_mirror.revision(key):
+        return sheet_mirror.sheet_names(key)
+    try:
+        return list(_worksheet_index(spreadsheet, revision))
+    except Exception:
+        names = sheet_mirror.sheet_names(key)
+        if not names:
+            raise
+        logger.warning("시트 메타데이터 조회 실패 — 로컬 미러의 시트 목록 사용", exc_info=True)
+        return names
+
+
+def has_worksheet(spreadsheet, sheet_name):
+    return sheet_name in worksheet_titles(spreadsheet)
+
+
+def get_worksheet(spreadsheet, sheet_name):
+    """
+    시트 핸들 (쓰기용 — 읽기는 load_sheet_data). spreadsheet.worksheet()와 달리 호출마다 메타데이터를 조회하지 않음.
+    없으면 gspread WorksheetNotFound.
+    """
+    sheets = _worksheet_index(spreadsheet, current_revision(spreadsheet))
+    if sheet_name not in sheets:
+        raise gspread.exceptions.WorksheetNotFound(sheet_name)
+    return sheets[sheet_name]
+
+
+def _a1_sheet(name):
+    """시트 전체 범위 A1 표기 (이름에 공백·작은따옴표가 있어도 안전하게)"""
+    return "'" + name.replace("'", "''") + "'"
+
+
+def _pad(values):
+    """batch 응답은 행 끝 빈 칸이 잘려 오므로 get_all_values처럼 가장 긴 행 길이로 맞춤"""
+    width = max((len(r) for r in values), default=0)
+    return [r + [""] * (width - len(r)) for r in values]
+
+
+def _batch_get(spreadsheet, names):
+    res = spreadsheet.values_batch_get([_a1_sheet(n) for n in names])
+    ranges = res.get("valueRanges", [])
+    return {n: _pad(r.get("values", [])) for n, r in zip(names, ranges)}
+
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def _load_all_sheets(_spreadsheet, revision):
+    """
+    SHEET_NAMES의 모든 시트를 values_batch_get 한 번으로 읽기. 반환: {시트 이름: 행 리스트}
+    없는 시트가 섞여 요청이 거부되면 메타데이터로 실제 시트만 골라 한 번 더 요청 (없는 시트는 결과에서 빠짐).
+    프로세스 공통 객체이므로 호출하는 쪽은 결과를 수정하지 않음 — _load_sheet가 시트별 사본으로 캐시.
+    revision이 로컬 미러와 같으면(재시작 직후) API를 부르지 않고 미러를 읽고, 새로 받은 값은 미러에 저장.
+    refresh_sheets는 미러의 리비전을 지우므로 새로고침 뒤에는 항상 원본을 읽음.
+    """
+    key = _key(_spreadsheet)
+    if revision == sheet_mirror.revision(key):
+        mirrored = sheet_mirror.read_all(key)
+        if mirrored:
+            return mirrored
+
+    names = list(dict.fromkeys(SHEET_NAMES.values()))
+    try:
+        sheets = _batch_get(_spreadsheet, names)
+    except (gspread.exceptions.APIError, gspread.exceptions.WorksheetNotFound):
+        existing = _worksheet_index(_spreadsheet, revision)
+        sheets = _batch_get(_spreadsheet, [n for n in names if n in existing])
+    sheet_mirror.write(key, sheets, revision)
+    return sheets
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _load_sheet(_spreadsheet, sheet_name, revision):
+    """
+    시트 하나의 값 (리비전별 캐시, _spreadsheet는 해시 제외).
+    SHEET_NAMES에 있는 시트는 전체 시트 일괄 조회 한 번의 결과에서 꺼내고, 그 밖의 시트만 개별 조회.
+    """
+    if sheet_name in SHEET_NAMES.values():
+        sheets = _load_all_sheets(_spreadsheet, revision)
+        if sheet_name not in sheets:
+            raise gspread.exceptions.WorksheetNotFound(sheet_name)
+        return sheets[sheet_name]
+    sheets = _worksheet_index(_spreadsheet, revision)
+    if sheet_name not in sheets:
+        raise gspread.exceptions.WorksheetNotFound(sheet_name)
+    return sheets[sheet_name].get_all_values()
+
+
+def load_sheet_data(spreadsheet, sheet_name: str):
+    """
+    Google Sheets 시트 데이터 읽기 — 스프레드시트 리비전이 바뀔 때만 다시 조회.
+    API 오류·할당량 초과로 읽지 못하면 로컬 미러의 마지막 값으로 응답 (미러에도 없으면 원래 예외).
+    """
+    global _retry_after
+    key = _key(spreadsheet)
+    # 방금 실패했으면 SHEET_REVISION_PROBE초 동안은 원본을 다시 두드리지 않고 미러로 응답
+    if _serving_mirror.is_set() and time.time() < _retry_after:
+        rows = sheet_mirror.read(key, sheet_name)
+        if rows is not None:
+            return rows
+
+    try:
+        rows = _load_sheet(spreadsheet, sheet_name, current_revision(spreadsheet))
+    except gspread.exceptions.WorksheetNotFound:
+        raise
+    except Exception:
+        rows = sheet_mirror.read(key, sheet_name)
+        if rows is None:
+            raise
+        logger.warning("시트 조회 실패 — 로컬 미러 값 사용: %s", sheet_name, exc_info=True)
+        _retry_after = time.time() + SHEET_REVISION_PROBE
+        _serving_mirror.set()
+        return rows
+    _serving_mirror.clear()
+    return rows
+
+
+def mirror_fallback_since(spreadsheet):
+    """원본 대신 미러 값으로 응답 중이면 미러 저장 시각(epoch 초), 아니면 None"""
+    return sheet_mirror.saved_at(_key(spreadsheet)) if _serving_mirror.is_set() else None
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _content_revision(_spreadsheet, keys, revision):
+    digest = hashlib.sha1()
+    for key in keys:
+        try:
+            rows = _load_sheet(_spreadsheet, SHEET_NAMES[key], revision)
+        except Exception:
+            rows = None
+        digest.update(json.dumps([key, rows], ensure_ascii=False).encode())
+    return digest.hexdigest()[:16]
 
 
-@st.cache_data(ttl=300, show_spinner=False)
-def load_sheet_data(_spreadsheet, sheet_name: str):
-    """Google Sheets 시트 데이터를 5분 캐시로 읽기. (_spreadsheet는 해시 제외)"""
-    return _spreadsheet.worksheet(sheet_name).get_all_values()
+def sheet_revision(spreadsheet, keys=None):
+    """
+    시트 내용 기준 리비전 문자열 (keys: SHEET_NAMES 키 목록, 기본은 전체).
+    스프레드시트 리비전마다 한 번만 해시하고, 다른 시트만 바뀐 경우에는 값이 그대로라 파생 캐시가 유지됨.
+    """
+    return _content_revision(spreadsheet, tuple(keys or SHEET_NAMES), current_revision(spreadsheet))
 
 
 @st.cache_resource(show_spinner="📡 Google Sheets 연결 중...")
 def get_spreadsheet():
+    """
+    설정된 시트 저장소 백엔드 (service.storage).
+    SHEET_BACKEND가 "local"이면 LOCAL_SHEET_DIR의 CSV/XLSX 파일을 쓰므로 인증·네트워크가 필요 없음.
+    """
+    if SHEET_BACKEND == "local":
+        return LocalSheetsBackend(LOCAL_SHEET_DIR)
     try:
         scope = [
             "https://www.googleapis.com/auth/spreadsheets",
@@ -25,7 +319,7 @@ def get_spreadsheet():
         # 🔹 시트 이름을 secrets에서 읽도록 변경 (운영/테스트 분리 가능)
         sheet_name = st.secrets.get("SPREADSHEET_NAME", "FinanceRaw")
 
-        return client.open(sheet_name)
+        return GSheetsBackend(client.open(sheet_name))
 
     except Exception as e:
         st.error("❌ Google Sheets 연결 실패")
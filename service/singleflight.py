@@ -0,0 +1,55 @@
+import threading
+
+# 다른 스레드의 조회를 기다리는 최대 시간(초) — 넘으면 결과 없음(None)으로 처리
+_WAIT_TIMEOUT = 30
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+
+
+class SingleFlight:
+    """
+    키 단위 요청 합치기.
+    여러 세션이 같은 종목을 동시에 요청하면 먼저 온 스레드만 실제로 조회하고,
+    나머지는 그 결과를 기다려 함께 사용 (상류 API 호출 1회).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do_many(self, keys, fetch):
+        """
+        keys 중 진행 중인 조회가 없는 키만 fetch(키 리스트)로 한 번에 조회하고,
+        이미 다른 스레드가 조회 중인 키는 그 결과를 기다림. 반환: {키: 값}
+        """
+        owned, waiting = [], {}
+        with self._lock:
+            for key in dict.fromkeys(keys):
+                call = self._calls.get(key)
+                if call is None:
+                    self._calls[key] = _Call()
+                    owned.append(key)
+                else:
+                    waiting[key] = call
+
+        results = {}
+        if owned:
+            fetched = {}
+            try:
+                fetched = fetch(owned) or {}
+            finally:
+                with self._lock:
+                    for key in owned:
+                        call = self._calls.pop(key)
+                        call.value = fetched.get(key)
+                        call.done.set()
+            results.update({k: fetched.get(k) for k in owned})
+
+        for key, call in waiting.items():
+            call.done.wait(_WAIT_TIMEOUT)
+            results[key] = call.value
+        return results
@@ -0,0 +1,78 @@
+import hashlib
+import json
+import time
+from dataclasses import dataclass, field
+from types import MappingProxyType
+
+from service import fx
+from service.market_data import kr_code, is_gold, us_symbol, trading_currency
+
+
+def _freeze(values):
+    return MappingProxyType(dict(values or {}))
+
+
+@dataclass(frozen=True)
+class PriceSnapshot:
+    """
+    한 시점에 함께 조회한 시세 묶음 (변경 불가).
+    평가·피벗·차트는 이 스냅샷 하나만 보고 계산하므로 한 화면 안에서 시세 시점이 섞이지 않고,
+    같은 시세면 같은 id가 나오므로 (시트 리비전, 스냅샷 id)로 파생 결과를 세션·페이지 간에 캐시할 수 있음.
+
+    kr: {종목코드: {"price", "prev_close", "time"}}, us: {심볼: {"price", "prev_close", "time", "currency"}},
+    crypto: {id: {"usd", "krw", "*_24h_change", "last_updated_at"}},
+    fx: {통화: KRW 환율}, gold: 원/g 금 시세 — 모두 수동 시세(overrides) 적용 후 값
+    """
+
+    id: str
+    taken_at: float
+    kr: MappingProxyType = field(default_factory=lambda: _freeze({}))
+    us: MappingProxyType = field(default_factory=lambda: _freeze({}))
+    crypto: MappingProxyType = field(default_factory=lambda: _freeze({}))
+    fx: MappingProxyType = field(default_factory=lambda: _freeze({}))
+    gold: float = None
+
+    @classmethod
+    def create(cls, kr=None, us=None, crypto=None, fx=None, gold=None):
+        """시세 내용으로 id를 만들어 스냅샷 생성 (내용이 같으면 id도 같음)"""
+        content = {"kr": kr or {}, "us": us or {}, "crypto": crypto or {}, "fx": fx or {}, "gold": gold}
+        digest = hashlib.sha1(json.dumps(content, sort_keys=True, default=str).encode()).hexdigest()
+        return cls(
+            id=digest[:16],
+            taken_at=time.time(),
+            kr=_freeze(kr), us=_freeze(us), crypto=_freeze(crypto), fx=_freeze(fx), gold=gold,
+        )
+
+    # -------------------------------
+    # 행 단위 조회 (market_data / crypto_data 함수와 같은 반환 형태)
+    # -------------------------------
+    def kr_prices(self, tickers, names):
+        return [self.gold if is_gold(t, n) else (self.kr.get(kr_code(t)) or {}).get("price")
+                for t, n in zip(tickers, names)]
+
+    def kr_prev_closes(self, tickers, names):
+        return [None if is_gold(t, n) else (self.kr.get(kr_code(t)) or {}).get("prev_close")
+                for t, n in zip(tickers, names)]
+
+    def us_prices(self, tickers):
+        quotes = [self.us.get(us_symbol(t)) or {} for t in tickers]
+        prices = [q.get("price") for q in quotes]
+        currencies = [q.get("currency") or trading_currency(us_symbol(t)) for q, t in zip(quotes, tickers)]
+        return prices, currencies
+
+    def us_prev_closes(self, tickers):
+        return [(self.us.get(us_symbol(t)) or {}).get("prev_close") for t in tickers]
+
+    def crypto_prices(self, ids):
+        if not ids:
+            return {}
+        return {i: self.crypto[i] for i in ids if i in self.crypto} or None
+
+    # -------------------------------
+    # 환산 (스냅샷 시점 환율 고정)
+    # -------------------------------
+    def rate_series(self, currencies, to="KRW"):
+        return fx.rate_series(currencies, to, rates=dict(self.fx))
+
+    def convert(self, amounts, currencies, to="KRW"):
+        return fx.convert(amounts, currencies, to, rates=dict(self.fx))
@@ -0,0 +1,207 @@
+import csv
+import hashlib
+import os
+import threading
+from abc import ABC, abstractmethod
+
+import gspread
+
+# 시트 저장소 백엔드.
+# 화면·서비스 코드는 gspread Spreadsheet 중 아래 인터페이스만 사용하므로,
+# 같은 메서드를 갖춘 로컬 파일 백엔드로 바꿔 끼우면 Google 인증·네트워크 없이 실행할 수 있음
+# (config.SHEET_BACKEND — "gsheets" 또는 "local").
+
+DRIVE_FILE_URL = "https://www.googleapis.com/drive/v3/files/{id}"
+
+
+class SheetBackend(ABC):
+    """
+    스프레드시트 저장소 공통 인터페이스.
+    id: 캐시 키용 식별자 / title: 표시 이름
+    worksheet(title): 시트 핸들 (get_all_values, append_row, delete_rows) — 없으면 gspread WorksheetNotFound
+    worksheets(): 전체 시트 핸들 목록
+    values_batch_get(ranges): Sheets API batchGet과 같은 형태 {"valueRanges": [{"range", "values"}]}
+    revision(): 내용이 바뀌면 달라지는 리비전 문자열
+    """
+
+    id = None
+    title = ""
+
+    @abstractmethod
+    def worksheet(self, title):
+        ...
+
+    @abstractmethod
+    def worksheets(self):
+        ...
+
+    @abstractmethod
+    def values_batch_get(self, ranges):
+        ...
+
+    @abstractmethod
+    def revision(self):
+        ...
+
+
+# -------------------------------
+# Google Sheets (gspread)
+# -------------------------------
+class GSheetsBackend(SheetBackend):
+    """gspread Spreadsheet 위임. 리비전은 Drive modifiedTime."""
+
+    def __init__(self, spreadsheet):
+        self._spreadsheet = spreadsheet
+        self.id = spreadsheet.id
+        self.title = spreadsheet.title
+
+    def worksheet(self, title):
+        return self._spreadsheet.worksheet(title)
+
+    def worksheets(self):
+        return self._spreadsheet.worksheets()
+
+    def values_batch_get(self, ranges):
+        return self._spreadsheet.values_batch_get(ranges)
+
+    def revision(self):
+        # gspread가 제공하면 그 메서드, 아니면 Drive files.get 직접 호출
+        getter = getattr(self._spreadsheet, "get_lastUpdateTime", None)
+        if getter is not None:
+            return getter()
+        res = self._spreadsheet.client.request(
+            "get", DRIVE_FILE_URL.format(id=self.id),
+            params={"fields": "modifiedTime", "supportsAllDrives": True},
+        )
+        return res.json()["modifiedTime"]
+
+
+# -------------------------------
+# 로컬 파일 (시트 하나당 CSV 또는 XLSX 하나)
+# -------------------------------
+def _pad(rows):
+    width = max((len(r) for r in rows), default=0)
+    return [r + [""] * (width - len(r)) for r in rows]
+
+
+def _cell(value):
+    if value is None:
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+class LocalWorksheet:
+    """
+    파일 하나를 gspread Worksheet처럼 다룸 (값은 모두 문자열, 행 번호는 1부터).
+    XLSX는 openpyxl이 있어야 읽고 쓸 수 있음.
+    """
+
+    def __init__(self, path, lock):
+        self.path = path
+        self.title = os.path.splitext(os.path.basename(path))[0]
+        self._lock = lock
+        self._xlsx = path.lower().endswith(".xlsx")
+
+    def _read(self):
+        if self._xlsx:
+            import openpyxl
+            book = openpyxl.load_workbook(self.path, read_only=True, data_only=True)
+            try:
+                rows = [[_cell(v) for v in row] for row in book.active.iter_rows(values_only=True)]
+            finally:
+                book.close()
+        else:
+            with open(self.path, newline="", encoding="utf-8-sig") as f:
+                rows = list(csv.reader(f))
+        # get_all_values처럼 끝의 빈 행은 버림
+        while rows and not any(rows[-1]):
+            rows.pop()
+        return _pad(rows)
+
+    def _write(self, rows):
+        tmp = f"{self.path}.tmp"
+        if self._xlsx:
+            import openpyxl
+            book = openpyxl.Workbook()
+            for row in rows:
+                book.active.append(row)
+            book.save(tmp)
+        else:
+            with open(tmp, "w", newline="", encoding="utf-8-sig") as f:
+                csv.writer(f).writerows(rows)
+        os.replace(tmp, self.path)
+
+    def get_all_values(self):
+        with self._lock:
+            return self._read()
+
+    def append_row(self, values):
+        with self._lock:
+            rows = self._read()
+            rows.append([_cell(v) for v in values])
+            self._write(rows)
+
+    def delete_rows(self, start_index, end_index=None):
+        """start_index~end_index 행 삭제 (1부터, 양 끝 포함 — gspread와 같음)"""
+        end_index = end_index or start_index
+        with self._lock:
+            rows = self._read()
+            del rows[start_index - 1:end_index]
+            self._write(rows)
+
+
+class LocalSheetsBackend(SheetBackend):
+    """
+    디렉터리의 {시트 이름}.csv / {시트 이름}.xlsx 파일을 스프레드시트처럼 사용.
+    리비전은 파일 목록과 수정 시각으로 계산하므로 파일을 직접 고쳐도 다음 확인 때 반영됨.
+    """
+
+    EXTENSIONS = (".csv", ".xlsx")
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.id = os.path.abspath(directory)
+        self.title = os.path.basename(self.id)
+        self._lock = threading.Lock()
+
+    def _files(self):
+        if not os.path.isdir(self.directory):
+            return {}
+        files = {}
+        for name in sorted(os.listdir(self.directory)):
+            stem, ext = os.path.splitext(name)
+            if ext.lower() in self.EXTENSIONS and stem not in files:
+                files[stem] = os.path.join(self.directory, name)
+        return files
+
+    def worksheet(self, title):
+        path = self._files().get(title)
+        if path is None:
+            raise gspread.exceptions.WorksheetNotFound(title)
+        return LocalWorksheet(path, self._lock)
+
+    def worksheets(self):
+        return [LocalWorksheet(path, self._lock) for path in self._files().values()]
+
+    def add_worksheet(self, title, fmt="csv"):
+        """빈 시트 파일 생성 (이미 있으면 기존 시트)"""
+        if title not in self._files():
+            os.makedirs(self.directory, exist_ok=True)
+            open(os.path.join(self.directory, f"{title}.{fmt}"), "w").close()
+        return self.worksheet(title)
+
+    def values_batch_get(self, ranges):
+        """시트 전체 범위("'시트명'" 또는 "시트명")만 지원. 없는 시트가 있으면 WorksheetNotFound"""
+        value_ranges = []
+        for a1 in ranges:
+            title = a1.split("!")[0]
+            if title.startswith("'") and title.endswith("'"):
+                title = title[1:-1].replace("''", "'")
+            value_ranges.append({"range": a1, "values": self.worksheet(title).get_all_values()})
+        return {"valueRanges": value_ranges}
+
+    def revision(self):
+        stamps = [f"{stem}:{os.stat(path).st_mtime_ns}" for stem, path in self._files().items()]
+        return "local-" + hashlib.sha1("|".join(stamps).encode()).hexdigest()[:16]
@@ -0,0 +1,145 @@
+"""
+임의 포트폴리오 시트 생성기 — 로컬 시트 백엔드(config.SHEET_BACKEND="local")용 CSV 파일을 만듦.
+
+    python -m service.synthetic_portfolio --dir data/sheets --rows 2000 --owners 4 --seed 1
+
+대시보드는 FINANCE_SHEET_BACKEND=local FINANCE_PRICE_PROVIDER=fake 로 실행하면 인증·네트워크 없이 동작.
+SHEET_NAMES의 시트마다 {시트 이름}.csv 하나를 쓰며, 이미 있는 파일은 --force 없이는 덮어쓰지 않음.
+'자산추이'는 헤더 없이 빈 파일로 만들어 첫 입력 때 현재 스냅샷 컬럼으로 채워지게 함.
+"""
+import argparse
+import csv
+import os
+import random
+
+from config import SHEET_NAMES
+
+BROKERS = ["키움증권", "미래에셋증권", "삼성증권", "한국투자증권", "NH투자증권"]
+ACCOUNTS = ["일반", "ISA", "연금저축", "IRP"]
+KINDS = ["성장", "배당", "채권", "원자재"]
+KR_NAMES = ["삼성전자", "SK하이닉스", "NAVER", "카카오", "현대차", "LG에너지솔루션", "셀트리온", "KB금융"]
+US_TICKERS = ["AAPL", "MSFT", "NVDA", "GOOGL", "AMZN", "META", "TSLA", "SCHD", "VOO", "QQQ", "TLT", "JEPI"]
+COINS = [("비트코인", "BTC", "bitcoin"), ("이더리움", "ETH", "ethereum"),
+         ("솔라나", "SOL", "solana"), ("리플", "XRP", "ripple")]
+
+
+class PortfolioGenerator:
+    """시트별 행 생성 (값은 시트에 입력된 그대로의 표시 문자열 — 천 단위 쉼표 포함)"""
+
+    def __init__(self, rows=200, owners=2, seed=None):
+        self.rows = rows
+        self.owners = [f"소유자{i + 1}" for i in range(owners)]
+        self._rng = random.Random(seed)
+
+    def _pick(self, items):
+        return self._rng.choice(items)
+
+    def _amount(self, low, high, digits=0):
+        value = round(self._rng.uniform(low, high), digits)
+        return f"{value:,.{digits}f}"
+
+    def _kr_code(self, i):
+        # 실제 코드가 아니어도 대역 시세 서버가 임의 가격으로 응답함
+        return f"{(i * 7919) % 999999:06d}"
+
+    def domestic(self):
+        header = ["증권사", "소유", "종목명", "종목코드", "계좌구분", "성격", "보유수량", "매수단가"]
+        body = [[self._pick(BROKERS), self._pick(self.owners), f"{self._pick(KR_NAMES)} {i}", self._kr_code(i),
+                 self._pick(ACCOUNTS), self._pick(KINDS), str(self._rng.randint(1, 500)),
+                 self._amount(1_000, 500_000)]
+                for i in range(self.rows)]
+        return [header] + body
+
+    def overseas(self):
+        header = ["증권사", "소유", "화폐", "종목티커", "계좌구분", "성격", "보유수량", "매수단가", "매입환율"]
+        body = [[self._pick(BROKERS), self._pick(self.owners), "USD", self._pick(US_TICKERS),
+                 self._pick(ACCOUNTS), self._pick(KINDS), str(self._rng.randint(1, 200)),
+                 self._amount(10, 900, 2), self._amount(1_100, 1_450, 1)]
+                for _ in range(self.rows)]
+        return [header] + body
+
+    def crypto(self):
+        header = ["증권사", "소유", "코인", "심볼", "coingecko_id", "통화", "수량(qty)", "평균매수가(avg_price)"]
+        body = []
+        for _ in range(max(self.rows // 10, 1)):
+            name, symbol, cg_id = self._pick(COINS)
+            currency = self._pick(["KRW", "USD"])
+            avg = self._amount(1, 100_000, 2) if currency == "USD" else self._amount(1_000, 100_000_000)
+            body.append([self._pick(["업비트", "바이낸스"]), self._pick(self.owners), name, symbol, cg_id,
+                         currency, f"{self._rng.uniform(0.01, 10):.4f}", avg])
+        return [header] + body
+
+    def cash(self):
+        header = ["증권사", "소유", "계좌구분", "통화", "성격", "금액"]
+        body = []
+        for _ in range(max(self.rows // 10, 1)):
+            currency = self._pick(["KRW", "USD"])
+            amount = self._amount(100_000, 50_000_000) if currency == "KRW" else self._amount(100, 50_000, 2)
+            body.append([self._pick(BROKERS), self._pick(self.owners), self._pick(ACCOUNTS), currency,
+                         self._pick(["예수금", "예금", "MMF"]), amount])
+        return [header] + body
+
+    def property(self):
+        header = ["소유", "구분", "매입가", "현재 시세"]
+        return [header] + [[owner, "아파트", self._amount(3e8, 1e9), self._amount(3e8, 1.5e9)]
+                           for owner in self.owners]
+
+    def etc(self):
+        header = ["증권사", "소유", "종목명", "계좌구분", "성격", "매입가", "현재 시세"]
+        return [header] + [[self._pick(BROKERS), owner, "금현물", "일반", "원자재",
+                            self._amount(1e6, 1e7), self._amount(1e6, 1.2e7)]
+                           for owner in self.owners]
+
+    def debt(self):
+        header = ["소유", "구분", "현재부채"]
+        return [header] + [[owner, "주택담보대출", self._amount(1e7, 3e8)] for owner in self.owners]
+
+    def trend(self):
+        return []
+
+    def domestic_div(self):
+        header = ["증권사", "소유", "종목명", "종목코드", "배당금(원)", "배당일", "배당수익률(%)"]
+        body = [[self._pick(BROKERS), self._pick(self.owners), self._pick(KR_NAMES), self._kr_code(i),
+                 self._amount(1_000, 500_000), f"2026-{self._rng.randint(1, 12):02d}-15",
+                 f"{self._rng.uniform(0.5, 7):.2f}%"]
+                for i in range(max(self.rows // 10, 1))]
+        return [header] + body
+
+    def overseas_div(self):
+        header = ["증권사", "소유", "종목티커", "배당금(USD)", "배당일", "배당수익률(%)"]
+        body = [[self._pick(BROKERS), self._pick(self.owners), self._pick(US_TICKERS),
+                 self._amount(1, 500, 2), f"2026-{self._rng.randint(1, 12):02d}-15",
+                 f"{self._rng.uniform(0.5, 7):.2f}%"]
+                for _ in range(max(self.rows // 10, 1))]
+        return [header] + body
+
+
+def write_sheets(directory, generator, force=False):
+    """SHEET_NAMES 시트마다 CSV 작성. 반환: 새로 쓴 시트 이름 목록"""
+    os.makedirs(directory, exist_ok=True)
+    written = []
+    for key, name in SHEET_NAMES.items():
+        path = os.path.join(directory, f"{name}.csv")
+        if os.path.exists(path) and not force:
+            continue
+        with open(path, "w", newline="", encoding="utf-8-sig") as f:
+            csv.writer(f).writerows(getattr(generator, key)())
+        written.append(name)
+    return written
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로컬 시트 백엔드용 임의 포트폴리오 생성")
+    parser.add_argument("--dir", default="data/sheets", help="시트 파일 디렉터리 (FINANCE_SHEET_DIR)")
+    parser.add_argument("--rows", type=int, default=200, help="국내·해외 종목 행 수 (나머지 시트는 비례)")
+    parser.add_argument("--owners", type=int, default=2)
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--force", action="store_true", help="이미 있는 시트 파일도 덮어쓰기")
+    args = parser.parse_args()
+
+    written = write_sheets(args.dir, PortfolioGenerator(args.rows, args.owners, args.seed), args.force)
+    print(f"{len(written)} sheets written to {args.dir}: {', '.join(written) or '-'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+import logging
+import threading
+import time
+
+import streamlit as st
+
+from config import SHEET_NAMES
+from service.sheets import load_sheet_data
+from service.market_gateway import collect_instruments, prefetch_prices
+
+logger = logging.getLogger(__name__)
+
+
+class CacheWarmup:
+    """
+    서버 프로세스 시작 시 한 번 캐시를 채우는 스레드.
+    SHEET_NAMES의 모든 시트를 읽고, 보유 종목을 모아 시세·환율 캐시를 미리 조회함.
+    첫 세션은 기다리지 않고 바로 렌더하며, 진행 상태는 ready / step으로 화면에 표시.
+    """
+
+    def __init__(self, spreadsheet):
+        self._spreadsheet = spreadsheet
+        self._done = threading.Event()
+        self.step = "대기"
+        self.error = None
+        self.started_at = None
+        self.finished_at = None
+        self.failed_sheets = []
+        self.providers = {}
+        self._thread = threading.Thread(target=self._run, daemon=True, name="cache-warmup")
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    @property
+    def ready(self):
+        return self._done.is_set()
+
+    def wait(self, timeout=None):
+        return self._done.wait(timeout)
+
+    @property
+    def failures(self):
+        """예열하지 못한 시트·시세 제공자 이름 (끝나기 전이면 지금까지 실패한 것만)"""
+        failed = list(self.failed_sheets) + [n for n, ok in self.providers.items() if not ok]
+        if self.error is not None and not failed:
+            failed.append(type(self.error).__name__)
+        return failed
+
+    def _load_sheets(self):
+        # 첫 시트가 전체 시트 일괄 조회를 한 번 하고, 나머지는 그 결과에서 시트별 캐시만 채움
+        names = list(SHEET_NAMES.values())
+        for i, name in enumerate(names, 1):
+            self.step = f"시트 {i}/{len(names)}"
+            try:
+                load_sheet_data(self._spreadsheet, name)
+            except Exception:
+                self.failed_sheets.append(name)
+
+    def _run(self):
+        self.started_at = time.time()
+        try:
+            self._load_sheets()
+            self.step = "보유 종목"
+            inst = collect_instruments(self._spreadsheet)
+            self.step = "시세·환율"
+            self.providers = prefetch_prices(inst)
+        except Exception as e:
+            logger.exception("캐시 예열 실패")
+            self.error = e
+        finally:
+            self.finished_at = time.time()
+            self.step = "완료"
+            self._done.set()
+            logger.info("캐시 예열 완료 (%.1f초, 실패 시트: %s)",
+                        self.finished_at - self.started_at, self.failed_sheets or "없음")
+
+
+@st.cache_resource(show_spinner=False)
+def start_warmup(_spreadsheet):
+    """서버 프로세스당 한 번만 예열을 시작 (이미 끝났으면 그 결과를 그대로 반환)"""
+    return CacheWarmup(_spreadsheet).start()
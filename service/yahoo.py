@@ -0,0 +1,69 @@
+import pandas as pd
+import yfinance as yf
+
+
+# -------------------------------
+# Yahoo Finance 시세 조회
+# -------------------------------
+def quotes(symbols, period="5d"):
+    """
+    yf.download 한 번으로 여러 심볼의 마지막 종가·전일 종가·기준 시각 조회.
+    반환: {심볼: {"price": 종가, "prev_close": 전일 종가, "time": 마지막 봉 epoch 초} | None}
+    """
+    symbols = list(symbols)
+    data = yf.download(symbols, period=period, auto_adjust=True, progress=False, threads=True)
+    close = data["Close"]
+    if isinstance(close, pd.Series):  # 구버전 yfinance: 단일 심볼이면 Series 반환
+        close = close.to_frame(symbols[0])
+
+    result = {}
+    for sym in symbols:
+        series = close[sym].dropna() if sym in close.columns else pd.Series(dtype=float)
+        if series.empty:
+            result[sym] = None
+            continue
+        result[sym] = {
+            "price": float(series.iloc[-1]),
+            "prev_close": float(series.iloc[-2]) if len(series) > 1 else None,
+            "time": pd.Timestamp(series.index[-1]).timestamp(),
+        }
+    return result
+
+
+def last_closes(symbols, period="5d"):
+    """여러 심볼의 마지막 종가만. 반환: {심볼: 종가}"""
+    return {s: q["price"] if q else None for s, q in quotes(symbols, period).items()}
+
+
+# -------------------------------
+# 일별 OHLCV 이력
+# -------------------------------
+OHLCV = ["Open", "High", "Low", "Close", "Volume"]
+
+
+def download_history(symbols, start):
+    """
+    yf.download 한 번으로 여러 심볼의 start 이후 일별 OHLCV 조회.
+    반환: {심볼: DataFrame(index=날짜, columns=OHLCV)} — 데이터가 없는 심볼은 제외
+    """
+    symbols = list(symbols)
+    data = yf.download(symbols, start=start, interval="1d", auto_adjust=True,
+                       progress=False, threads=True, group_by="ticker")
+    if data is None or data.empty:
+        return {}
+
+    result = {}
+    for sym in symbols:
+        if isinstance(data.columns, pd.MultiIndex):
+            if sym not in data.columns.get_level_values(0):
+                continue
+            frame = data[sym]
+        else:  # 구버전 yfinance: 단일 심볼이면 단일 컬럼 레벨
+            frame = data
+        frame = frame.reindex(columns=OHLCV).dropna(subset=["Close"])
+        if frame.empty:
+            continue
+        frame.index = pd.to_datetime(frame.index).tz_localize(None).normalize()
+        frame.index.name = "Date"
+        result[sym] = frame.astype(float)
+    return result
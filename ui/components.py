@@ -1,4 +1,6 @@
+import pandas as pd
 import streamlit as st
+from service.overrides import NAMESPACE_LABELS, get_overrides, set_overrides
 
 
 def exchange_rate_header(title: str, usdkrw, nav_label: str = None, nav_section: str = None, nav_page: str = None):
@@ -37,3 +39,48 @@ def summary_bar(items: list):
         f"<div style='display:flex;gap:40px;font-size:1.1em;font-weight:bold;'>{parts}</div>",
         unsafe_allow_html=True
     )
+
+
+def price_override_editor():
+    """
+    수동 시세 편집기 (사이드바용).
+    저장해도 시세 캐시·제공자 조회와 무관하게 다음 렌더부터 조회 결과 위에 덮어써서 적용됨.
+    """
+    ns_of = {label: ns for ns, label in NAMESPACE_LABELS.items()}
+    rows = [
+        {"구분": NAMESPACE_LABELS[ns], "코드": name, "가격": price}
+        for ns, values in get_overrides().items() if ns in NAMESPACE_LABELS
+        for name, price in values.items()
+    ]
+    edited = st.data_editor(
+        pd.DataFrame(rows, columns=["구분", "코드", "가격"]),
+        num_rows="dynamic",
+        hide_index=True,
+        key="price_override_editor",
+        column_config={
+            "구분": st.column_config.SelectboxColumn(options=list(ns_of), required=True),
+            "코드": st.column_config.TextColumn(
+                help="국내: 6자리 종목코드 (금현물은 GOLD, 원/g) · 해외: 티커 · 가상자산: coingecko id"
+            ),
+            "가격": st.column_config.NumberColumn(
+                min_value=0, format="%.2f", help="국내·가상자산은 원, 해외는 종목 거래 통화"
+            ),
+        },
+    )
+    if st.button("💾 수동 시세 저장", key="price_override_save"):
+        updated = {}
+        for _, r in edited.dropna(subset=["구분", "코드", "가격"]).iterrows():
+            updated.setdefault(ns_of[r["구분"]], {})[r["코드"]] = r["가격"]
+        set_overrides(updated)
+        st.rerun()
+
+
+@st.fragment(run_every=2)
+def warmup_status(warmup):
+    """
+    서버 시작 예열 진행 표시 — 이 부분만 주기적으로 갱신하다가 끝나면 전체 화면을 한 번 다시 그림
+    (예열 전에 빈 캐시로 그린 화면을 채워진 캐시로 교체).
+    """
+    if warmup.ready:
+        st.rerun()
+    st.info(f"⏳ 시트·시세 캐시 준비 중 ({warmup.step}) — 준비가 끝나면 자동으로 새로고침됩니다.")